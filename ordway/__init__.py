@@ -1,2 +1,4 @@
 from .client import OrdwayClient
+from .async_client import AsyncOrdwayClient
 from .exceptions import OrdwayClientException
+from .pool import OrdwayClientPool
@@ -20,3 +20,25 @@ from .endpoints import (
     RevenueRules,
     ChartOfAccounts,
 )
+from .async_endpoints import (
+    AsyncProducts,
+    AsyncInvoices,
+    AsyncCustomers,
+    AsyncSubscriptions,
+    AsyncPayments,
+    AsyncCredits,
+    AsyncRefunds,
+    AsyncPlans,
+    AsyncWebhooks,
+    AsyncJournalEntries,
+    AsyncPaymentRuns,
+    AsyncStatements,
+    AsyncCoupons,
+    AsyncOrders,
+    AsyncUsages,
+    AsyncBillingRuns,
+    AsyncBillingSchedules,
+    AsyncRevenueSchedules,
+    AsyncRevenueRules,
+    AsyncChartOfAccounts,
+)
@@ -0,0 +1,369 @@
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    List,
+    Dict,
+    Any,
+    AsyncGenerator,
+)
+from logging import getLogger
+from json import loads as json_loads
+from time import perf_counter
+import asyncio
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import RequestHistory
+from ordway.metrics import collection_from_url, request_size
+from ordway.utils import transform_datetimes
+
+from .base import (
+    _EndpointBase,
+    _Response,
+    _build_list_params,
+    _unwrap_list_response,
+    _unwrap_get_response,
+)
+from .exceptions import OrdwayAPIRequestException
+
+if TYPE_CHECKING:
+    from ordway.async_client import AsyncOrdwayClient  # pylint: disable=cyclic-import
+
+logger = getLogger(__name__)
+
+
+def _errors_from_body(body: bytes) -> Optional[Dict[str, Any]]:
+    """ Attempts to grab the `errors` object from an Ordway response body. """
+
+    try:
+        response_json = json_loads(body)
+    except ValueError:
+        return None
+
+    if isinstance(response_json, dict):
+        return response_json.get("errors")
+
+    return None
+
+
+def _error_response(url: str, status: int, headers: Any, body: bytes) -> Response:
+    """ A `requests.Response` of an error, attached to exceptions as the sync client does. """
+
+    response = Response()
+    response.url = url
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = body  # pylint: disable=protected-access
+
+    return response
+
+
+class AsyncAPIBase(_EndpointBase):
+    """ Base for asyncio interfaces. Mirrors `ordway.api.base.APIBase`. """
+
+    def __init__(self, client: "AsyncOrdwayClient", staging: bool = False):
+        self.client = client
+        self.staging = staging
+
+    async def _request(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> _Response:
+        # Imported here so aiohttp is only required when the asyncio client is used.
+        from aiohttp import ClientError, ClientConnectorError
+
+        codec = self.client.codec
+        body = None if json is None else codec.dumps(json)
+        url = self._url(endpoint)
+
+        logger.debug(
+            'Sending a request to Ordway endpoint "%s" with the following query params: %s',
+            endpoint,
+            params,
+        )
+
+        headers = self._construct_headers()
+        retry = self.client.retry_strategy
+        rate_limiter = self.client.rate_limiter
+        metrics = self.client.metrics
+        collection = collection_from_url(url)
+
+        # Mirrors how urllib3's `Retry` is driven by `ordway.session.TimeoutAdapter`,
+        # so both clients back off and give up at the same points.
+        while True:
+            if rate_limiter is not None:
+                delay = rate_limiter.reserve()
+
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            started = perf_counter() if metrics.enabled else 0.0
+
+            try:
+                async with self.client.session.request(
+                    method,
+                    url,
+                    params=params,
+                    data=transform_datetimes(data) if body is None else body,
+                    headers=headers,
+                    proxy=self.client.proxy_for(url),
+                ) as response:
+                    status = response.status
+                    response_headers = response.headers
+                    retry_after = response.headers.get("Retry-After")
+                    response_body = await response.read()
+
+                    if rate_limiter is not None:
+                        rate_limiter.update(status, response.headers)
+            except (ClientError, asyncio.TimeoutError) as err:
+                if metrics.enabled:
+                    metrics.observe_request(
+                        collection,
+                        method,
+                        None,
+                        perf_counter() - started,
+                        request_size(body),
+                        0,
+                    )
+
+                is_connect_error = isinstance(err, ClientConnectorError)
+
+                if (
+                    not is_connect_error
+                    and method.upper() not in retry.method_whitelist
+                ):
+                    raise OrdwayAPIRequestException(str(err)) from err
+
+                retry = retry.new(
+                    total=retry.total - 1,
+                    history=retry.history
+                    + (RequestHistory(method, url, err, None, None),),
+                )
+
+                if retry.is_exhausted():
+                    raise OrdwayAPIRequestException(
+                        f"Max retries exceeded with url: {url} (Caused by {err!r})"
+                    ) from err
+
+                backoff = retry.get_backoff_time()
+
+                if metrics.enabled:
+                    metrics.observe_retry(
+                        collection, method, type(err).__name__, backoff
+                    )
+
+                await asyncio.sleep(backoff)
+
+                continue
+
+            if metrics.enabled:
+                metrics.observe_request(
+                    collection,
+                    method,
+                    status,
+                    perf_counter() - started,
+                    request_size(body),
+                    len(response_body),
+                )
+
+            if retry.is_retry(method, status, retry_after is not None):
+                retry = retry.new(
+                    total=retry.total - 1,
+                    history=retry.history
+                    + (RequestHistory(method, url, None, status, None),),
+                )
+
+                if not retry.is_exhausted():
+                    if retry_after is not None and retry.respect_retry_after_header:
+                        backoff = retry.parse_retry_after(retry_after)
+                    else:
+                        backoff = retry.get_backoff_time()
+
+                    if metrics.enabled:
+                        metrics.observe_retry(collection, method, str(status), backoff)
+
+                    await asyncio.sleep(backoff)
+
+                    continue
+
+            if status >= 400:
+                raise OrdwayAPIRequestException(
+                    f"{status} Error for url: {url}",
+                    errors=_errors_from_body(response_body),
+                    response=_error_response(
+                        url, status, response_headers, response_body
+                    ),
+                )
+
+            try:
+                return codec.loads(response_body)
+            except ValueError as err:
+                raise OrdwayAPIRequestException(
+                    "Ordway returned HTTP success, but no valid JSON was present. Please report this as an issue on GitHub."
+                ) from err
+
+    async def _get_request(
+        self, endpoint: str, params: Optional[Dict[str, str]] = None
+    ) -> _Response:
+        return await self._request("GET", endpoint, params=params)
+
+    async def _post_request(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, str]] = None,
+    ) -> _Response:
+        if json is None and data is None:
+            raise ValueError("Either `json` or `data` must be passed to post_request.")
+
+        return await self._request(
+            "POST", endpoint, json=json, data=data, params=params
+        )
+
+    async def _put_request(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, str]] = None,
+    ) -> _Response:
+        return await self._request("PUT", endpoint, json=json, data=data, params=params)
+
+
+class AsyncListAPIMixin(AsyncAPIBase):
+    """ Mixin for retrieving a collection of Ordway resources. """
+
+    MAX_PAGE_SIZE = 50
+    MAX_PAGES = 1000
+
+    async def _list_page(  # pylint: disable=too-many-arguments
+        self,
+        page: int,
+        size: int,
+        sort: str,
+        filters: Optional[Dict[str, Any]],
+        ascending: bool,
+    ) -> List[Dict[str, Any]]:
+        params = _build_list_params(
+            self.collection,
+            self.MAX_PAGE_SIZE,
+            page=page,
+            size=size,
+            sort=sort,
+            filters=filters,
+            ascending=ascending,
+        )
+
+        response_json = await self._get_request(self.collection, params=params)
+
+        return _unwrap_list_response(self.collection, response_json)
+
+    async def list(  # pylint: disable=too-many-arguments
+        self,
+        page: int,
+        size: int = 20,
+        sort: str = "",
+        filters: Optional[Dict[str, Any]] = None,
+        ascending: bool = False,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """ Retrieve a single page of resource from a collection """
+
+        for result in await self._list_page(page, size, sort, filters, ascending):
+            yield result
+
+    async def all(  # pylint: disable=too-many-arguments
+        self,
+        size: int = 20,
+        sort: str = "",
+        filters: Optional[Dict[str, Any]] = None,
+        ascending: bool = False,
+        ignore_max_pages: bool = False,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """ Retrieve all resources from a collection """
+
+        page = 1
+
+        try:
+            while True:
+                if not ignore_max_pages and page >= self.MAX_PAGES:
+                    logger.warning(
+                        "Call to `.all()` has reached the maximum number of pages (%s). If this is desirable, please call with `ignore_max_pages` set to True.",
+                        self.MAX_PAGES,
+                    )
+
+                    break
+
+                results = await self._list_page(page, size, sort, filters, ascending)
+
+                if len(results) == 0:
+                    break
+
+                for result in results:
+                    yield result
+
+                page += 1
+        finally:
+            if self.client.metrics.enabled:
+                self.client.metrics.observe_pages(self.collection, page - 1)
+
+
+class AsyncGetAPIMixin(AsyncAPIBase):
+    """ Mixin for retrieving a single Ordway resource. """
+
+    async def get(self, id: str) -> Dict[str, Any]:
+        """ Retrieve a particular resource """
+
+        return _unwrap_get_response(await self._get_request(f"{self.collection}/{id}"))
+
+
+class AsyncCreateAPIMixin(AsyncAPIBase):
+    """ Mixin for creating a single Ordway resource. """
+
+    async def create(
+        self, data: Optional[Dict[str, Any]], params: Optional[Dict[str, str]] = None
+    ) -> _Response:
+        """ Create a new resource """
+
+        return await self._post_request(
+            self.collection, json=data, data=None, params=params
+        )
+
+
+class AsyncUpdateAPIMixin(AsyncAPIBase):
+    """ Mixin for updating a single Ordway resource. """
+
+    async def update(
+        self,
+        id: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, str]] = None,
+    ) -> _Response:
+        """ Update a resource identified by `id`. """
+
+        return await self._put_request(
+            f"{self.collection}/{id}", json=data, data=None, params=params
+        )
+
+
+class AsyncDeleteAPIMixin(AsyncAPIBase):
+    """ Mixin for deleting a single Ordway resource. """
+
+    async def delete(self, id: str) -> _Response:
+        """ Delete a resource identified by `id`. """
+
+        return await self._request("DELETE", f"{self.collection}/{id}")
+
+
+__all__ = [
+    "AsyncAPIBase",
+    "AsyncListAPIMixin",
+    "AsyncGetAPIMixin",
+    "AsyncCreateAPIMixin",
+    "AsyncUpdateAPIMixin",
+    "AsyncDeleteAPIMixin",
+]
@@ -0,0 +1,330 @@
+from typing import Dict, Optional, Any
+from .async_base import (
+    AsyncListAPIMixin,
+    AsyncGetAPIMixin,
+    AsyncCreateAPIMixin,
+    AsyncDeleteAPIMixin,
+    AsyncUpdateAPIMixin,
+)
+
+
+class AsyncProducts(
+    AsyncListAPIMixin,
+    AsyncGetAPIMixin,
+    AsyncCreateAPIMixin,
+    AsyncDeleteAPIMixin,
+    AsyncUpdateAPIMixin,
+):
+    """Asyncio interface for interacting with Ordway Products
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/products/list-products
+    """
+
+    collection = "products"
+
+
+class AsyncJournalEntries(AsyncCreateAPIMixin):
+    """Asyncio interface for interacting with Ordway Journal Entries
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/journal-entries
+    """
+
+    collection = "journal_entries"
+
+
+class AsyncInvoices(AsyncListAPIMixin, AsyncGetAPIMixin):
+    """Asyncio interface for interacting with Ordway Invoices
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/invoices
+    """
+
+    collection = "invoices"
+
+    async def reverse(self, id: str, reversed_on: str):
+        """ Reverse an invoice """
+
+        return await self._put_request(
+            f"{self.collection}/{id}/reverse", json={"reversed_on": reversed_on}
+        )
+
+    async def refund(self, id: str, data: Dict[str, Any]):
+        """ Refund a negative invoice """
+
+        return await self._put_request(f"{self.collection}/{id}/refund", json=data)
+
+
+class AsyncCustomers(
+    AsyncListAPIMixin,
+    AsyncGetAPIMixin,
+    AsyncCreateAPIMixin,
+    AsyncDeleteAPIMixin,
+    AsyncUpdateAPIMixin,
+):
+    """Asyncio interface for interacting with Ordway Customers
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/customers
+    """
+
+    collection = "customers"
+
+
+class AsyncPayments(AsyncListAPIMixin, AsyncGetAPIMixin, AsyncCreateAPIMixin):
+    """Asyncio interface for interacting with Ordway Payments
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/payments
+    """
+
+    collection = "payments"
+
+    async def reverse(self, id: str, reversed_on: str):
+        """ Reverse a payment """
+
+        return await self._put_request(
+            f"{self.collection}/{id}/reverse", json={"reversed_on": reversed_on}
+        )
+
+    async def refund(self, id: str, data: Dict[str, Any]):
+        """ Refund a payment """
+
+        return await self._put_request(f"{self.collection}/{id}/refund", json=data)
+
+
+class AsyncPaymentRuns(AsyncListAPIMixin, AsyncGetAPIMixin, AsyncCreateAPIMixin):
+    """Asyncio interface for interacting with Ordway Payment Runs
+
+    Payment Runs are operations that automatically generate payments during a set interval.
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/payment-runs
+    """
+
+    collection = "payment_runs"
+
+    async def reverse(self, id: str):
+        """ Reverse a payment run """
+
+        return await self._put_request(f"{self.collection}/{id}/reverse", json={})
+
+
+class AsyncCredits(AsyncListAPIMixin, AsyncGetAPIMixin, AsyncCreateAPIMixin):
+    """Asyncio interface for interacting with Ordway Credits
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/credits
+    """
+
+    collection = "credits"
+
+    async def reverse(self, id: str, reversed_on: str):
+        """ Reverse a credit """
+
+        return await self._put_request(
+            f"{self.collection}/{id}/reverse", json={"reversed_on": reversed_on}
+        )
+
+    async def refund(self, id: str, data: Dict[str, Any]):
+        """ Refund a credit """
+
+        return await self._put_request(f"{self.collection}/{id}/refund", json=data)
+
+
+class AsyncRefunds(AsyncListAPIMixin, AsyncGetAPIMixin):
+    """Asyncio interface for interacting with Ordway Refunds
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/refunds
+    """
+
+    collection = "refunds"
+
+
+class AsyncStatements(AsyncListAPIMixin, AsyncGetAPIMixin):
+    """Asyncio interface for interacting with Ordway Statements
+
+    Statements allow you to send customers information about their account.
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/statements
+    """
+
+    collection = "statements"
+
+
+class AsyncPlans(
+    AsyncListAPIMixin,
+    AsyncGetAPIMixin,
+    AsyncCreateAPIMixin,
+    AsyncDeleteAPIMixin,
+    AsyncUpdateAPIMixin,
+):
+    """Asyncio interface for interacting with Ordway Plans
+
+    Plans are collection of charges grouped together.
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/plans
+    """
+
+    collection = "plans"
+
+
+class AsyncCoupons(
+    AsyncListAPIMixin, AsyncGetAPIMixin, AsyncCreateAPIMixin, AsyncUpdateAPIMixin
+):
+    """Asyncio interface for interacting with Ordway Coupons
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/coupons
+    """
+
+    collection = "coupons"
+
+
+class AsyncSubscriptions(
+    AsyncListAPIMixin,
+    AsyncGetAPIMixin,
+    AsyncCreateAPIMixin,
+    AsyncDeleteAPIMixin,
+    AsyncUpdateAPIMixin,
+):
+    """Asyncio interface for interacting with Ordway Subscriptions
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/subscriptions
+    """
+
+    collection = "subscriptions"
+
+    async def activate(self, id: str, data: Dict[str, Any]):
+        """ Activate a subscription """
+
+        return await self._put_request(f"{self.collection}/{id}/activate", json=data)
+
+    async def cancel(self, id: str, data: Dict[str, Any]):
+        """ Cancel a subscription """
+
+        return await self._put_request(f"{self.collection}/{id}/cancel", json=data)
+
+    async def renew(
+        self, id: str, data: Dict[str, Any], callback_url: Optional[str] = None
+    ):
+        """ Renew a subscription """
+
+        params = {"callback_url": callback_url} if callback_url is not None else None
+
+        return await self._put_request(
+            f"{self.collection}/{id}/cancel", json=data, params=params
+        )
+
+    async def change(
+        self, id: str, data: Dict[str, Any], callback_url: Optional[str] = None
+    ):
+        """ Change an active subscription """
+
+        params = {"callback_url": callback_url} if callback_url is not None else None
+
+        return await self._put_request(
+            f"{self.collection}/{id}/change", json=data, params=params
+        )
+
+
+class AsyncOrders(
+    AsyncListAPIMixin, AsyncGetAPIMixin, AsyncCreateAPIMixin, AsyncUpdateAPIMixin
+):
+    """Asyncio interface for interacting with Ordway Orders
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/orders
+    """
+
+    collection = "orders"
+
+    async def cancel(self, id: str, data: Optional[Dict[str, Any]] = None):
+        """ Cancel an order """
+
+        return await self._put_request(f"{self.collection}/{id}/cancel", json=data)
+
+
+class AsyncUsages(
+    AsyncListAPIMixin, AsyncGetAPIMixin, AsyncCreateAPIMixin, AsyncDeleteAPIMixin
+):
+    """Asyncio interface for interacting with Ordway Usages
+
+    Usage is the amount of units a customer uses and is always billed in arrears.
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/usages
+    """
+
+    collection = "usages"
+
+
+class AsyncWebhooks(
+    AsyncListAPIMixin,
+    AsyncGetAPIMixin,
+    AsyncCreateAPIMixin,
+    AsyncDeleteAPIMixin,
+    AsyncUpdateAPIMixin,
+):
+    """Asyncio interface for interacting with Ordway Webhooks
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/webhooks
+    """
+
+    collection = "webhooks"
+
+
+class AsyncBillingRuns(
+    AsyncListAPIMixin, AsyncGetAPIMixin, AsyncCreateAPIMixin, AsyncDeleteAPIMixin
+):
+    """Asyncio interface for interacting with Ordway Billing Runs
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/billing-runs
+    """
+
+    collection = "billing_runs"
+
+
+class AsyncRevenueSchedules(AsyncListAPIMixin, AsyncGetAPIMixin):
+    """Asyncio interface for interacting with Ordway Revenue Schedules
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/revenue-schedules
+    """
+
+    MAX_PAGE_SIZE = 500
+
+    collection = "revenue_schedules"
+
+
+class AsyncBillingSchedules(AsyncListAPIMixin, AsyncGetAPIMixin, AsyncUpdateAPIMixin):
+    """Asyncio interface for interacting with Ordway Billing Schedules
+
+    Billing Schedules show how customers will be billed/invoiced over the
+    course of time for a specific subscription contract.
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/billing-schedules
+    """
+
+    collection = "billing_schedules"
+
+    async def manage_prepayment_lines(self, id: str, data: Dict[str, Any]):
+        """ Manage prepaid credits, allowing addition or refund of prepaid credits """
+
+        return await self._put_request(
+            f"{self.collection}/{id}/manage_prepayment_lines", json=data
+        )
+
+
+class AsyncRevenueRules(
+    AsyncListAPIMixin,
+    AsyncGetAPIMixin,
+    AsyncCreateAPIMixin,
+    AsyncDeleteAPIMixin,
+    AsyncUpdateAPIMixin,
+):
+    """Asyncio interface for interacting with Ordway Revenue Rules
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/revenue-rules
+    """
+
+    collection = "revenue_rules"
+
+
+class AsyncChartOfAccounts(AsyncListAPIMixin, AsyncGetAPIMixin, AsyncCreateAPIMixin):
+    """Asyncio interface for interacting with Ordway Chart of Accounts
+
+    Documentation: https://ordwaylabs.api-docs.io/v1/chart-of-accounts
+    """
+
+    collection = "chart_of_accounts"
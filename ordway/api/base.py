@@ -1,26 +1,100 @@
-from typing import TYPE_CHECKING, Optional, List, Dict, Any, Generator, Union, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    List,
+    Dict,
+    Any,
+    Generator,
+    Union,
+    Tuple,
+    Deque,
+    Iterable,
+    Callable,
+    Iterator,
+    Type,
+    TypeVar,
+)
 from logging import getLogger
+from collections import deque
+from contextlib import contextmanager, closing
+from datetime import date, datetime, timedelta
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from requests.exceptions import RequestException
 from ordway.consts import API_ENDPOINT_BASE, STAGING_ENDPOINT_BASE
+from ordway.exceptions import OrdwayClientException
+from ordway.cache import cache_key, list_cache_key, STALE, MISS
+from ordway.streaming import iter_records
+from ordway.metrics import collection_from_url, request_size
+from ordway.session import observing_retries
+from ordway.models import Record
 from ordway.utils import transform_datetimes
+from ordway.pagination import (
+    MIN_WINDOW,
+    Paginator,
+    Scan,
+    ScanCursor,
+    Window,
+    split_window,
+    to_timestamp,
+)
+from ordway import export, fanout
+from ordway.tracing import (
+    ACQUIRE,
+    CONNECT,
+    DECODE,
+    DOWNLOAD,
+    QUEUE,
+    TLS,
+    TTFB,
+    Span,
+    Tracer,
+    bind,
+    current_span,
+    timed,
+    traced,
+)
+from ordway.sync import (
+    SyncCheckpoint,
+    CheckpointStore,
+    MemoryCheckpointStore,
+    parse_timestamp,
+    format_since,
+)
 
 from .exceptions import OrdwayAPIRequestException, OrdwayAPIException
+from .bulk import (
+    BulkReport,
+    GetManyResult,
+    run_concurrently,
+    is_not_found,
+    DEFAULT_MAX_WORKERS,
+)
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future  # pylint: disable=ungrouped-imports
+    from requests import Response, Session
     from ordway.client import OrdwayClient  # pylint: disable=cyclic-import
 
 logger = getLogger(__name__)
 
+T = TypeVar("T")
+
 _Response = Union[List[Dict[str, Any]], Dict[str, Any]]
 
+# How many bytes of a streamed response are read at a time.
+STREAM_CHUNK_SIZE = 64 * 1024
 
-class APIBase:
-    collection: str
 
-    def __init__(self, client: "OrdwayClient", staging: bool = False):
-        self.client = client
-        self.session = client.session
-        self.staging = staging
+class _EndpointBase:
+    """ Behaviour shared between the blocking and asyncio API interfaces. """
+
+    collection: str
+    # The typed record class for the collection's resources, see `ordway.models`.
+    model: Type[Record] = Record
+    client: Any
+    staging: bool
 
     def _construct_headers(self) -> Dict[str, str]:
         """ Returns a dictionary of headers Ordway always expects for API requests. """
@@ -34,6 +108,90 @@ class APIBase:
             "Content-Type": "application/json",
         }
 
+    def _url(self, endpoint: str) -> str:
+        """ Returns the full URL for an endpoint of the Ordway API. """
+
+        base = self.client.base_url
+
+        if base is None:
+            base = STAGING_ENDPOINT_BASE if self.staging else API_ENDPOINT_BASE
+
+        return f"{base}/v{self.client.api_version}/{endpoint}"
+
+
+def _response_size(response: "Response", stream: bool) -> int:
+    """ The size of a response's body, without reading a streamed body. """
+
+    content_length = response.headers.get("Content-Length")
+
+    if content_length is not None and content_length.isdigit():
+        return int(content_length)
+
+    return 0 if stream else len(response.content)
+
+
+def _trace_response(
+    span: Span, response: "Response", seconds: float, stream: bool
+) -> None:
+    """Splits the `seconds` a request took into the span's phases.
+
+    `Response.elapsed` stops once the response's headers have been read, and includes
+    getting a connection.
+    """
+
+    waited = response.elapsed.total_seconds()
+    setup = sum(span.phases.get(phase, 0.0) for phase in (ACQUIRE, CONNECT, TLS))
+
+    span.add_phase(TTFB, max(waited - setup, 0.0))
+
+    if not stream:
+        span.add_phase(DOWNLOAD, max(seconds - waited, 0.0))
+
+    span.set_attribute("http.status_code", response.status_code)
+
+
+@contextmanager
+def _request_span(
+    tracer: Tracer, method: str, endpoint: str
+) -> Iterator[Optional[Span]]:
+    """ A span for a request, active for the duration of the block, or None without tracing. """
+
+    if not tracer.enabled:
+        yield None
+
+        return
+
+    with tracer.span(
+        "ordway.request", {"http.method": method, "ordway.endpoint": endpoint}
+    ) as span:
+        yield span
+
+
+@contextmanager
+def _translate_request_errors() -> Iterator[None]:
+    """ Raises failed requests and unparseable responses as `OrdwayAPIRequestException`. """
+
+    try:
+        yield
+    except RequestException as err:
+        raise OrdwayAPIRequestException(
+            str(err), request=err.request, response=err.response
+        ) from err
+    except ValueError as err:
+        raise OrdwayAPIRequestException(
+            "Ordway returned HTTP success, but no valid JSON was present. Please report this as an issue on GitHub."
+        ) from err
+
+
+class APIBase(_EndpointBase):
+    def __init__(self, client: "OrdwayClient", staging: bool = False):
+        self.client = client
+        self.staging = staging
+
+    @property
+    def session(self) -> "Session":
+        return self.client.session
+
     def _request(  # pylint: disable=too-many-arguments
         self,
         method: str,
@@ -41,15 +199,15 @@ class APIBase:
         params: Optional[Dict[str, str]] = None,
         data: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        on_response: Optional[Callable[["Response", float], None]] = None,
     ) -> _Response:
-        if self.staging:
-            base = STAGING_ENDPOINT_BASE
-        else:
-            base = API_ENDPOINT_BASE
+        """Sends a request and decodes its JSON response.
 
-        json, data = transform_datetimes(json), transform_datetimes(data)
+        `on_response` is called with the response and the seconds it took, decoding included.
+        """
 
-        url = f"{base}/v{self.client.api_version}/{endpoint}"
+        url = self._url(endpoint)
+        started = perf_counter() if on_response is not None else 0.0
 
         logger.debug(
             'Sending a request to Ordway endpoint "%s" with the following query params: %s',
@@ -57,25 +215,202 @@ class APIBase:
             params,
         )
 
-        # Ensure any changes to client attrs are reflected in headers on request.
-        self.session.headers.update(self._construct_headers())
-
         try:
-            response = self.session.request(
-                method=method, url=url, params=params, data=data, json=json
+            with _request_span(
+                self.client.tracer, method, endpoint
+            ) as span, _translate_request_errors():
+                response = self._send(
+                    method=method,
+                    url=url,
+                    headers=self._request_headers(),
+                    params=params,
+                    # Sent as-is, Ordway's headers already declare a JSON body.
+                    data=transform_datetimes(data)
+                    if json is None
+                    else self.client.codec.dumps(json),
+                )
+
+                response.raise_for_status()
+
+                if span is None:
+                    decoded = self.client.codec.decode_response(response)
+                else:
+                    with span.phase(DECODE):
+                        decoded = self.client.codec.decode_response(response)
+
+                if on_response is not None:
+                    on_response(response, perf_counter() - started)
+
+                return decoded
+        finally:
+            if method != "GET" and self.client.cache is not None:
+                # Writes, including actions like `{collection}/{id}/cancel`, change the resource.
+                self.client.cache.invalidate(*endpoint.split("/")[:2])
+
+    def _stream_get_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, str]] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Sends a GET request for a list, yielding its records as they're read from the response.
+
+        Only one record at a time is held in memory, or only `fields` of it when given.
+        """
+
+        tracer = self.client.tracer
+        records = self._stream_records(endpoint, params, fields)
+
+        if tracer.enabled:
+            records = traced(
+                tracer,
+                tracer.start_span(
+                    "ordway.request",
+                    {"http.method": "GET", "ordway.endpoint": endpoint},
+                ),
+                records,
+            )
+
+        yield from records
+
+    def _stream_records(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, str]],
+        fields: Optional[Iterable[str]],
+    ) -> Generator[Dict[str, Any], None, None]:
+        url = self._url(endpoint)
+
+        logger.debug(
+            'Streaming a response from Ordway endpoint "%s" with the following query params: %s',
+            endpoint,
+            params,
+        )
+
+        with _translate_request_errors():
+            response = self._send(
+                method="GET",
+                url=url,
+                headers=self._request_headers(),
+                params=params,
+                stream=True,
             )
 
-            response.raise_for_status()
+            with closing(response):
+                response.raise_for_status()
+
+                span = current_span() if self.client.tracer.enabled else None
+                chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+
+                if span is not None:
+                    chunks = timed(span, DOWNLOAD, chunks)
+
+                records = iter_records(
+                    chunks, self.collection, fields, loads=self.client.codec.loads
+                )
+
+                if span is not None:
+                    records = timed(span, DECODE, records, exclude=DOWNLOAD)
+
+                yield from records
+
+    def _request_headers(self) -> Dict[str, str]:
+        """The headers sent with every request, built from the client's current attributes.
+
+        They're sent with each request rather than set on the session, which may be shared
+        with clients of other companies (see `OrdwayClientPool`).
+        """
 
-            return response.json()
-        except RequestException as err:
-            raise OrdwayAPIRequestException(
-                str(err), request=err.request, response=err.response
-            ) from err
-        except ValueError as err:
-            raise OrdwayAPIRequestException(
-                "Ordway returned HTTP success, but no valid JSON was present. Please report this as an issue on GitHub."
-            ) from err
+        headers = self.client.headers
+
+        if not headers:
+            return self._construct_headers()
+
+        return {**headers, **self._construct_headers()}
+
+    def _send(self, method: str, url: str, **kwargs) -> "Response":
+        """ Sends a request through the client's rate and concurrency limiters, if any. """
+
+        # Read first, as in a forked child it also replaces the parent's limiters.
+        session = self.session
+        rate_limiter = self.client.rate_limiter
+        concurrency_limiter = self.client.concurrency_limiter
+        metrics = self.client.metrics
+        span = current_span() if self.client.tracer.enabled else None
+        queued = perf_counter() if span is not None else 0.0
+
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        permit = None if concurrency_limiter is None else concurrency_limiter.acquire()
+        status = None
+        started = perf_counter() if metrics.enabled or span is not None else 0.0
+        response_bytes = 0
+
+        if span is not None:
+            span.add_phase(QUEUE, started - queued)
+
+        try:
+            if self.client.shared_session:
+                if self.client.proxies is not None:
+                    kwargs.setdefault("proxies", self.client.proxies)
+
+                with observing_retries(self.client.observe_retry):
+                    response = session.request(method=method, url=url, **kwargs)
+            else:
+                response = session.request(method=method, url=url, **kwargs)
+            status = response.status_code
+
+            if span is not None:
+                _trace_response(
+                    span,
+                    response,
+                    perf_counter() - started,
+                    kwargs.get("stream", False),
+                )
+
+            if metrics.enabled:
+                response_bytes = _response_size(response, kwargs.get("stream", False))
+        finally:
+            if concurrency_limiter is not None and permit is not None:
+                concurrency_limiter.release(permit, status)
+
+            if metrics.enabled:
+                metrics.observe_request(
+                    collection_from_url(url),
+                    method,
+                    status,
+                    perf_counter() - started,
+                    request_size(kwargs.get("data")),
+                    response_bytes,
+                )
+
+        if rate_limiter is not None:
+            rate_limiter.update(response.status_code, response.headers)
+
+        return response
+
+    def _cached(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """ Returns `key` from the client's cache, calling `fetch` on a miss and refreshing stale entries in the background. """
+
+        # In a forked child, the cache must be reset before it's used.
+        self.client.check_fork()
+        cache = self.client.cache
+
+        if cache is None:
+            return fetch()
+
+        generation = cache.generation
+        state, value = cache.lookup(key)
+
+        if state == STALE:
+            cache.revalidate(self.collection, key, fetch)
+        elif state == MISS:
+            value = fetch()
+
+            cache.store(self.collection, key, value, generation=generation)
+
+        return value
 
     def _get_request(
         self, endpoint: str, params: Optional[Dict[str, str]] = None
@@ -115,125 +450,854 @@ def _remove_order_from_sort(sort_str: str) -> Tuple[str, Optional[bool]]:
     return (sort_str, None)
 
 
+def _limit_page_size(collection: str, max_page_size: int, size: int) -> int:
+    """ `size`, or `max_page_size` with a warning when it's larger. """
+
+    if size > max_page_size:
+        logger.warning(
+            'Maximum page size for "%s" is %s, setting `size` to maximum.',
+            collection,
+            max_page_size,
+        )
+
+        return max_page_size
+
+    return size
+
+
+def _build_list_params(  # pylint: disable=too-many-arguments
+    collection: str,
+    max_page_size: int,
+    page: int,
+    size: int,
+    sort: str,
+    filters: Optional[Dict[str, Any]],
+    ascending: bool,
+) -> Dict[str, str]:
+    """ Builds the query params Ordway expects when listing a page of a collection. """
+
+    size = _limit_page_size(collection, max_page_size, size)
+    filters = {} if filters is None else filters
+    params: Dict[str, str] = {"size": str(size), "page": str(page), **filters}
+
+    # Ordway appends order onto the end of the sort string. It's best
+    # to ensure that if a user does, we remove it. Sice we're going to
+    # append it later.
+    sort, order = _remove_order_from_sort(sort)
+
+    if order is not None:
+        ascending = order
+
+    if len(sort.strip()) > 0:
+        params["sort"] = f"{sort} {'asc' if ascending else 'desc'}"
+
+    return params
+
+
+def _unwrap_list_response(
+    collection: str, response_json: _Response
+) -> List[Dict[str, Any]]:
+    """ Normalizes a list response from Ordway into a list of resources. """
+
+    if isinstance(response_json, dict):
+        # For some endpoints, Ordway nests the results
+        # under the collection name so as to include
+        # additional metadata
+        # For example,
+        # { "usages": [], "total": 0 }
+        results = response_json.get(collection.lower())
+
+        if isinstance(results, list):
+            return results
+
+        return [response_json]
+
+    return response_json
+
+
+def _unwrap_get_response(response_json: _Response) -> Dict[str, Any]:
+    """ Normalizes a response from Ordway for a single resource into a dictionary. """
+
+    if isinstance(response_json, list):
+        if len(response_json) == 1:
+            return response_json[0]
+
+        raise OrdwayAPIException(
+            "Call to `.get_request` returned an unexpected JSON array. Please report this as an issue on GitHub."
+        )
+
+    return response_json
+
+
 class ListAPIMixin(APIBase):
     """ Mixin for retrieving a collection of Ordway resources. """
 
     MAX_PAGE_SIZE = 50
     MAX_PAGES = 1000
+    # How many pages a window of a partitioned `all()` may hold before it's split.
+    PARTITION_PAGE_BUDGET = 100
+
+    def _list_page(  # pylint: disable=too-many-arguments
+        self,
+        page: int,
+        size: int,
+        sort: str,
+        filters: Optional[Dict[str, Any]],
+        ascending: bool,
+        cache: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Retrieves a single page of a collection as a list.
+
+        Only with `cache` is the page read from, and kept in, the client's cache. Scans
+        never pass it, as they must see current records and would crowd out other entries.
+        """
+
+        params = _build_list_params(
+            self.collection,
+            self._max_page_size(),
+            page=page,
+            size=size,
+            sort=sort,
+            filters=filters,
+            ascending=ascending,
+        )
+        sizer = self.client.page_sizer
+        # The seconds and bytes of the response, when one was fetched for the page sizer.
+        fetched: List[Tuple[float, int]] = []
+
+        def fetch() -> _Response:
+            if not sizer.enabled:
+                return self._get_request(self.collection, params=params)
+
+            return self._request(
+                "GET",
+                self.collection,
+                params=params,
+                on_response=lambda response, seconds: fetched.append(
+                    (seconds, len(response.content))
+                ),
+            )
+
+        response_json = (
+            self._cached(list_cache_key(self.collection, params), fetch)
+            if cache
+            else fetch()
+        )
+        results = _unwrap_list_response(self.collection, response_json)
+
+        if fetched:
+            sizer.observe(
+                self.collection, int(params["size"]), len(results), *fetched[0]
+            )
+
+        return results
+
+    def _page_size(self, size: Optional[int]) -> int:
+        """`size`, or the size the client's page sizer picks for the collection.
+
+        Only sizes the page sizer picks may go past `MAX_PAGE_SIZE`, up to the limit it
+        allows. Sizes callers pass are held to the documented limit.
+        """
+
+        if size is None:
+            return min(
+                self.client.page_sizer.size(self.collection, self.MAX_PAGE_SIZE),
+                self._max_page_size(),
+            )
+
+        return _limit_page_size(self.collection, self.MAX_PAGE_SIZE, size)
+
+    def _max_page_size(self) -> int:
+        return self.client.page_sizer.max_page_size(self.collection, self.MAX_PAGE_SIZE)
 
     def list(  # pylint: disable=too-many-arguments
         self,
         page: int,
-        size: int = 20,
+        size: Optional[int] = None,
         sort: str = "",
         filters: Optional[Dict[str, Any]] = None,
         ascending: bool = False,
+        stream: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        model: bool = False,
+        cache: bool = False,
     ) -> Generator[Dict[str, Any], None, None]:
-        """ Retrieve a single page of resource from a collection """
+        """Retrieve a single page of resource from a collection
+
+        With `cache`, the page is read from and kept in the client's cache, e.g. for
+        reference data that rarely changes. Without it, the page is always requested.
+
+        With `stream`, records are yielded as they're parsed from the response instead of
+        once the whole page has been decoded, and the client's cache isn't used. `fields`
+        limits each record to those fields (dots select nested fields, such as
+        `line_items.amount`), so nothing else is ever built.
+
+        With `model`, records are compact typed records (see `ordway.models`) instead of dicts.
+
+        Without a `size`, the client's `page_sizer` picks it, 20 by default. A `size`
+        larger than `MAX_PAGE_SIZE` is lowered to it.
+        """
+
+        yield from self._list_records(
+            page,
+            self._page_size(size),
+            sort,
+            filters,
+            ascending,
+            stream,
+            fields,
+            model,
+            cache,
+        )
 
-        if size > self.MAX_PAGE_SIZE:
-            logger.warning(
-                'Maximum page size for "%s" is %s, setting `size` to maximum.',
-                self.collection,
-                self.MAX_PAGE_SIZE,
+    def _list_records(  # pylint: disable=too-many-arguments
+        self,
+        page: int,
+        size: int,
+        sort: str,
+        filters: Optional[Dict[str, Any]],
+        ascending: bool,
+        stream: bool,
+        fields: Optional[Iterable[str]],
+        model: bool = False,
+        cache: bool = False,
+    ) -> Generator[Any, None, None]:
+        """ `list`, with a `size` that was already picked or limited. """
+
+        tracer = self.client.tracer
+        records: Iterator[Any] = self._list(
+            page, size, sort, filters, ascending, stream, fields, cache
+        )
+
+        if model:
+            records = map(self.model.from_dict, records)
+
+        if tracer.enabled:
+            records = traced(
+                tracer,
+                tracer.start_span(
+                    "ordway.list",
+                    {"ordway.collection": self.collection, "ordway.page": page},
+                ),
+                records,
             )
 
-            size = self.MAX_PAGE_SIZE
+        yield from records
+
+    def _list(  # pylint: disable=too-many-arguments
+        self,
+        page: int,
+        size: int,
+        sort: str,
+        filters: Optional[Dict[str, Any]],
+        ascending: bool,
+        stream: bool,
+        fields: Optional[Iterable[str]],
+        cache: bool = False,
+    ) -> Generator[Dict[str, Any], None, None]:
+        if stream:
+            yield from self._stream_page(page, size, sort, filters, ascending, fields)
+
+            return
 
-        filters = {} if filters is None else filters
-        params: Dict[str, str] = {"size": str(size), "page": str(page), **filters}
+        if fields is not None:
+            raise ValueError("`fields` can only be used with `stream=True`.")
 
-        # Ordway appends order onto the end of the sort string. It's best
-        # to ensure that if a user does, we remove it. Sice we're going to
-        # append it later.
-        sort, order = _remove_order_from_sort(sort)
+        results = self._list_page(page, size, sort, filters, ascending, cache)
 
-        if order is not None:
-            ascending = order
+        # Mostly for consistency's sake.
+        for result in results:
+            yield result
 
-        if len(sort.strip()) > 0:
-            params["sort"] = f"{sort} {'asc' if ascending else 'desc'}"
+    def _stream_page(  # pylint: disable=too-many-arguments
+        self,
+        page: int,
+        size: int,
+        sort: str,
+        filters: Optional[Dict[str, Any]],
+        ascending: bool,
+        fields: Optional[Iterable[str]],
+    ) -> Generator[Dict[str, Any], None, None]:
+        """ Streams a single page of a collection. """
 
-        response_json = self._get_request(
+        params = _build_list_params(
             self.collection,
-            params=params,
+            self._max_page_size(),
+            page=page,
+            size=size,
+            sort=sort,
+            filters=filters,
+            ascending=ascending,
         )
 
-        if isinstance(response_json, dict):
-            # For some endpoints, Ordway nests the results
-            # under the collection name so as to include
-            # additional metadata
-            # For example,
-            # { "usages": [], "total": 0 }
-            results = response_json.get(self.collection.lower())
+        return self._stream_get_request(self.collection, params=params, fields=fields)
 
-            if isinstance(results, list):
-                response_json = results
-            else:
-                response_json = [response_json]
+    def _observe_pages(self, pages: int) -> None:
+        """ Reports the pages a scan read to the client's metrics, and the active span. """
 
-        # Mostly for consistency's sake.
-        for result in response_json:
-            yield result
+        client = self.client
+
+        if client.metrics.enabled:
+            client.metrics.observe_pages(self.collection, pages)
+
+        span = current_span() if client.tracer.enabled else None
+
+        if span is not None:
+            span.set_attribute("ordway.pages", pages)
+
+    def _reached_max_pages(
+        self, page: int, ignore_max_pages: bool, warn: bool = True
+    ) -> bool:
+        if not ignore_max_pages and page >= self.MAX_PAGES:
+            if not warn:
+                return True
+
+            logger.warning(
+                "Call to `.all()` has reached the maximum number of pages (%s). If this is desirable, please call with `ignore_max_pages` set to True.",
+                self.MAX_PAGES,
+            )
+
+            return True
 
-        if len(response_json) == 0:
-            self._exhausted = True
+        return False
 
-    def all(  # pylint: disable=too-many-arguments
+    def _prefetch_pages(  # pylint: disable=too-many-arguments
         self,
-        size: int = 20,
+        prefetch: int,
+        size: int,
+        sort: str,
+        filters: Optional[Dict[str, Any]],
+        ascending: bool,
+        ignore_max_pages: bool,
+        first_page: int = 1,
+    ) -> Generator[List[Dict[str, Any]], None, None]:
+        """Yields pages in order while keeping up to `prefetch` of the following pages in flight.
+
+        At most `prefetch` pages are ever requested or buffered ahead of the consumer.
+        """
+
+        pending: Deque["Future[List[Dict[str, Any]]]"] = deque()
+        next_page = first_page
+        reached_max_pages = False
+        # Pages requested on the executor's threads belong to the active span.
+        list_page = (
+            bind(self._list_page) if self.client.tracer.enabled else self._list_page
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=prefetch, thread_name_prefix=f"ordway-{self.collection}"
+        ) as executor:
+            try:
+                while True:
+                    while len(pending) < prefetch and not reached_max_pages:
+                        if self._reached_max_pages(next_page, ignore_max_pages):
+                            reached_max_pages = True
+
+                            break
+
+                        pending.append(
+                            executor.submit(
+                                list_page,
+                                next_page,
+                                size,
+                                sort,
+                                filters,
+                                ascending,
+                            )
+                        )
+                        next_page += 1
+
+                    if len(pending) == 0:
+                        break
+
+                    results = pending.popleft().result()
+
+                    if len(results) == 0:
+                        break
+
+                    yield results
+            finally:
+                # Pages past the end of the collection, or past where the
+                # consumer stopped, are no longer needed.
+                for future in pending:
+                    future.cancel()
+
+    def all(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        size: Optional[int] = None,
         sort: str = "",
         filters: Optional[Dict[str, Any]] = None,
         ascending: bool = False,
         ignore_max_pages: bool = False,
+        prefetch: int = 0,
+        stream: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        model: bool = False,
+        resume_from: Optional[ScanCursor] = None,
+        partition_by: Optional[str] = None,
+        windows: Union[int, Iterable[Tuple[Any, Any]]] = 8,
+        concurrency: int = DEFAULT_MAX_WORKERS,
+        page_budget: Optional[int] = None,
+    ) -> Scan[Dict[str, Any]]:
+        """Retrieve all resources from a collection
+
+        Passing `prefetch` requests up to that many of the following pages on background
+        threads while the current page is being consumed. Resources are still yielded in order.
+
+        `size`, `stream`, `fields` and `model` apply to every page, see `list`.
+
+        The returned scan's `cursor` tracks how far it got. Passing it as `resume_from`,
+        e.g. after the scan failed, continues from the next record, with the cursor's
+        `size`, `sort`, `filters` and `ascending` in place of the arguments. Records created
+        or deleted meanwhile shift pages, as they would during any scan.
+
+        With `partition_by`, a timestamp field such as `created_date`, the collection is
+        scanned as date `windows` instead, up to `concurrency` at once and without a cap on
+        pages. `windows` is either how many equal windows to split the collection's range
+        into, or `(start, end)` pairs, each window including `start` but not `end`. Windows
+        holding more than `page_budget` pages (`PARTITION_PAGE_BUDGET` by default) are
+        halved until they don't. Windows are yielded in order, each sorted by `sort`
+        (`partition_by` by default). Partitioned scans can't be resumed.
+        """
+
+        if prefetch > 0 and stream:
+            raise ValueError("`prefetch` and `stream` can't be used together.")
+
+        if partition_by is not None:
+            if resume_from is not None or prefetch > 0 or stream or fields is not None:
+                raise ValueError(
+                    "`partition_by` can't be used with `resume_from`, `prefetch`, `stream` or `fields`."
+                )
+
+            records = self._partitioned(
+                partition_by,
+                windows,
+                self._page_size(size),
+                sort or partition_by,
+                filters,
+                ascending,
+                concurrency,
+                self.PARTITION_PAGE_BUDGET if page_budget is None else page_budget,
+            )
+
+            return Scan(self._scan(records, model), None)
+
+        paginator = self.paginate(
+            size,
+            sort,
+            filters,
+            ascending,
+            ignore_max_pages,
+            prefetch,
+            stream,
+            fields,
+            resume_from,
+        )
+
+        return Scan(self._scan(paginator.records(), model), paginator)
+
+    def paginate(  # pylint: disable=too-many-arguments
+        self,
+        size: Optional[int] = None,
+        sort: str = "",
+        filters: Optional[Dict[str, Any]] = None,
+        ascending: bool = False,
+        ignore_max_pages: bool = False,
+        prefetch: int = 0,
+        stream: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        resume_from: Optional[ScanCursor] = None,
+    ) -> Paginator:
+        """Returns a `Paginator` over the collection, e.g. to read it a page at a time with `pages()`.
+
+        Arguments are the same as `all`'s.
+        """
+
+        return Paginator(
+            self,
+            self._cursor(size, sort, filters, ascending, resume_from),
+            ignore_max_pages,
+            prefetch,
+            stream,
+            fields,
+        )
+
+    def _cursor(  # pylint: disable=too-many-arguments
+        self,
+        size: Optional[int],
+        sort: str,
+        filters: Optional[Dict[str, Any]],
+        ascending: bool,
+        resume_from: Optional[ScanCursor],
+    ) -> ScanCursor:
+        """ The cursor a scan starts at, `resume_from` or the start of the collection. """
+
+        if resume_from is None:
+            return ScanCursor(
+                self.collection,
+                sort,
+                {} if filters is None else {k: str(v) for k, v in filters.items()},
+                ascending,
+                self._page_size(size),
+            )
+
+        if resume_from.collection != self.collection:
+            raise ValueError(
+                f'Cannot resume a scan of "{resume_from.collection}" on "{self.collection}".'
+            )
+
+        return resume_from
+
+    def _scan(
+        self, records: Iterator[Any], model: bool
+    ) -> Generator[Dict[str, Any], None, None]:
+        tracer = self.client.tracer
+
+        if model:
+            records = map(self.model.from_dict, records)
+
+        if tracer.enabled:
+            records = traced(
+                tracer,
+                tracer.start_span("ordway.all", {"ordway.collection": self.collection}),
+                records,
+            )
+
+        yield from records
+
+    def _partitioned(  # pylint: disable=too-many-arguments
+        self,
+        partition_by: str,
+        windows: Union[int, Iterable[Tuple[Any, Any]]],
+        size: int,
+        sort: str,
+        filters: Optional[Dict[str, Any]],
+        ascending: bool,
+        concurrency: int,
+        page_budget: int,
     ) -> Generator[Dict[str, Any], None, None]:
-        """ Retrieve all resources from a collection """
+        """Scans `windows` of `partition_by`, keeping up to `concurrency` of them in flight.
+
+        Like `_prefetch_pages`, windows are yielded in order, and only the windows in flight
+        are ever buffered.
+        """
+
+        scan_window = (
+            bind(self._scan_window) if self.client.tracer.enabled else self._scan_window
+        )
+        # Every entry is a window, and the future scanning it once it's in flight.
+        queue: Deque[List[Any]] = deque(
+            [window, None] for window in self._windows(partition_by, windows, filters)
+        )
+        pages = 0
+
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix=f"ordway-{self.collection}"
+        ) as executor:
+            try:
+                while queue:
+                    for entry in islice(queue, concurrency):
+                        if entry[1] is None:
+                            entry[1] = executor.submit(
+                                scan_window,
+                                entry[0],
+                                partition_by,
+                                size,
+                                sort,
+                                filters,
+                                ascending,
+                                page_budget,
+                            )
+
+                    window, future = queue.popleft()
+                    results, read = future.result()
+                    pages += read
+
+                    if results is None:
+                        queue.extendleft(
+                            [half, None] for half in reversed(split_window(window, 2))
+                        )
+
+                        continue
+
+                    yield from results
+            finally:
+                for _, future in queue:
+                    if future is not None:
+                        future.cancel()
+
+                self._observe_pages(pages)
+
+    def _windows(
+        self,
+        partition_by: str,
+        windows: Union[int, Iterable[Tuple[Any, Any]]],
+        filters: Optional[Dict[str, Any]],
+    ) -> List[Window]:
+        """ `windows` as timestamps, splitting the collection's range when it's a count. """
+
+        if isinstance(windows, int):
+            bounds = self._partition_bounds(partition_by, filters)
+
+            return [] if bounds is None else split_window(bounds, windows)
+
+        return [(to_timestamp(start), to_timestamp(end)) for start, end in windows]
+
+    def _partition_bounds(
+        self, partition_by: str, filters: Optional[Dict[str, Any]]
+    ) -> Optional[Window]:
+        """ The window covering every record, from the earliest and latest `partition_by`. """
+
+        first = self._list_page(1, 1, partition_by, filters, True)
+
+        if len(first) == 0:
+            return None
 
+        last = self._list_page(1, 1, partition_by, filters, False)
+
+        return (
+            to_timestamp(first[0][partition_by]),
+            to_timestamp(last[0][partition_by]) + MIN_WINDOW,
+        )
+
+    def _scan_window(  # pylint: disable=too-many-arguments
+        self,
+        window: Window,
+        partition_by: str,
+        size: int,
+        sort: str,
+        filters: Optional[Dict[str, Any]],
+        ascending: bool,
+        page_budget: int,
+    ) -> Tuple[Optional[List[Dict[str, Any]]], int]:
+        """Retrieves every record in `window`, or None when it holds more than `page_budget` pages.
+
+        Only the page past the budget is requested to find out, before the window is scanned.
+        Also returns how many pages of records were read.
+        """
+
+        start, end = window
+        filters = {
+            **({} if filters is None else filters),
+            f"{partition_by}>=": start.isoformat(),
+            f"{partition_by}<": end.isoformat(),
+        }
+
+        if end - start > MIN_WINDOW and self._list_page(
+            page_budget + 1, size, sort, filters, ascending
+        ):
+            return None, 0
+
+        records: List[Dict[str, Any]] = []
         page = 1
+        # Ordway may cap pages past the documented limit, so only an empty page ends those.
+        honored = size <= self.MAX_PAGE_SIZE
+
+        while True:
+            results = self._list_page(page, size, sort, filters, ascending)
+            records.extend(results)
+
+            if len(results) == 0 or (honored and len(results) < size):
+                return records, page if results else page - 1
+
+            page += 1
+
+    def iter_record_batches(
+        self,
+        chunk_rows: int = export.DEFAULT_CHUNK_ROWS,
+        schema: Any = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Streams the collection as `pyarrow.RecordBatch`es of up to `chunk_rows` records.
+
+        Requires pyarrow. Records are read with `all`, which `kwargs` are passed to, and
+        only one batch is held at a time. See `ordway.export.iter_record_batches`.
+        """
+
+        return export.iter_record_batches(self.all(**kwargs), chunk_rows, schema)
+
+    def export_parquet(  # pylint: disable=too-many-arguments
+        self,
+        path: str,
+        chunk_rows: int = export.DEFAULT_CHUNK_ROWS,
+        schema: Any = None,
+        compression: str = "snappy",
+        **kwargs: Any,
+    ) -> int:
+        """Writes the collection to a Parquet file, a row group of `chunk_rows` records at a time.
+
+        Requires pyarrow. Records are read with `all`, which `kwargs` are passed to. Returns
+        how many records were written.
+        """
+
+        return export.write_parquet(
+            self.all(**kwargs), path, chunk_rows, schema, compression
+        )
+
+    def fan_out(self, process: Callable[[Any], T], **kwargs: Any) -> Iterator[T]:
+        """Fetches the collection in shards across processes, calling `process` on every record there.
+
+        `kwargs` shard and filter the scan, see `ordway.fanout.fan_out`.
+        """
+
+        return fanout.fan_out(self, process, **kwargs)
 
-        self._exhausted = False
+    def sync(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        since: Optional[Union[str, date, datetime]] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        size: int = 50,
+        filters: Optional[Dict[str, Any]] = None,
+        overlap: timedelta = timedelta(seconds=1),
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Yields every resource created or updated since the last sync, oldest update first.
+
+        Resources are requested with the `updated_date>` filter, sorted by ascending
+        `updated_date`. The latest `updated_date` seen (the high-water mark) is saved to
+        `checkpoint_store` after every page, along with the ids updated at exactly that
+        time, so a sync that crashes resumes from its last page. Resources may be yielded
+        again after a crash, but never skipped.
+
+        Every page re-queries from the high-water mark minus `overlap`, so resources that
+        share the boundary timestamp (or that Ordway only compares to the second) aren't
+        missed, and resources updated mid-sync can't shift the pages being read. Passing
+        `since` starts from that point instead of the stored checkpoint; with neither, the
+        whole collection is synced.
+        """
+
+        store = (
+            MemoryCheckpointStore() if checkpoint_store is None else checkpoint_store
+        )
+        checkpoint = store.load(self.collection) if since is None else None
+
+        if since is not None:
+            checkpoint = SyncCheckpoint(
+                self.collection, format_since(since), frozenset()
+            )
+
+        size = min(size, self.MAX_PAGE_SIZE)
+        page = 1
 
-        # Maybe separate into Paginator class? Could be needed elsewhere.
         while True:
-            if not ignore_max_pages and page >= self.MAX_PAGES:
-                logger.warning(
-                    "Call to `.all()` has reached the maximum number of pages (%s). If this is desirable, please call with `ignore_max_pages` set to True.",
-                    self.MAX_PAGES,
-                )
+            page_filters = dict(filters or {})
 
-                break
+            if checkpoint is not None:
+                boundary = parse_timestamp(checkpoint.high_water_mark) - overlap
+                page_filters["updated_date>"] = boundary.isoformat()
 
-            yield from self.list(
-                page=page,
-                size=size,
-                sort=sort,
-                filters=filters,
-                ascending=ascending,
+            results = self._list_page(
+                page, size, "updated_date", page_filters, ascending=True
             )
+            previous = checkpoint
+
+            for result in results:
+                try:
+                    updated_date = result["updated_date"]
+                    updated = parse_timestamp(updated_date)
+                except (KeyError, TypeError, ValueError) as err:
+                    raise OrdwayClientException(
+                        f'Cannot sync "{self.collection}", a resource has no valid `updated_date`.'
+                    ) from err
+
+                id = str(result.get("id"))
 
-            if self._exhausted:
+                if checkpoint is not None:
+                    high_water_mark = parse_timestamp(checkpoint.high_water_mark)
+
+                    if updated < high_water_mark or (
+                        updated == high_water_mark and id in checkpoint.boundary_ids
+                    ):
+                        continue
+
+                    if updated == high_water_mark:
+                        checkpoint = checkpoint._replace(
+                            boundary_ids=checkpoint.boundary_ids | {id}
+                        )
+                        yield result
+
+                        continue
+
+                checkpoint = SyncCheckpoint(
+                    self.collection, updated_date, frozenset((id,))
+                )
+
+                yield result
+
+            if checkpoint is not None and checkpoint != previous:
+                store.save(checkpoint)
+
+            if len(results) < size:
                 break
 
-            page += 1
+            if (
+                previous is None
+                or checkpoint is None
+                or (checkpoint.high_water_mark != previous.high_water_mark)
+            ):
+                # The filter moved forward, its first page holds what comes next.
+                page = 1
+            else:
+                # A full page shared the high-water mark, read past it.
+                page += 1
 
 
 class GetAPIMixin(APIBase):
     """ Mixin for retrieving a single Ordway resource. """
 
-    def get(self, id: str) -> Dict[str, Any]:
-        """ Retrieve a particular resource """
+    def get(self, id: str, model: bool = False) -> Union[Dict[str, Any], Record]:
+        """ Retrieve a particular resource, as a typed record (see `ordway.models`) with `model`. """
 
-        response_json = self._get_request(f"{self.collection}/{id}")
+        record = self._cached(cache_key(self.collection, id), lambda: self._fetch(id))
 
-        if isinstance(response_json, list):
-            if len(response_json) == 1:
-                return response_json[0]
+        return self.model.from_dict(record) if model else record
 
-            raise OrdwayAPIException(
-                "Call to `.get_request` returned an unexpected JSON array. Please report this as an issue on GitHub."
-            )
+    def _fetch(self, id: str) -> Dict[str, Any]:
+        return _unwrap_get_response(self._get_request(f"{self.collection}/{id}"))
+
+    def get_many(
+        self,
+        ids: Iterable[str],
+        concurrency: int = DEFAULT_MAX_WORKERS,
+        as_dict: bool = False,
+    ) -> GetManyResult:
+        """Retrieve many resources by id, sending up to `concurrency` requests at once.
+
+        Duplicate ids are only fetched once. Missing or failing ids are reported on the
+        returned `GetManyResult` instead of aborting the rest of the batch.
+        """
+
+        ids = list(ids)
+        # dict.fromkeys keeps the first occurrence of every id, in order.
+        unique_ids = list(dict.fromkeys(ids))
+
+        found: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        failed: Dict[str, Exception] = {}
+
+        for result in run_concurrently(self.get, unique_ids, concurrency):
+            if result.error is None:
+                found[result.input] = result.result
+            elif is_not_found(result.error):
+                missing.append(result.input)
+            else:
+                failed[result.input] = result.error
+
+        records: Union[List[Optional[Dict[str, Any]]], Dict[str, Dict[str, Any]]]
+
+        if as_dict:
+            records = {id: found[id] for id in unique_ids if id in found}
+        else:
+            records = [found.get(id) for id in ids]
 
-        return response_json
+        # Report in input order rather than completion order.
+        order = {id: position for position, id in enumerate(unique_ids)}
+        missing.sort(key=order.__getitem__)
+
+        return GetManyResult(
+            records,
+            missing,
+            {id: failed[id] for id in sorted(failed, key=order.__getitem__)},
+        )
 
 
 class CreateAPIMixin(APIBase):
@@ -246,6 +1310,24 @@ class CreateAPIMixin(APIBase):
 
         return self._post_request(self.collection, json=data, data=None, params=params)
 
+    def create_many(
+        self,
+        data: Iterable[Dict[str, Any]],
+        params: Optional[Dict[str, str]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> BulkReport:
+        """Create a resource for every payload in `data`, sending up to `max_workers` requests at once.
+
+        Returns a `BulkReport` streaming a `BulkResult` per payload as it completes.
+        Failures are reported with their payload rather than aborting the batch.
+        """
+
+        return BulkReport(
+            run_concurrently(
+                lambda item: self.create(item, params=params), data, max_workers
+            )
+        )
+
 
 class UpdateAPIMixin(APIBase):
     """ Mixin for updating a single Ordway resource. """
@@ -262,6 +1344,25 @@ class UpdateAPIMixin(APIBase):
             f"{self.collection}/{id}", json=data, data=None, params=params
         )
 
+    def update_many(
+        self,
+        items: Iterable[Tuple[str, Dict[str, Any]]],
+        params: Optional[Dict[str, str]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> BulkReport:
+        """Update resources from `(id, data)` pairs, sending up to `max_workers` requests at once.
+
+        Returns a `BulkReport` streaming a `BulkResult` per pair as it completes.
+        """
+
+        return BulkReport(
+            run_concurrently(
+                lambda item: self.update(item[0], item[1], params=params),
+                items,
+                max_workers,
+            )
+        )
+
 
 class DeleteAPIMixin(APIBase):
     """ Mixin for deleting a single Ordway resource. """
@@ -271,6 +1372,16 @@ class DeleteAPIMixin(APIBase):
 
         return self._request("DELETE", f"{self.collection}/{id}")
 
+    def delete_many(
+        self, ids: Iterable[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> BulkReport:
+        """Delete every resource in `ids`, sending up to `max_workers` requests at once.
+
+        Returns a `BulkReport` streaming a `BulkResult` per id as it completes.
+        """
+
+        return BulkReport(run_concurrently(self.delete, ids, max_workers))
+
 
 __all__ = [
     "APIBase",
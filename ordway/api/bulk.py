@@ -0,0 +1,134 @@
+from typing import (
+    Any,
+    Union,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from itertools import islice
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class BulkResult(NamedTuple):
+    """ The outcome of one item of a bulk operation. `position` is the item's position in the input. """
+
+    position: int
+    input: Any
+    result: Any
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        """ Whether the item succeeded. """
+
+        return self.error is None
+
+    @property
+    def errors(self) -> Optional[Dict[str, Any]]:
+        """ The `errors` object Ordway returned for the item, if any. """
+
+        return getattr(self.error, "errors", None)
+
+
+class BulkReport:
+    """Streams the results of a bulk operation as they complete, sorting them into `succeeded` and `failed`.
+
+    Iterating consumes the operation. Call `wait` to run it to completion without iterating.
+    """
+
+    def __init__(self, results: Iterator[BulkResult]):
+        self._results = results
+        self.succeeded: List[BulkResult] = []
+        self.failed: List[BulkResult] = []
+
+    def __iter__(self) -> Iterator[BulkResult]:
+        for result in self._results:
+            if result.ok:
+                self.succeeded.append(result)
+            else:
+                self.failed.append(result)
+
+            yield result
+
+    def wait(self) -> "BulkReport":
+        """ Runs the remainder of the operation, returning the report. """
+
+        for _ in self:
+            pass
+
+        return self
+
+
+class GetManyResult(NamedTuple):
+    """The outcome of fetching many resources by id.
+
+    `records` holds the resources either in input order, with None for ids that
+    couldn't be fetched, or keyed by id. Ids Ordway returned a 404 for are listed in
+    `missing`, and ids that failed for any other reason are in `failed` with their error.
+    """
+
+    records: Union[List[Optional[Dict[str, Any]]], Dict[str, Dict[str, Any]]]
+    missing: List[str]
+    failed: Dict[str, Exception]
+
+
+def is_not_found(error: Exception) -> bool:
+    """ Whether `error` is Ordway reporting that a resource doesn't exist. """
+
+    response = getattr(error, "response", None)
+
+    return response is not None and response.status_code == 404
+
+
+def run_concurrently(
+    func: Callable[[Any], Any], items: Iterable[Any], max_workers: int
+) -> Iterator[BulkResult]:
+    """Calls `func` for every item on a pool of `max_workers` threads, yielding results in completion order.
+
+    Items are pulled from `items` lazily, keeping at most `max_workers` calls in flight, so
+    large generators are never read into memory up front. Errors, whether Ordway's or any
+    other exception `func` raises, are reported on the item's result instead of stopping
+    the remaining items.
+    """
+
+    if max_workers < 1:
+        raise ValueError("`max_workers` must be at least 1.")
+
+    indexed_items = enumerate(items)
+    pending: Dict["Future[Any]", Tuple[int, Any]] = {}
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="ordway-bulk"
+    ) as executor:
+
+        def submit(count: int) -> None:
+            for index, item in islice(indexed_items, count):
+                pending[executor.submit(func, item)] = (index, item)
+
+        try:
+            submit(max_workers)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    index, item = pending.pop(future)
+
+                    try:
+                        result = BulkResult(index, item, future.result(), None)
+                    except Exception as err:  # pylint: disable=broad-except
+                        result = BulkResult(index, item, None, err)
+
+                    yield result
+
+                submit(len(done))
+        finally:
+            for future in pending:
+                future.cancel()
@@ -1,4 +1,18 @@
 from typing import Dict, Optional, Any
+from ordway.models import (
+    BillingSchedule,
+    Credit,
+    Customer,
+    Invoice,
+    Order,
+    Payment,
+    Plan,
+    Product,
+    Refund,
+    RevenueSchedule,
+    Subscription,
+    Usage,
+)
 from .base import (
     ListAPIMixin,
     GetAPIMixin,
@@ -17,6 +31,7 @@ class Products(
     """
 
     collection = "products"
+    model = Product
 
 
 class JournalEntries(CreateAPIMixin):
@@ -35,6 +50,7 @@ class Invoices(ListAPIMixin, GetAPIMixin):
     """
 
     collection = "invoices"
+    model = Invoice
 
     def reverse(self, id: str, reversed_on: str):
         """ Reverse an invoice """
@@ -58,6 +74,7 @@ class Customers(
     """
 
     collection = "customers"
+    model = Customer
 
 
 class Payments(ListAPIMixin, GetAPIMixin, CreateAPIMixin):
@@ -67,6 +84,7 @@ class Payments(ListAPIMixin, GetAPIMixin, CreateAPIMixin):
     """
 
     collection = "payments"
+    model = Payment
 
     def reverse(self, id: str, reversed_on: str):
         """ Reverse a payment """
@@ -104,6 +122,7 @@ class Credits(ListAPIMixin, GetAPIMixin, CreateAPIMixin):
     """
 
     collection = "credits"
+    model = Credit
 
     def reverse(self, id: str, reversed_on: str):
         """ Reverse a credit """
@@ -125,6 +144,7 @@ class Refunds(ListAPIMixin, GetAPIMixin):
     """
 
     collection = "refunds"
+    model = Refund
 
 
 class Statements(ListAPIMixin, GetAPIMixin):
@@ -147,6 +167,7 @@ class Plans(ListAPIMixin, GetAPIMixin, CreateAPIMixin, DeleteAPIMixin, UpdateAPI
     """
 
     collection = "plans"
+    model = Plan
 
 
 class Coupons(ListAPIMixin, GetAPIMixin, CreateAPIMixin, UpdateAPIMixin):
@@ -167,6 +188,7 @@ class Subscriptions(
     """
 
     collection = "subscriptions"
+    model = Subscription
 
     def activate(self, id: str, data: Dict[str, Any]):
         """ Activate a subscription """
@@ -204,6 +226,7 @@ class Orders(ListAPIMixin, GetAPIMixin, CreateAPIMixin, UpdateAPIMixin):
     """
 
     collection = "orders"
+    model = Order
 
     def cancel(self, id: str, data: Optional[Dict[str, Any]] = None):
         """ Cancel an order """
@@ -220,6 +243,7 @@ class Usages(ListAPIMixin, GetAPIMixin, CreateAPIMixin, DeleteAPIMixin):
     """
 
     collection = "usages"
+    model = Usage
 
 
 class Webhooks(
@@ -251,6 +275,7 @@ class RevenueSchedules(ListAPIMixin, GetAPIMixin):
     MAX_PAGE_SIZE = 500
 
     collection = "revenue_schedules"
+    model = RevenueSchedule
 
 
 class BillingSchedules(ListAPIMixin, GetAPIMixin, UpdateAPIMixin):
@@ -263,6 +288,7 @@ class BillingSchedules(ListAPIMixin, GetAPIMixin, UpdateAPIMixin):
     """
 
     collection = "billing_schedules"
+    model = BillingSchedule
 
     def manage_prepayment_lines(self, id: str, data: Dict[str, Any]):
         """ Manage prepaid credits, allowing addition or refund of prepaid credits """
@@ -0,0 +1,120 @@
+from typing import TYPE_CHECKING, Optional, Dict
+
+from .client import BaseOrdwayClient
+from .session import async_session_factory, retry_strategy, TimeoutAdapter
+from .ratelimit import RateLimiter
+from .codec import JSONCodec
+from .metrics import Metrics
+from . import api
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+
+class AsyncOrdwayClient(BaseOrdwayClient):
+    """An asyncio client for interacting with Ordway's API (https://ordwaylabs.api-docs.io).
+
+    Requires aiohttp. Every interface mirrors the one found on `OrdwayClient`, but
+    its methods are coroutines, and `list`/`all` are async generators.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        email: str,
+        api_key: str,
+        company: str,
+        user_token: str,
+        api_version: str = "1",
+        staging: bool = False,
+        proxies: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        session: Optional["ClientSession"] = None,
+        timeout: float = TimeoutAdapter.DEFAULT_TIMEOUT,
+        connection_limit: int = 100,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        codec: Optional[JSONCodec] = None,
+        metrics: Optional[Metrics] = None,
+        base_url: Optional[str] = None,
+    ):
+        super().__init__(
+            email=email,
+            api_key=api_key,
+            company=company,
+            user_token=user_token,
+            api_version=api_version,
+            proxies=proxies,
+            headers=headers,
+            codec=codec,
+            metrics=metrics,
+            base_url=base_url,
+        )
+
+        self.timeout = timeout
+        self.connection_limit = connection_limit
+        self.retry_strategy = retry_strategy
+        self.rate_limiter = (
+            None if rate_limit is None else RateLimiter(rate_limit, rate_limit_burst)
+        )
+
+        if session is not None and headers is not None:
+            session.headers.update(headers)
+
+        self._session = session
+
+        # Interfaces
+        self.products = api.AsyncProducts(self, staging=staging)
+        self.customers = api.AsyncCustomers(self, staging=staging)
+        self.subscriptions = api.AsyncSubscriptions(self, staging=staging)
+        self.invoices = api.AsyncInvoices(self, staging=staging)
+        self.payments = api.AsyncPayments(self, staging=staging)
+        self.credits = api.AsyncCredits(self, staging=staging)
+        self.plans = api.AsyncPlans(self, staging=staging)
+        self.refunds = api.AsyncRefunds(self, staging=staging)
+        self.webhooks = api.AsyncWebhooks(self, staging=staging)
+        self.journal_entries = api.AsyncJournalEntries(self, staging=staging)
+        self.payment_runs = api.AsyncPaymentRuns(self, staging=staging)
+        self.statements = api.AsyncStatements(self, staging=staging)
+        self.coupons = api.AsyncCoupons(self, staging=staging)
+        self.orders = api.AsyncOrders(self, staging=staging)
+        self.usages = api.AsyncUsages(self, staging=staging)
+        self.billing_runs = api.AsyncBillingRuns(self, staging=staging)
+        self.revenue_schedules = api.AsyncRevenueSchedules(self, staging=staging)
+        self.billing_schedules = api.AsyncBillingSchedules(self, staging=staging)
+        self.revenue_rules = api.AsyncRevenueRules(self, staging=staging)
+        self.chart_of_accounts = api.AsyncChartOfAccounts(self, staging=staging)
+
+    @property
+    def session(self) -> "ClientSession":
+        """ The underlying `aiohttp.ClientSession`, created on first use so it binds to the running event loop. """
+
+        if self._session is None:
+            self._session = async_session_factory(
+                headers=self.headers,
+                timeout=self.timeout,
+                limit=self.connection_limit,
+            )
+
+        return self._session
+
+    def proxy_for(self, url: str) -> Optional[str]:
+        """ Returns the proxy configured for the scheme of `url`, if any. """
+
+        if self.proxies is None:
+            return None
+
+        return self.proxies.get(url.split(":", 1)[0])
+
+    async def close(self) -> None:
+        """ Closes the underlying session and its connections. """
+
+        if self._session is not None:
+            await self._session.close()
+
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
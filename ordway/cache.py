@@ -0,0 +1,489 @@
+from typing import Any, Callable, Dict, Optional, Tuple, NamedTuple, Set
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from threading import Lock
+from time import monotonic, time
+from urllib.parse import urlencode
+from logging import getLogger
+import json
+import sqlite3
+
+from .sqlite import SQLiteDatabase
+
+logger = getLogger(__name__)
+
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+
+class CacheStats(NamedTuple):
+    """ A snapshot of a cache's counters. """
+
+    hits: int
+    stale_hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    refreshes: int
+    size: int
+
+
+def cache_key(collection: str, id: str) -> str:
+    """ The key a single resource is cached under. """
+
+    return f"{collection}/{id}"
+
+
+def list_cache_key(collection: str, params: Dict[str, str]) -> str:
+    """ The key a page of a collection is cached under. """
+
+    return f"{collection}?{urlencode(sorted(params.items()))}"
+
+
+def _is_list_key(collection: str, key: str) -> bool:
+    return key.startswith(f"{collection}?")
+
+
+class BaseCache(ABC):
+    """Behaviour shared by the response cache backends.
+
+    Entries live for `ttl` seconds, or for the value in `ttls` for their collection (0 disables
+    caching for that collection). With `stale_ttl`, an expired entry keeps being served for
+    up to that many extra seconds while it is refreshed in the background, so callers never
+    wait on a hot entry.
+
+    Writes made through the client (creates, updates, deletes and actions such as cancel or
+    reverse) invalidate the affected resource and every cached page of its collection.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60,
+        ttls: Optional[Dict[str, float]] = None,
+        stale_ttl: float = 0,
+    ):
+        self.ttl = ttl
+        self.ttls = {} if ttls is None else ttls
+        self.stale_ttl = stale_ttl
+
+        self._refresh_lock = Lock()
+        self._refreshing: Set[str] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._refreshes = 0
+
+    def ttl_for(self, collection: str) -> float:
+        """ How long resources of `collection` stay fresh. """
+
+        return self.ttls.get(collection, self.ttl)
+
+    @property
+    @abstractmethod
+    def generation(self) -> int:
+        """Incremented by every invalidation.
+
+        Read it before fetching and pass it to `store`, so a response fetched before a
+        write completed can't overwrite the invalidation.
+        """
+
+    @abstractmethod
+    def lookup(self, key: str) -> Tuple[str, Any]:
+        """ Returns the state of `key` (FRESH, STALE or MISS) and its value, if any. """
+
+    @abstractmethod
+    def store(
+        self, collection: str, key: str, value: Any, generation: Optional[int] = None
+    ) -> None:
+        """ Caches `value` under `key`, unless the cache was invalidated since `generation`. """
+
+    @abstractmethod
+    def invalidate(self, collection: str, id: Optional[str] = None) -> None:
+        """ Drops the cached resource `id` of `collection` and every cached page of `collection`. """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """ Drops every entry. """
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """ Returns a snapshot of the cache's counters. """
+
+    def after_fork(self) -> None:
+        """ Resets state a forked child can't share with its parent, such as locks and threads. """
+
+        # The executor's threads only exist in the parent, and so do its refreshes.
+        self._refresh_lock = Lock()
+        self._refreshing = set()
+        self._executor = None
+
+    def revalidate(self, collection: str, key: str, fetch: Callable[[], Any]) -> None:
+        """ Refreshes `key` in the background with `fetch`, unless a refresh is already running. """
+
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+
+            self._refreshing.add(key)
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="ordway-cache"
+                )
+
+            executor = self._executor
+
+        generation = self.generation
+
+        def refresh() -> None:
+            try:
+                self.store(collection, key, fetch(), generation=generation)
+
+                with self._refresh_lock:
+                    self._refreshes += 1
+            except Exception:  # pylint: disable=broad-except
+                # The stale entry keeps being served until it expires.
+                logger.warning('Failed to refresh cached "%s".', key, exc_info=True)
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        executor.submit(refresh)
+
+
+class ResponseCache(BaseCache):  # pylint: disable=too-many-instance-attributes
+    """An in-process TTL and LRU cache for resources and pages returned by the API interfaces.
+
+    Once more than `max_entries` are cached, the least recently used entry is evicted.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        ttl: float = 60,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1024,
+        stale_ttl: float = 0,
+        clock: Callable[[], float] = monotonic,
+    ):
+        super().__init__(ttl=ttl, ttls=ttls, stale_ttl=stale_ttl)
+
+        self.max_entries = max_entries
+
+        self._clock = clock
+        self._lock = Lock()
+        self._entries: "OrderedDict[str, Tuple[Any, float, float]]" = OrderedDict()
+        self._generation = 0
+
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def after_fork(self) -> None:
+        super().after_fork()
+
+        self._lock = Lock()
+
+    def lookup(self, key: str) -> Tuple[str, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                value, fresh_until, stale_until = entry
+                now = self._clock()
+
+                if now < fresh_until:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+
+                    return FRESH, deepcopy(value)
+
+                if now < stale_until:
+                    self._entries.move_to_end(key)
+                    self._stale_hits += 1
+
+                    return STALE, deepcopy(value)
+
+                del self._entries[key]
+
+            self._misses += 1
+
+            return MISS, None
+
+    def store(
+        self, collection: str, key: str, value: Any, generation: Optional[int] = None
+    ) -> None:
+        ttl = self.ttl_for(collection)
+
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            now = self._clock()
+
+            self._entries[key] = (
+                deepcopy(value),
+                now + ttl,
+                now + ttl + self.stale_ttl,
+            )
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, collection: str, id: Optional[str] = None) -> None:
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+
+            if id is not None:
+                self._entries.pop(cache_key(collection, id), None)
+
+            for key in [key for key in self._entries if _is_list_key(collection, key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                stale_hits=self._stale_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                refreshes=self._refreshes,
+                size=len(self._entries),
+            )
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    collection TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    fresh_until REAL NOT NULL,
+    stale_until REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_collection ON responses (collection);
+CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at);
+CREATE INDEX IF NOT EXISTS responses_stale_until ON responses (stale_until);
+CREATE TABLE IF NOT EXISTS generation (id INTEGER PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO generation (id, value) VALUES (1, 0);
+"""
+
+
+class SQLiteCache(BaseCache):  # pylint: disable=too-many-instance-attributes
+    """A response cache stored in a SQLite file, shared by every process on a host that opens it.
+
+    Entries are evicted oldest first once there are more than `max_entries` of them, or
+    once their JSON takes up more than `max_bytes`. Writers wait up to `timeout` seconds
+    for the database's lock before giving up.
+
+    Entries expire by wall clock time, as it's the only clock processes share. Keys don't
+    include the company, so clients for different companies should use different files.
+    Hit and miss counters are kept per process.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: str,
+        ttl: float = 300,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: Optional[int] = 10_000,
+        max_bytes: Optional[int] = None,
+        stale_ttl: float = 0,
+        timeout: float = 5.0,
+        clock: Callable[[], float] = time,
+    ):
+        super().__init__(ttl=ttl, ttls=ttls, stale_ttl=stale_ttl)
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._database = SQLiteDatabase(path, timeout=timeout)
+        self._clock = clock
+        self._counter_lock = Lock()
+
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+        self._database.connection().executescript(_SCHEMA)
+
+    def after_fork(self) -> None:
+        super().after_fork()
+
+        self._counter_lock = Lock()
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._counter_lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    @property
+    def generation(self) -> int:
+        return (
+            self._database.connection()
+            .execute("SELECT value FROM generation")
+            .fetchone()[0]
+        )
+
+    def lookup(self, key: str) -> Tuple[str, Any]:
+        row = (
+            self._database.connection()
+            .execute(
+                "SELECT value, fresh_until, stale_until FROM responses WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+
+        if row is not None:
+            value, fresh_until, stale_until = row
+            now = self._clock()
+
+            if now < fresh_until:
+                self._count("_hits")
+
+                return FRESH, json.loads(value)
+
+            if now < stale_until:
+                self._count("_stale_hits")
+
+                return STALE, json.loads(value)
+
+        self._count("_misses")
+
+        return MISS, None
+
+    def store(
+        self, collection: str, key: str, value: Any, generation: Optional[int] = None
+    ) -> None:
+        ttl = self.ttl_for(collection)
+
+        if ttl <= 0:
+            return
+
+        encoded = json.dumps(value, separators=(",", ":"))
+        now = self._clock()
+
+        with self._database.transaction() as connection:
+            current = connection.execute("SELECT value FROM generation").fetchone()[0]
+
+            if generation is not None and generation != current:
+                return
+
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    collection,
+                    encoded,
+                    len(encoded),
+                    now,
+                    now + ttl,
+                    now + ttl + self.stale_ttl,
+                ),
+            )
+
+            self._evict(connection, now)
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        evicted = connection.execute(
+            "DELETE FROM responses WHERE stale_until <= ?", (now,)
+        ).rowcount
+
+        if self.max_entries is not None:
+            evicted += connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+
+        if self.max_bytes is not None:
+            evicted += self._evict_bytes(connection, self.max_bytes)
+
+        if evicted > 0:
+            self._count("_evictions", evicted)
+
+    @staticmethod
+    def _evict_bytes(connection: sqlite3.Connection, max_bytes: int) -> int:
+        total = connection.execute("SELECT SUM(size) FROM responses").fetchone()[0]
+
+        if total is None or total <= max_bytes:
+            return 0
+
+        keys = []
+
+        for key, size in connection.execute(
+            "SELECT key, size FROM responses ORDER BY stored_at"
+        ):
+            if total <= max_bytes:
+                break
+
+            keys.append((key,))
+            total -= size
+
+        connection.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+        return len(keys)
+
+    def invalidate(self, collection: str, id: Optional[str] = None) -> None:
+        with self._database.transaction() as connection:
+            connection.execute("UPDATE generation SET value = value + 1")
+            connection.execute(
+                "DELETE FROM responses WHERE collection = ? AND substr(key, 1, ?) = ?",
+                (collection, len(collection) + 1, f"{collection}?"),
+            )
+
+            if id is not None:
+                connection.execute(
+                    "DELETE FROM responses WHERE key = ?", (cache_key(collection, id),)
+                )
+
+        self._count("_invalidations")
+
+    def clear(self) -> None:
+        with self._database.transaction() as connection:
+            connection.execute("UPDATE generation SET value = value + 1")
+            connection.execute("DELETE FROM responses")
+
+    def stats(self) -> CacheStats:
+        size = (
+            self._database.connection()
+            .execute("SELECT COUNT(*) FROM responses")
+            .fetchone()[0]
+        )
+
+        with self._counter_lock:
+            return CacheStats(
+                hits=self._hits,
+                stale_hits=self._stale_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                refreshes=self._refreshes,
+                size=size,
+            )
+
+    def close(self) -> None:
+        """ Closes the calling thread's connection. """
+
+        self._database.close()
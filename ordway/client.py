@@ -1,135 +1,351 @@
-from typing import TYPE_CHECKING, Optional, Dict
-from logging import getLogger
-from os import environ
-
-from .session import session_factory
-from .exceptions import OrdwayClientException
-from .consts import SUPPORTED_API_VERSIONS
-from . import api
-
-if TYPE_CHECKING:
-    from requests import Session
-
-logger = getLogger(__name__)
-
-
-class OrdwayClient:  # pylint: disable=too-many-instance-attributes
-    """ A client for interacting with Ordway's API (https://ordwaylabs.api-docs.io). """
-
-    SUPPORTED_API_VERSIONS = SUPPORTED_API_VERSIONS
-
-    def __init__(  # pylint: disable=too-many-arguments
-        self,
-        email: str,
-        api_key: str,
-        company: str,
-        user_token: str,
-        api_version: str = "1",
-        staging: bool = False,
-        proxies: Optional[Dict[str, str]] = None,
-        headers: Optional[Dict[str, str]] = None,
-        session: Optional["Session"] = None,
-    ):
-        self.email = email
-        self.api_key = api_key
-        self.company = company
-        self.user_token = user_token
-
-        self.session = session_factory(session)
-        self.headers = headers
-        self.proxies = proxies
-
-        if headers is not None:
-            self.session.headers.update(headers)
-        if proxies is not None:
-            self.session.proxies.update(proxies)
-
-        self.api_version = api_version
-
-        # Interfaces
-        self.products = api.Products(self, staging=staging)
-        self.customers = api.Customers(self, staging=staging)
-        self.subscriptions = api.Subscriptions(self, staging=staging)
-        self.invoices = api.Invoices(self, staging=staging)
-        self.payments = api.Payments(self, staging=staging)
-        self.credits = api.Credits(self, staging=staging)
-        self.plans = api.Plans(self, staging=staging)
-        self.refunds = api.Refunds(self, staging=staging)
-        self.webhooks = api.Webhooks(self, staging=staging)
-        self.journal_entries = api.JournalEntries(self, staging=staging)
-        self.payment_runs = api.PaymentRuns(self, staging=staging)
-        self.statements = api.Statements(self, staging=staging)
-        self.coupons = api.Coupons(self, staging=staging)
-        self.orders = api.Orders(self, staging=staging)
-        self.usages = api.Usages(self, staging=staging)
-        self.billing_runs = api.BillingRuns(self, staging=staging)
-        self.revenue_schedules = api.RevenueSchedules(self, staging=staging)
-        self.billing_schedules = api.BillingSchedules(self, staging=staging)
-        self.revenue_rules = api.RevenueRules(self, staging=staging)
-        self.chart_of_accounts = api.ChartOfAccounts(self, staging=staging)
-
-    @property
-    def api_version(self):
-        """ The currently used API version """
-
-        return self._api_version
-
-    @api_version.setter
-    def api_version(self, api_version):
-        if api_version.startswith("v"):
-            api_version = api_version[1:]
-
-        self._api_version = api_version
-        self._verify_api_version()
-
-    def _verify_api_version(self) -> None:
-        """ Verifies that the requested API version is supported by OrdwayClient. """
-
-        version = self.api_version
-
-        if version not in self.SUPPORTED_API_VERSIONS:
-            raise OrdwayClientException(
-                f'OrdwayClient does not currently support the API version "v{version}".'
-            )
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, *args):
-        self.session.close()
-
-    @classmethod
-    def from_env(cls) -> "OrdwayClient":
-        """ Instantiates `OrdwayClient` using environment variables. """
-
-        try:
-            env_vars = {
-                "email": environ["ORDWAY_EMAIL"],
-                "api_key": environ["ORDWAY_API_KEY"],
-                "company": environ["ORDWAY_COMPANY"],
-                "user_token": environ["ORDWAY_USER_TOKEN"],
-            }
-
-            logger.debug(
-                'Instantiating client from environment with email "%s" and company "%s".',
-                env_vars["email"],
-                env_vars["company"],
-            )
-        except KeyError as err:
-            err_message = (
-                "Cannot instantiate `OrdwayClient` with `.from_env`."
-                "Must set all of the following env vars: `ORDWAY_EMAIL`, `ORDWAY_API_KEY`,"
-                "`ORDWAY_COMPANY`, and `ORDWAY_USER_TOKEN`."
-            )
-
-            logger.error(err_message)
-
-            raise OrdwayClientException(err_message) from err
-
-        api_version = environ.get("ORDWAY_API_VERSION")
-
-        if api_version is not None:
-            env_vars["api_version"] = api_version
-
-        # MyPy complains about incompatible type. Argument 1 to "OrdwayClient" has incompatible type "**Dict[str, str]"; expected "Optional[Dict[str, str]]"
-        return cls(**env_vars)  # type: ignore
+from typing import TYPE_CHECKING, Any, Optional, Dict
+from logging import getLogger
+from os import environ, getpid
+
+from requests.adapters import DEFAULT_POOLSIZE, DEFAULT_POOLBLOCK
+
+from .session import session_factory, PoolStats
+from .ratelimit import RateLimiter
+from .concurrency import AdaptiveConcurrencyLimiter
+from .cache import BaseCache
+from .codec import JSONCodec, default_codec
+from .metrics import Metrics, collection_from_url
+from .tracing import Tracer, current_span
+from .page_size import PageSizer
+from .exceptions import OrdwayClientException
+from .consts import SUPPORTED_API_VERSIONS, API_ENDPOINT_BASE
+from . import api
+
+if TYPE_CHECKING:
+    from requests import Session
+    from urllib3 import HTTPResponse
+    from urllib3.util.retry import Retry
+
+logger = getLogger(__name__)
+
+
+class BaseOrdwayClient:
+    """ Credentials and API version handling shared by the blocking and asyncio clients. """
+
+    SUPPORTED_API_VERSIONS = SUPPORTED_API_VERSIONS
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        email: str,
+        api_key: str,
+        company: str,
+        user_token: str,
+        api_version: str = "1",
+        proxies: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        codec: Optional[JSONCodec] = None,
+        metrics: Optional[Metrics] = None,
+        base_url: Optional[str] = None,
+    ):
+        self.email = email
+        self.api_key = api_key
+        self.company = company
+        self.user_token = user_token
+
+        self.headers = headers
+        self.proxies = proxies
+        self.codec = default_codec() if codec is None else codec
+        self.metrics = Metrics() if metrics is None else metrics
+        # Overrides Ordway's production and staging URLs, e.g. to use `ordway.testing.FakeOrdway`.
+        self.base_url = base_url
+
+        self.api_version = api_version
+
+    @property
+    def api_version(self):
+        """ The currently used API version """
+
+        return self._api_version
+
+    @api_version.setter
+    def api_version(self, api_version):
+        if api_version.startswith("v"):
+            api_version = api_version[1:]
+
+        self._api_version = api_version
+        self._verify_api_version()
+
+    def _verify_api_version(self) -> None:
+        """ Verifies that the requested API version is supported by OrdwayClient. """
+
+        version = self.api_version
+
+        if version not in self.SUPPORTED_API_VERSIONS:
+            raise OrdwayClientException(
+                f'OrdwayClient does not currently support the API version "v{version}".'
+            )
+
+    @classmethod
+    def from_env(cls) -> "OrdwayClient":
+        """ Instantiates `OrdwayClient` using environment variables. """
+
+        try:
+            env_vars = {
+                "email": environ["ORDWAY_EMAIL"],
+                "api_key": environ["ORDWAY_API_KEY"],
+                "company": environ["ORDWAY_COMPANY"],
+                "user_token": environ["ORDWAY_USER_TOKEN"],
+            }
+
+            logger.debug(
+                'Instantiating client from environment with email "%s" and company "%s".',
+                env_vars["email"],
+                env_vars["company"],
+            )
+        except KeyError as err:
+            err_message = (
+                "Cannot instantiate `OrdwayClient` with `.from_env`."
+                "Must set all of the following env vars: `ORDWAY_EMAIL`, `ORDWAY_API_KEY`,"
+                "`ORDWAY_COMPANY`, and `ORDWAY_USER_TOKEN`."
+            )
+
+            logger.error(err_message)
+
+            raise OrdwayClientException(err_message) from err
+
+        api_version = environ.get("ORDWAY_API_VERSION")
+
+        if api_version is not None:
+            env_vars["api_version"] = api_version
+
+        # MyPy complains about incompatible type. Argument 1 to "OrdwayClient" has incompatible type "**Dict[str, str]"; expected "Optional[Dict[str, str]]"
+        return cls(**env_vars)  # type: ignore
+
+
+class OrdwayClient(BaseOrdwayClient):  # pylint: disable=too-many-instance-attributes
+    """A client for interacting with Ordway's API (https://ordwaylabs.api-docs.io).
+
+    Clients can be pickled, e.g. to send them to other processes, and survive a fork. Either
+    way, the new process gets a new session, so it never shares the parent's sockets.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        email: str,
+        api_key: str,
+        company: str,
+        user_token: str,
+        api_version: str = "1",
+        staging: bool = False,
+        proxies: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        session: Optional["Session"] = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        keep_alive: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        cache: Optional[BaseCache] = None,
+        codec: Optional[JSONCodec] = None,
+        metrics: Optional[Metrics] = None,
+        tracer: Optional[Tracer] = None,
+        base_url: Optional[str] = None,
+        page_sizer: Optional[PageSizer] = None,
+        shared_session: bool = False,
+    ):
+        """With `shared_session`, `session` is used as it is, along with its connection pool
+        and retry strategy, so it can be shared with other clients (see `OrdwayClientPool`).
+        `headers` and `proxies` are then only sent with this client's requests.
+
+        Pickling a client keeps its credentials and the settings above, except `session`,
+        `concurrency_limiter`, `cache`, `metrics`, `tracer` and `page_sizer`, which are
+        left to their defaults.
+        """
+
+        super().__init__(
+            email=email,
+            api_key=api_key,
+            company=company,
+            user_token=user_token,
+            api_version=api_version,
+            proxies=proxies,
+            headers=headers,
+            codec=codec,
+            metrics=metrics,
+            base_url=base_url,
+        )
+
+        self.staging = staging
+        self.shared_session = shared_session
+        # What a new session (in a forked child, or once unpickled) and rate limiter are built with.
+        self._settings: Dict[str, Any] = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "keep_alive": keep_alive,
+            "rate_limit": rate_limit,
+            "rate_limit_burst": rate_limit_burst,
+        }
+        self._pid = getpid()
+        self._session: "Session"
+
+        if shared_session:
+            if session is None:
+                raise OrdwayClientException("`shared_session` requires a `session`.")
+
+            self._session = session
+        else:
+            self._session = self._new_session(session)
+
+        self.rate_limiter = self._new_rate_limiter()
+        self.concurrency_limiter = concurrency_limiter
+        self.cache = cache
+        self.tracer = Tracer() if tracer is None else tracer
+        self.page_sizer = PageSizer() if page_sizer is None else page_sizer
+
+        # Interfaces
+        self.products = api.Products(self, staging=staging)
+        self.customers = api.Customers(self, staging=staging)
+        self.subscriptions = api.Subscriptions(self, staging=staging)
+        self.invoices = api.Invoices(self, staging=staging)
+        self.payments = api.Payments(self, staging=staging)
+        self.credits = api.Credits(self, staging=staging)
+        self.plans = api.Plans(self, staging=staging)
+        self.refunds = api.Refunds(self, staging=staging)
+        self.webhooks = api.Webhooks(self, staging=staging)
+        self.journal_entries = api.JournalEntries(self, staging=staging)
+        self.payment_runs = api.PaymentRuns(self, staging=staging)
+        self.statements = api.Statements(self, staging=staging)
+        self.coupons = api.Coupons(self, staging=staging)
+        self.orders = api.Orders(self, staging=staging)
+        self.usages = api.Usages(self, staging=staging)
+        self.billing_runs = api.BillingRuns(self, staging=staging)
+        self.revenue_schedules = api.RevenueSchedules(self, staging=staging)
+        self.billing_schedules = api.BillingSchedules(self, staging=staging)
+        self.revenue_rules = api.RevenueRules(self, staging=staging)
+        self.chart_of_accounts = api.ChartOfAccounts(self, staging=staging)
+
+    def _new_session(self, session: Optional["Session"] = None) -> "Session":
+        session = session_factory(
+            session,
+            pool_connections=self._settings["pool_connections"],
+            pool_maxsize=self._settings["pool_maxsize"],
+            pool_block=self._settings["pool_block"],
+            keep_alive=self._settings["keep_alive"],
+            retry_observer=self.observe_retry,
+        )
+
+        if self.headers is not None:
+            session.headers.update(self.headers)
+        if self.proxies is not None:
+            session.proxies.update(self.proxies)
+
+        return session
+
+    def _new_rate_limiter(self) -> Optional[RateLimiter]:
+        rate_limit = self._settings["rate_limit"]
+
+        if rate_limit is None:
+            return None
+
+        return RateLimiter(rate_limit, self._settings["rate_limit_burst"])
+
+    @property
+    def session(self) -> "Session":
+        """ The client's session, replaced with a new one in a forked child. """
+
+        self.check_fork()
+
+        return self._session
+
+    def check_fork(self) -> None:
+        """ Resets the client's per-process state when called in a forked child, see `_after_fork`. """
+
+        if self._pid != getpid():
+            self._after_fork()
+
+    def _after_fork(self) -> None:
+        """Gives the client its own session and rate limiter in a forked child, and resets
+        its limiter, cache, metrics, tracer and page sizer (see their `after_fork`).
+
+        The parent's session is left alone rather than closed, since closing it would shut
+        sockets the parent still uses. A shared session belongs to its owner, so the client
+        stops sharing it.
+        """
+
+        logger.debug("Creating a new session for %s after a fork.", type(self).__name__)
+
+        self._pid = getpid()
+        self.shared_session = False
+        self._session = self._new_session()
+        self.rate_limiter = self._new_rate_limiter()
+
+        if self.concurrency_limiter is not None:
+            self.concurrency_limiter.after_fork()
+        if self.cache is not None:
+            self.cache.after_fork()
+
+        self.metrics.after_fork()
+        self.tracer.after_fork()
+        self.page_sizer.after_fork()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "email": self.email,
+            "api_key": self.api_key,
+            "company": self.company,
+            "user_token": self.user_token,
+            "api_version": self.api_version,
+            "staging": self.staging,
+            "proxies": self.proxies,
+            "headers": self.headers,
+            # Codecs may hold the module they wrap, so only their class is kept.
+            "codec": type(self.codec),
+            "base_url": self.base_url,
+            **self._settings,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**{**state, "codec": state["codec"]()})  # type: ignore
+
+    def observe_retry(
+        self,
+        retry: "Retry",
+        response: Optional["HTTPResponse"],
+        error: Optional[Exception],
+    ) -> None:
+        """ Lets the rate limiter see responses urllib3 retries, such as a 429 with Retry-After, and records the retry. """
+
+        if response is not None and self.rate_limiter is not None:
+            self.rate_limiter.update(response.status, response.headers)
+
+        span = current_span() if self.tracer.enabled else None
+
+        if span is not None:
+            span.set_attribute("ordway.retries", len(retry.history))
+
+        if self.metrics.enabled and retry.history:
+            attempt = retry.history[-1]
+            # The same wait `Retry.sleep` is about to make.
+            retry_after = (
+                retry.get_retry_after(response)
+                if response is not None and retry.respect_retry_after_header
+                else None
+            )
+
+            self.metrics.observe_retry(
+                collection_from_url(attempt.url or ""),
+                attempt.method or "",
+                str(response.status) if response is not None else type(error).__name__,
+                retry.get_backoff_time() if retry_after is None else retry_after,
+            )
+
+    def pool_stats(self) -> PoolStats:
+        """ Returns a snapshot of this client's HTTP connection pool usage. """
+
+        return self.session.get_adapter(API_ENDPOINT_BASE).pool_stats()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        # A shared session is closed by whoever owns it, such as `OrdwayClientPool`.
+        if not self.shared_session:
+            self.session.close()
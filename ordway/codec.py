@@ -0,0 +1,125 @@
+from typing import TYPE_CHECKING, Any, Union
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from decimal import Decimal
+import json
+
+from .exceptions import OrdwayClientException
+
+if TYPE_CHECKING:
+    from requests import Response
+
+
+def encode_default(value: Any) -> Any:
+    """Encodes the values JSON has no type for.
+
+    Dates and datetimes become ISO 8601 strings. Decimals become strings, so amounts keep
+    their exact precision instead of passing through a float.
+    """
+
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+
+    if isinstance(value, Decimal):
+        return str(value)
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONCodec(ABC):
+    """Encodes request bodies and decodes responses.
+
+    Dates, datetimes and Decimals are encoded as they're serialized (see `encode_default`),
+    so payloads are never walked or modified beforehand.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """ Encodes `value` as JSON. """
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """ Decodes JSON, raising a ValueError if it's invalid. """
+
+    def decode_response(self, response: "Response") -> Any:
+        """ Decodes the body of `response`. """
+
+        return self.loads(response.content)
+
+
+class StdlibCodec(JSONCodec):
+    """ The standard library's `json`. """
+
+    name = "json"
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, default=encode_default).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def decode_response(self, response: "Response") -> Any:
+        # Lets requests detect the body's encoding, as it always has.
+        return response.json()
+
+
+class OrjsonCodec(JSONCodec):
+    """ orjson (https://github.com/ijl/orjson), which encodes dates and datetimes natively. """
+
+    name = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson  # pylint: disable=import-outside-toplevel
+        except ImportError as err:
+            raise OrdwayClientException(
+                "`OrjsonCodec` requires orjson. Please install it with `pip install orjson`."
+            ) from err
+
+        self._orjson = orjson
+        # Like the standard library, allow keys that aren't strings.
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value, default=encode_default, option=self._options)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """ ujson (https://github.com/ultrajson/ultrajson), 5.1 or later. """
+
+    name = "ujson"
+
+    def __init__(self):
+        try:
+            import ujson  # pylint: disable=import-outside-toplevel
+        except ImportError as err:
+            raise OrdwayClientException(
+                "`UjsonCodec` requires ujson. Please install it with `pip install ujson`."
+            ) from err
+
+        self._ujson = ujson
+
+    def dumps(self, value: Any) -> bytes:
+        return self._ujson.dumps(
+            value, default=encode_default, escape_forward_slashes=False
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+
+def default_codec() -> JSONCodec:
+    """ Returns the fastest codec installed: orjson, then ujson, then the standard library. """
+
+    for codec in (OrjsonCodec, UjsonCodec):
+        try:
+            return codec()
+        except OrdwayClientException:
+            continue
+
+    return StdlibCodec()
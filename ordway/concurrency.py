@@ -0,0 +1,221 @@
+from typing import Optional, Callable, Deque, List, NamedTuple
+from threading import Condition
+from collections import deque
+from time import monotonic, time
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+# Responses with these statuses mean Ordway is overloaded or limiting us.
+OVERLOAD_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+class ConcurrencyAdjustment(NamedTuple):
+    """ A change made to an `AdaptiveConcurrencyLimiter`'s limit. """
+
+    timestamp: float
+    previous_limit: int
+    limit: int
+    reason: str
+
+
+class ConcurrencyStats(NamedTuple):
+    """ A snapshot of an `AdaptiveConcurrencyLimiter`. """
+
+    limit: int
+    in_flight: int
+    successes: int
+    failures: int
+    latency_spikes: int
+    baseline_latency: Optional[float]
+
+
+class AdaptiveConcurrencyLimiter:  # pylint: disable=too-many-instance-attributes
+    """Caps the number of requests in flight, adapting the cap with AIMD (additive increase, multiplicative decrease).
+
+    While responses are healthy the limit grows by `increase` for every `limit` requests
+    that complete, roughly one step per round trip. A 429/5xx, a connection error, or a
+    response slower than `latency_tolerance` times the baseline latency (or slower than
+    `latency_threshold` seconds, when given) multiplies the limit by `decrease`. Requests
+    sent before a decrease don't trigger another one, so a single burst of errors only
+    backs off once.
+
+    Changes to the limit are logged, kept in `adjustments` and passed to `on_adjust`.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_threshold: Optional[float] = None,
+        latency_tolerance: float = 2.0,
+        on_adjust: Optional[Callable[[ConcurrencyAdjustment], None]] = None,
+        history_size: int = 100,
+        clock: Callable[[], float] = monotonic,
+    ):
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "`initial_limit` must be between `min_limit` and `max_limit`."
+            )
+
+        if not 0 < decrease < 1:
+            raise ValueError("`decrease` must be between 0 and 1.")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_threshold = latency_threshold
+        self.latency_tolerance = latency_tolerance
+        self.on_adjust = on_adjust
+        self.adjustments: Deque[ConcurrencyAdjustment] = deque(maxlen=history_size)
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._successes = 0
+        self._failures = 0
+        self._latency_spikes = 0
+        self._baseline: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._clock = clock
+        self._condition = Condition()
+
+    @property
+    def limit(self) -> int:
+        """ The current maximum number of requests in flight. """
+
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """ The number of requests currently in flight. """
+
+        return self._in_flight
+
+    def stats(self) -> ConcurrencyStats:
+        """ Returns a snapshot of the limiter's state. """
+
+        with self._condition:
+            return ConcurrencyStats(
+                limit=self.limit,
+                in_flight=self._in_flight,
+                successes=self._successes,
+                failures=self._failures,
+                latency_spikes=self._latency_spikes,
+                baseline_latency=self._baseline,
+            )
+
+    def after_fork(self) -> None:
+        """Resets the requests in flight in a forked child, which sends none of the parent's.
+
+        The limit learned so far is kept.
+        """
+
+        self._condition = Condition()
+        self._in_flight = 0
+
+    def acquire(self) -> float:
+        """ Blocks until a request may be sent. Returns a permit to hand back to `release`. """
+
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+
+            self._in_flight += 1
+
+            return self._clock()
+
+    def release(self, permit: float, status: Optional[int]) -> None:
+        """Marks a request started at `permit` as done, adjusting the limit from its outcome.
+
+        `status` is the HTTP status of the response, or None if no response was received.
+        """
+
+        latency = self._clock() - permit
+        adjustments: List[ConcurrencyAdjustment] = []
+
+        with self._condition:
+            self._in_flight -= 1
+
+            if status is None or status in OVERLOAD_STATUSES:
+                self._failures += 1
+
+                if permit > self._last_decrease:
+                    adjustments.append(self._decrease(f"status {status}"))
+            elif self._is_latency_spike(latency):
+                self._latency_spikes += 1
+
+                if permit > self._last_decrease:
+                    adjustments.append(
+                        self._decrease(f"latency spike ({latency:.3f}s)")
+                    )
+            else:
+                self._successes += 1
+                self._update_baseline(latency)
+
+                adjustment = self._increase()
+
+                if adjustment is not None:
+                    adjustments.append(adjustment)
+
+            self._condition.notify_all()
+
+        for adjustment in adjustments:
+            self._record(adjustment)
+
+    def _is_latency_spike(self, latency: float) -> bool:
+        if self.latency_threshold is not None:
+            return latency > self.latency_threshold
+
+        return (
+            self._baseline is not None
+            and latency > self._baseline * self.latency_tolerance
+        )
+
+    def _update_baseline(self, latency: float) -> None:
+        if self._baseline is None:
+            self._baseline = latency
+        else:
+            # Exponential moving average, so the baseline follows Ordway through the day.
+            self._baseline = 0.9 * self._baseline + 0.1 * latency
+
+    def _increase(self) -> Optional[ConcurrencyAdjustment]:
+        previous = self.limit
+
+        # Only grow while at least half of the current limit is being used.
+        if (self._in_flight + 1) * 2 < previous:
+            return None
+
+        self._limit = min(float(self.max_limit), self._limit + self.increase / previous)
+
+        if self.limit == previous:
+            return None
+
+        return ConcurrencyAdjustment(time(), previous, self.limit, "healthy")
+
+    def _decrease(self, reason: str) -> ConcurrencyAdjustment:
+        previous = self.limit
+
+        self._limit = max(float(self.min_limit), self._limit * self.decrease)
+        self._last_decrease = self._clock()
+
+        return ConcurrencyAdjustment(time(), previous, self.limit, reason)
+
+    def _record(self, adjustment: ConcurrencyAdjustment) -> None:
+        if adjustment.limit == adjustment.previous_limit:
+            return
+
+        logger.debug(
+            "Adjusted concurrency limit from %s to %s: %s.",
+            adjustment.previous_limit,
+            adjustment.limit,
+            adjustment.reason,
+        )
+
+        self.adjustments.append(adjustment)
+
+        if self.on_adjust is not None:
+            self.on_adjust(adjustment)
@@ -0,0 +1,174 @@
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional
+from itertools import islice
+
+from .exceptions import OrdwayClientException
+from .sync import parse_timestamp
+from .utils import parse_datetime
+
+# How many records go into each record batch, and Parquet row group.
+DEFAULT_CHUNK_ROWS = 50_000
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+    except ImportError as err:
+        raise OrdwayClientException(
+            "Exporting requires pyarrow. Please install it with `pip install ordway[parquet]`."
+        ) from err
+
+    return pyarrow
+
+
+def chunked(
+    records: Iterable[Mapping[str, Any]], size: int
+) -> Iterator[List[Mapping[str, Any]]]:
+    """ Groups `records` into lists of up to `size`, only holding one list at a time. """
+
+    if size < 1:
+        raise ValueError("`chunk_rows` must be at least 1.")
+
+    iterator = iter(records)
+
+    while True:
+        chunk = list(islice(iterator, size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _infer_schema(pa: Any, rows: List[Dict[str, Any]]) -> Any:
+    """Infers a schema from the first chunk of records.
+
+    Fields that are null throughout it become strings, since later chunks must match.
+    """
+
+    inferred = pa.RecordBatch.from_pylist(rows).schema
+
+    return pa.schema(
+        [
+            field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+            for field in inferred
+        ]
+    )
+
+
+def _parse_date(value: str) -> Any:
+    return parse_datetime(value).date()
+
+
+def _parse(pa: Any, schema: Any, rows: List[Dict[str, Any]]) -> None:
+    """ Parses Ordway's date and timestamp strings in the fields `schema` types as such. """
+
+    for field in schema:
+        if pa.types.is_timestamp(field.type):
+            parse: Any = parse_timestamp
+        elif pa.types.is_date(field.type):
+            parse = _parse_date
+        else:
+            continue
+
+        name = field.name
+
+        for row in rows:
+            value = row.get(name)
+
+            if isinstance(value, str):
+                row[name] = parse(value) if value else None
+
+
+def iter_record_batches(
+    records: Iterable[Mapping[str, Any]],
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    schema: Any = None,
+) -> Iterator[Any]:
+    """Converts `records` into `pyarrow.RecordBatch`es of up to `chunk_rows` rows each.
+
+    Without a `schema`, it's inferred from the first batch, and later batches are built
+    to match it: fields missing from a record are null, and a field first showing up in a
+    later batch raises `OrdwayClientException` rather than being dropped. Fields a passed
+    `schema` lacks are left out. Date and timestamp fields of a `schema` are parsed from
+    Ordway's strings.
+    """
+
+    # Checked before the first batch is asked for, so a missing pyarrow is reported early.
+    return _record_batches(_pyarrow(), records, chunk_rows, schema)
+
+
+def _record_batches(
+    pa: Any, records: Iterable[Mapping[str, Any]], chunk_rows: int, schema: Any
+) -> Iterator[Any]:
+    # The names of an inferred schema, which later chunks mustn't have fields beyond.
+    inferred: Optional[FrozenSet[str]] = None
+
+    for chunk in chunked(records, chunk_rows):
+        rows = [
+            dict(record.to_dict() if hasattr(record, "to_dict") else record)
+            for record in chunk
+        ]
+
+        if schema is None:
+            schema = _infer_schema(pa, rows)
+            inferred = frozenset(schema.names)
+        elif inferred is not None:
+            missing = {key for row in rows for key in row} - inferred
+
+            if missing:
+                raise OrdwayClientException(
+                    f"Records have fields the first chunk didn't ({', '.join(sorted(missing))}), "
+                    "pass a schema with them as `schema=...`."
+                )
+
+        _parse(pa, schema, rows)
+
+        try:
+            yield pa.RecordBatch.from_pylist(rows, schema=schema)
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as err:
+            raise OrdwayClientException(
+                f"Records don't match the export's schema, pass one with `schema=...`: {err}"
+            ) from err
+
+
+def write_parquet(
+    records: Iterable[Mapping[str, Any]],
+    path: str,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    schema: Any = None,
+    compression: str = "snappy",
+) -> int:
+    """Writes `records` to a Parquet file at `path`, one row group per `chunk_rows` records.
+
+    Only one chunk is held in memory at a time. Returns how many records were written.
+    """
+
+    pa = _pyarrow()
+
+    import pyarrow.parquet as pq  # pylint: disable=import-outside-toplevel
+
+    writer = None
+    rows = 0
+
+    try:
+        for batch in iter_record_batches(records, chunk_rows, schema):
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema, compression=compression)
+
+            writer.write_table(
+                pa.Table.from_batches([batch]), row_group_size=chunk_rows
+            )
+            rows += batch.num_rows
+
+        if writer is None:
+            # Nothing to export, still leave a valid (empty) file behind.
+            writer = pq.ParquetWriter(
+                path,
+                pa.schema([]) if schema is None else schema,
+                compression=compression,
+            )
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return rows
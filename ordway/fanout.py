@@ -0,0 +1,295 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from collections import deque
+from functools import partial
+from concurrent.futures import Future, ProcessPoolExecutor
+from uuid import uuid4
+import os
+
+from .pagination import Window, split_window
+
+if TYPE_CHECKING:
+    from .api.base import ListAPIMixin  # pylint: disable=cyclic-import
+    from .client import OrdwayClient  # pylint: disable=cyclic-import
+
+T = TypeVar("T")
+
+
+class PageRange(NamedTuple):
+    """ `pages` pages of a scan, starting with page `first`. """
+
+    first: int
+    pages: int
+
+
+# Either a range of pages or a date window.
+Shard = Union[PageRange, Window]
+
+
+class _ScanOptions(NamedTuple):
+    attribute: str
+    size: int
+    sort: str
+    filters: Dict[str, str]
+    ascending: bool
+    model: bool
+    partition_by: Optional[str]
+    page_budget: int
+
+
+# The client of the latest fan-out a worker process took part in, by the fan-out's key.
+_worker_client: Optional[Tuple[str, "OrdwayClient"]] = None
+
+
+def _client(
+    key: str, client_class: Type["OrdwayClient"], state: Dict[str, Any]
+) -> "OrdwayClient":
+    """ The worker's client for fan-out `key`, built once per worker, so its connections are reused. """
+
+    global _worker_client  # pylint: disable=global-statement
+
+    if _worker_client is None or _worker_client[0] != key:
+        client = client_class.__new__(client_class)
+        client.__setstate__(state)
+        _worker_client = (key, client)
+
+    return _worker_client[1]
+
+
+def _read_pages(  # pylint: disable=protected-access
+    endpoint: "ListAPIMixin", shard: PageRange, options: _ScanOptions
+) -> Tuple[List[Dict[str, Any]], int, bool]:
+    """ The records of `shard`'s pages, how many pages held them, and whether the collection ended among them. """
+
+    records: List[Dict[str, Any]] = []
+
+    for page in range(shard.first, shard.first + shard.pages):
+        results = endpoint._list_page(
+            page, options.size, options.sort, options.filters, options.ascending
+        )
+
+        # Ordway may cap pages below `size`, so only an empty page ends the collection.
+        if not results:
+            return records, page - shard.first, True
+
+        records.extend(results)
+
+    return records, shard.pages, False
+
+
+def _process_shard(  # pylint: disable=too-many-arguments,protected-access
+    key: str,
+    client_class: Type["OrdwayClient"],
+    state: Dict[str, Any],
+    options: _ScanOptions,
+    process: Callable[[Any], T],
+    shard: Shard,
+) -> Tuple[Optional[List[T]], int, bool]:
+    """Runs in a worker process, fetching `shard` and calling `process` on every record.
+
+    Returns None for a window holding more than `page_budget` pages, which is split, along
+    with how many pages of records were read and whether the collection ended.
+    """
+
+    endpoint = getattr(_client(key, client_class, state), options.attribute)
+    end = False
+
+    if isinstance(shard, PageRange):
+        records: Optional[Iterable[Any]]
+        records, pages, end = _read_pages(endpoint, shard, options)
+    else:
+        records, pages = endpoint._scan_window(
+            shard,
+            options.partition_by,
+            options.size,
+            options.sort,
+            options.filters,
+            options.ascending,
+            options.page_budget,
+        )
+
+        if records is None:
+            return None, pages, False
+
+    if options.model:
+        records = map(endpoint.model.from_dict, records)
+
+    return [process(record) for record in records], pages, end
+
+
+def _page_ranges(
+    endpoint: "ListAPIMixin", pages_per_shard: int, ignore_max_pages: bool
+) -> Iterator[PageRange]:
+    first = 1
+
+    # pylint: disable=protected-access
+    while not endpoint._reached_max_pages(first, ignore_max_pages, warn=False):
+        last = first + pages_per_shard
+
+        if not ignore_max_pages:
+            last = min(last, endpoint.MAX_PAGES)
+
+        yield PageRange(first, last - first)
+
+        first = last
+
+
+def _attribute(endpoint: "ListAPIMixin") -> str:
+    """ The name of the client attribute holding `endpoint`, to find it on workers' clients. """
+
+    for name, value in vars(endpoint.client).items():
+        if value is endpoint:
+            return name
+
+    raise ValueError(
+        f'The "{endpoint.collection}" endpoint isn\'t an attribute of its client.'
+    )
+
+
+def fan_out(  # pylint: disable=too-many-arguments,too-many-locals
+    endpoint: "ListAPIMixin",
+    process: Callable[[Any], T],
+    partition_by: Optional[str] = None,
+    windows: Union[int, Iterable[Tuple[Any, Any]]] = 8,
+    pages_per_shard: int = 10,
+    processes: Optional[int] = None,
+    executor: Optional[ProcessPoolExecutor] = None,
+    size: Optional[int] = None,
+    sort: str = "",
+    filters: Optional[Dict[str, Any]] = None,
+    ascending: bool = False,
+    model: bool = False,
+    ignore_max_pages: bool = False,
+    page_budget: Optional[int] = None,
+) -> Iterator[T]:
+    """Shards a scan of `endpoint` across processes, each fetching and processing its shards.
+
+    For CPU-bound processing of records, which threads can't speed up. Every record is
+    passed to `process` in a worker process, and what it returns is sent back. Shards are
+    ranges of `pages_per_shard` pages or, with `partition_by`, date `windows`, split like
+    `all(partition_by=...)` splits them. Each shard's results are yielded in order as soon
+    as it's done, with up to `processes` shards in flight, so only those are ever held.
+
+    Workers get a pickled copy of the client (see `OrdwayClient`), with a session of their
+    own, so `process` and its results must be picklable too, e.g. a module-level function.
+    Runs on a new `ProcessPoolExecutor` of `processes` workers (by default, one per CPU),
+    or on `executor`, which is left running. Other arguments are the same as `all`'s.
+    """
+
+    if pages_per_shard < 1:
+        raise ValueError("`pages_per_shard` must be at least 1.")
+
+    # pylint: disable=protected-access
+    client = endpoint.client
+    in_flight = processes or os.cpu_count() or 1
+    options = _ScanOptions(
+        _attribute(endpoint),
+        endpoint._page_size(size),
+        sort,
+        {} if filters is None else {k: str(v) for k, v in filters.items()},
+        ascending,
+        model,
+        partition_by,
+        endpoint.PARTITION_PAGE_BUDGET if page_budget is None else page_budget,
+    )
+    shards: Callable[[], Iterable[Shard]]
+
+    if partition_by is None:
+        # Pages past the documented limit may be capped, which would shift page ranges.
+        options = options._replace(size=min(options.size, endpoint.MAX_PAGE_SIZE))
+        shards = partial(_page_ranges, endpoint, pages_per_shard, ignore_max_pages)
+    else:
+        options = options._replace(sort=sort or partition_by)
+        shards = partial(endpoint._windows, partition_by, windows, filters)
+
+    return _fan_out(
+        endpoint,
+        executor,
+        shards,
+        in_flight,
+        (uuid4().hex, type(client), client.__getstate__(), options, process),
+    )
+
+
+def _fan_out(  # pylint: disable=too-many-locals
+    endpoint: "ListAPIMixin",
+    executor: Optional[ProcessPoolExecutor],
+    shards: Callable[[], Iterable[Shard]],
+    in_flight: int,
+    arguments: Tuple[Any, ...],
+) -> Iterator[T]:
+    """Keeps up to `in_flight` shards in flight, yielding their results in order.
+
+    Like `_partitioned`, windows holding too many pages are halved and scanned again.
+    The pages workers read are reported to `endpoint`'s client once the scan is over.
+    """
+
+    pool = ProcessPoolExecutor(max_workers=in_flight) if executor is None else executor
+    pending = iter(shards())
+    work = partial(_process_shard, *arguments)
+
+    def submit(shard: Shard) -> "Future[Tuple[Optional[List[T]], int, bool]]":
+        return pool.submit(work, shard)
+
+    # Every entry is a shard and the future processing it, in scan order.
+    queue: Deque[Tuple[Shard, "Future[Tuple[Optional[List[T]], int, bool]]"]] = deque()
+    ended = False
+    pages = 0
+
+    try:
+        while True:
+            while not ended and len(queue) < in_flight:
+                shard = next(pending, None)
+
+                if shard is None:
+                    ended = True
+                else:
+                    queue.append((shard, submit(shard)))
+
+            if not queue:
+                return
+
+            shard, future = queue.popleft()
+            results, read, end = future.result()
+            pages += read
+
+            if results is None:
+                queue.extendleft(
+                    (half, submit(half))
+                    for half in reversed(split_window(shard, 2))  # type: ignore
+                )
+
+                continue
+
+            if end:
+                # Every later page range is past the end of the collection.
+                ended = True
+
+                for _, later in queue:
+                    later.cancel()
+
+                queue.clear()
+
+            yield from results
+    finally:
+        for _, future in queue:
+            future.cancel()
+
+        if executor is None:
+            pool.shutdown(wait=True)
+
+        endpoint._observe_pages(pages)  # pylint: disable=protected-access
@@ -0,0 +1,291 @@
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from bisect import bisect_left
+from threading import Lock
+from urllib.parse import urlsplit
+import re
+
+# Seconds.
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_PAGE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+_VERSION_SEGMENT = re.compile(r"v\d+")
+
+
+def collection_from_url(url: str) -> str:
+    """ Returns the collection an Ordway API URL belongs to, e.g. `customers` for `.../v1/customers/C-1`. """
+
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+
+    for index, segment in enumerate(segments[:-1]):
+        if _VERSION_SEGMENT.fullmatch(segment):
+            return segments[index + 1]
+
+    return segments[-1] if segments else ""
+
+
+def request_size(body: Any) -> int:
+    """ The size of a request body, when it's already encoded. """
+
+    return len(body) if isinstance(body, (bytes, str)) else 0
+
+
+class HistogramSnapshot(NamedTuple):
+    """ Cumulative counts of observations less than or equal to each bucket's upper bound. """
+
+    buckets: Tuple[float, ...]
+    counts: Tuple[int, ...]
+    sum: float
+    samples: int
+
+
+class Metrics:
+    """The metrics interface `OrdwayClient` reports every API call to.
+
+    This base class records nothing, and is the default. Clients skip timing requests
+    altogether while `enabled` is False, so it costs next to nothing.
+    """
+
+    enabled = False
+
+    def observe_request(  # pylint: disable=too-many-arguments
+        self,
+        collection: str,
+        method: str,
+        status: Optional[int],
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        """ Records a request. `status` is None when no response was received. """
+
+    def observe_retry(
+        self, collection: str, method: str, reason: str, backoff: float
+    ) -> None:
+        """ Records a retry made for `reason` (a status code or error), after waiting `backoff` seconds. """
+
+    def observe_pages(self, collection: str, pages: int) -> None:
+        """ Records how many pages a scan of `collection`, such as `all()` or `fan_out()`, read. """
+
+    def after_fork(self) -> None:
+        """ Resets state a forked child can't share with its parent, such as locks and threads. """
+
+
+class _Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+
+        if index < len(self.counts):
+            self.counts[index] += 1
+
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> HistogramSnapshot:
+        cumulative: List[int] = []
+        total = 0
+
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+
+        return HistogramSnapshot(self.buckets, tuple(cumulative), self.sum, self.count)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str], **extra: str) -> str:
+    pairs = list(zip(names, values)) + list(extra.items())
+
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class InMemoryMetrics(Metrics):  # pylint: disable=too-many-instance-attributes
+    """Keeps metrics in memory, ready to be scraped with `to_prometheus`.
+
+    - `ordway_request_duration_seconds`: latency histogram by collection and method.
+    - `ordway_requests_total`: requests by collection, method and status ("error" without a response).
+    - `ordway_request_bytes_total`/`ordway_response_bytes_total`: body sizes by collection and method.
+    - `ordway_retries_total`: retries by collection, method and reason.
+    - `ordway_retry_backoff_seconds_total`: time spent waiting between retries.
+    - `ordway_pages_per_scan`: histogram of the pages requested per `all()` call.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        page_buckets: Sequence[float] = DEFAULT_PAGE_BUCKETS,
+        prefix: str = "ordway",
+    ):
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self.page_buckets = tuple(sorted(page_buckets))
+        self.prefix = prefix
+
+        self._lock = Lock()
+        self._latency: Dict[Tuple[str, str], _Histogram] = {}
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._request_bytes: Dict[Tuple[str, str], int] = {}
+        self._response_bytes: Dict[Tuple[str, str], int] = {}
+        self._retries: Dict[Tuple[str, str, str], int] = {}
+        self._backoff: Dict[Tuple[str, str], float] = {}
+        self._pages: Dict[Tuple[str], _Histogram] = {}
+
+    def observe_request(  # pylint: disable=too-many-arguments
+        self,
+        collection: str,
+        method: str,
+        status: Optional[int],
+        seconds: float,
+        request_bytes: int,
+        response_bytes: int,
+    ) -> None:
+        key = (collection, method)
+        status_key = (collection, method, "error" if status is None else str(status))
+
+        with self._lock:
+            histogram = self._latency.get(key)
+
+            if histogram is None:
+                histogram = self._latency[key] = _Histogram(self.latency_buckets)
+
+            histogram.observe(seconds)
+
+            self._requests[status_key] = self._requests.get(status_key, 0) + 1
+            self._request_bytes[key] = self._request_bytes.get(key, 0) + request_bytes
+            self._response_bytes[key] = (
+                self._response_bytes.get(key, 0) + response_bytes
+            )
+
+    def observe_retry(
+        self, collection: str, method: str, reason: str, backoff: float
+    ) -> None:
+        key = (collection, method)
+        reason_key = (collection, method, reason)
+
+        with self._lock:
+            self._retries[reason_key] = self._retries.get(reason_key, 0) + 1
+            self._backoff[key] = self._backoff.get(key, 0.0) + backoff
+
+    def observe_pages(self, collection: str, pages: int) -> None:
+        key = (collection,)
+
+        with self._lock:
+            histogram = self._pages.get(key)
+
+            if histogram is None:
+                histogram = self._pages[key] = _Histogram(self.page_buckets)
+
+            histogram.observe(pages)
+
+    def after_fork(self) -> None:
+        self._lock = Lock()
+
+    def snapshot(self) -> Dict[str, Dict[Any, Any]]:
+        """ Returns a copy of every metric, keyed by name and then by label values. """
+
+        with self._lock:
+            return {
+                "request_duration_seconds": {
+                    key: histogram.snapshot()
+                    for key, histogram in self._latency.items()
+                },
+                "requests_total": dict(self._requests),
+                "request_bytes_total": dict(self._request_bytes),
+                "response_bytes_total": dict(self._response_bytes),
+                "retries_total": dict(self._retries),
+                "retry_backoff_seconds_total": dict(self._backoff),
+                "pages_per_scan": {
+                    key: histogram.snapshot() for key, histogram in self._pages.items()
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        """ Renders every metric in the Prometheus text exposition format. """
+
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        def counter(name: str, labels: Sequence[str], help_text: str) -> None:
+            metric = f"{self.prefix}_{name}"
+
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+
+            for values, value in sorted(snapshot[name].items()):
+                lines.append(f"{metric}{_labels(labels, values)} {_format(value)}")
+
+        def histogram(name: str, labels: Sequence[str], help_text: str) -> None:
+            metric = f"{self.prefix}_{name}"
+
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} histogram")
+
+            for values, value in sorted(snapshot[name].items()):
+                if not isinstance(value, HistogramSnapshot):
+                    raise TypeError(
+                        f'"{name}" holds {type(value).__name__}, not histograms.'
+                    )
+
+                for bound, count in zip(value.buckets, value.counts):
+                    lines.append(
+                        f"{metric}_bucket{_labels(labels, values, le=_format(bound))} {count}"
+                    )
+
+                lines.append(
+                    f"{metric}_bucket{_labels(labels, values, le='+Inf')} {value.samples}"
+                )
+                lines.append(
+                    f"{metric}_sum{_labels(labels, values)} {_format(value.sum)}"
+                )
+                lines.append(f"{metric}_count{_labels(labels, values)} {value.samples}")
+
+        histogram(
+            "request_duration_seconds",
+            ("collection", "method"),
+            "Time until Ordway's response was received, including its body unless it was streamed.",
+        )
+        counter(
+            "requests_total",
+            ("collection", "method", "status"),
+            "Requests sent to Ordway.",
+        )
+        counter(
+            "request_bytes_total",
+            ("collection", "method"),
+            "Bytes of request bodies sent to Ordway.",
+        )
+        counter(
+            "response_bytes_total",
+            ("collection", "method"),
+            "Bytes of response bodies received from Ordway.",
+        )
+        counter(
+            "retries_total",
+            ("collection", "method", "reason"),
+            "Requests retried.",
+        )
+        counter(
+            "retry_backoff_seconds_total",
+            ("collection", "method"),
+            "Seconds spent waiting before retries.",
+        )
+        histogram(
+            "pages_per_scan",
+            ("collection",),
+            "Pages read by a single all() call or fan-out.",
+        )
+
+        return "\n".join(lines) + "\n"
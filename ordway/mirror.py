@@ -0,0 +1,336 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from logging import getLogger
+import json
+import sqlite3
+
+from .exceptions import OrdwayClientException
+from .sqlite import SQLiteDatabase
+from .sync import CheckpointStore, SyncCheckpoint
+from .utils import split_filter
+
+if TYPE_CHECKING:
+    from .api.base import ListAPIMixin
+
+logger = getLogger(__name__)
+
+DEFAULT_COLUMNS = ("customer_id", "status", "created_date", "updated_date")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    collection TEXT PRIMARY KEY,
+    high_water_mark TEXT NOT NULL,
+    boundary_ids TEXT NOT NULL
+);
+"""
+
+
+def _quote(name: str) -> str:
+    """ Quotes a collection or field name for use as a SQLite identifier. """
+
+    if not name.isidentifier():
+        raise OrdwayClientException(f'"{name}" cannot be used as a mirror column.')
+
+    return f'"{name}"'
+
+
+def _table(collection: str) -> str:
+    return _quote(f"mirror_{collection}")
+
+
+def _column_value(value: Any) -> Any:
+    """ Indexed columns hold scalars as they are, and anything else as JSON. """
+
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+
+    return json.dumps(value, sort_keys=True)
+
+
+class _MirrorCheckpointStore(CheckpointStore):
+    """Keeps sync checkpoints in the mirror's database.
+
+    Saving a checkpoint commits the transaction holding the records synced since the
+    last one, so records and checkpoints can never disagree after a crash.
+    """
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+    def load(self, collection: str) -> Optional[SyncCheckpoint]:
+        row = self.connection.execute(
+            "SELECT high_water_mark, boundary_ids FROM checkpoints WHERE collection = ?",
+            (collection,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        return SyncCheckpoint(collection, row[0], frozenset(json.loads(row[1])))
+
+    def save(self, checkpoint: SyncCheckpoint) -> None:
+        if not self.connection.in_transaction:
+            self.connection.execute("BEGIN IMMEDIATE")
+
+        self.connection.execute(
+            "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)",
+            (
+                checkpoint.collection,
+                checkpoint.high_water_mark,
+                json.dumps(sorted(checkpoint.boundary_ids)),
+            ),
+        )
+        self.connection.execute("COMMIT")
+
+
+class Mirror:
+    """Materializes `ListAPIMixin` collections into a local SQLite database and answers queries from it.
+
+    Every record is stored as JSON. The fields in `columns` for its collection (or
+    `DEFAULT_COLUMNS`) are also copied into indexed columns, which is what `query` can
+    filter and sort on. `refresh` is incremental, built on `ListAPIMixin.sync`.
+
+    Ordway doesn't report deleted resources, so an incremental refresh never removes a
+    record. Refresh with `full=True` now and then to drop them.
+
+        mirror = Mirror("ordway.sqlite", columns={"invoices": ("customer_id", "status", "invoice_date")})
+        mirror.refresh(client.invoices)
+        mirror.query("invoices", filters={"status": "Paid", "invoice_date>=": "2021-01-01"})
+    """
+
+    def __init__(
+        self,
+        path: str,
+        columns: Optional[Dict[str, Sequence[str]]] = None,
+        timeout: float = 30.0,
+    ):
+        self.columns = {} if columns is None else columns
+
+        self._database = SQLiteDatabase(path, timeout=timeout)
+        self._database.connection().executescript(_SCHEMA)
+        self._ready: Dict[str, Tuple[str, ...]] = {}
+
+    def columns_for(self, collection: str) -> Tuple[str, ...]:
+        """ The indexed columns of `collection`. """
+
+        return tuple(self.columns.get(collection, DEFAULT_COLUMNS))
+
+    def _ensure_table(self, collection: str) -> Tuple[str, ...]:
+        """ Creates the table of `collection`, adding and backfilling any newly configured columns. """
+
+        columns = self.columns_for(collection)
+
+        if self._ready.get(collection) == columns:
+            return columns
+
+        table = _table(collection)
+
+        with self._database.transaction() as connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+
+            existing = {
+                row[1] for row in connection.execute(f"PRAGMA table_info({table})")
+            }
+            added = [column for column in columns if column not in existing]
+
+            for column in added:
+                connection.execute(f"ALTER TABLE {table} ADD COLUMN {_quote(column)}")
+
+            if added:
+                rows = connection.execute(f"SELECT id, data FROM {table}").fetchall()
+                assignments = ", ".join(f"{_quote(column)} = ?" for column in added)
+
+                connection.executemany(
+                    f"UPDATE {table} SET {assignments} WHERE id = ?",
+                    (
+                        (
+                            *(
+                                _column_value(json.loads(data).get(column))
+                                for column in added
+                            ),
+                            id,
+                        )
+                        for id, data in rows
+                    ),
+                )
+
+            for column in columns:
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {_quote(f'mirror_{collection}_{column}')} "
+                    f"ON {table} ({_quote(column)})"
+                )
+
+        self._ready[collection] = columns
+
+        return columns
+
+    def refresh(
+        self, interface: "ListAPIMixin", full: bool = False, size: int = 50
+    ) -> int:
+        """Brings the mirror of `interface`'s collection up to date, returning how many records were stored.
+
+        Records are committed together with the sync checkpoint after every page, so an
+        interrupted refresh picks up where it stopped. With `full`, the collection is
+        dropped and mirrored from scratch.
+        """
+
+        collection = interface.collection
+        columns = self._ensure_table(collection)
+        table = _table(collection)
+
+        if full:
+            with self._database.transaction() as connection:
+                connection.execute(f"DELETE FROM {table}")
+                connection.execute(
+                    "DELETE FROM checkpoints WHERE collection = ?", (collection,)
+                )
+
+        connection = self._database.connection()
+        names = ", ".join(_quote(column) for column in ("id", "data") + columns)
+        placeholders = ", ".join("?" for _ in range(len(columns) + 2))
+        insert = f"INSERT OR REPLACE INTO {table} ({names}) VALUES ({placeholders})"
+        count = 0
+
+        try:
+            for record in interface.sync(
+                checkpoint_store=_MirrorCheckpointStore(connection), size=size
+            ):
+                if "id" not in record:
+                    raise OrdwayClientException(
+                        f'Cannot mirror "{collection}", a resource has no `id`.'
+                    )
+
+                if not connection.in_transaction:
+                    connection.execute("BEGIN IMMEDIATE")
+
+                connection.execute(
+                    insert,
+                    (
+                        str(record["id"]),
+                        json.dumps(record),
+                        *(_column_value(record.get(column)) for column in columns),
+                    ),
+                )
+                count += 1
+        finally:
+            if connection.in_transaction:
+                # Records past the last checkpoint will be synced again.
+                connection.execute("ROLLBACK")
+
+        logger.debug('Mirrored %s "%s" records.', count, collection)
+
+        return count
+
+    def _where(
+        self, collection: str, filters: Optional[Dict[str, Any]]
+    ) -> Tuple[str, List[Any]]:
+        columns = ("id",) + self.columns_for(collection)
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        for key, value in (filters or {}).items():
+            field, operator = split_filter(key)
+
+            if field not in columns:
+                raise OrdwayClientException(
+                    f'Cannot filter "{collection}" on "{field}", it isn\'t one of the mirror\'s columns.'
+                )
+
+            column = _quote(field)
+
+            if value is None and operator in ("=", "!="):
+                clauses.append(f"{column} IS {'NOT ' if operator == '!=' else ''}NULL")
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                values = [_column_value(item) for item in value]
+                negate = "NOT " if operator == "!=" else ""
+
+                clauses.append(
+                    f"{column} {negate}IN ({', '.join('?' for _ in values)})"
+                )
+                params.extend(values)
+            else:
+                clauses.append(f"{column} {operator} ?")
+                params.append(_column_value(value))
+
+        return (f" WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def query(  # pylint: disable=too-many-arguments
+        self,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = "id",
+        ascending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Returns the mirrored records of `collection` matching `filters`.
+
+        Filters are written like Ordway's, e.g. `{"status": "Paid", "updated_date>=": "2021-01-01"}`,
+        and a list value matches any of its items. `sort` is a comma separated list of
+        columns. Only `id` and the collection's indexed columns can be filtered or sorted on.
+        """
+
+        columns = self._ensure_table(collection)
+        where, params = self._where(collection, filters)
+
+        sort_columns = [column.strip() for column in sort.split(",") if column.strip()]
+
+        for column in sort_columns:
+            if column not in ("id",) + columns:
+                raise OrdwayClientException(
+                    f'Cannot sort "{collection}" on "{column}", it isn\'t one of the mirror\'s columns.'
+                )
+
+        direction = "ASC" if ascending else "DESC"
+        order = ", ".join(f"{_quote(column)} {direction}" for column in sort_columns)
+        sql = f"SELECT data FROM {_table(collection)}{where}"
+
+        if order:
+            sql += f" ORDER BY {order}"
+
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend((-1 if limit is None else limit, offset))
+
+        return [
+            json.loads(row[0])
+            for row in self._database.connection().execute(sql, params)
+        ]
+
+    def count(self, collection: str, filters: Optional[Dict[str, Any]] = None) -> int:
+        """ Returns how many mirrored records of `collection` match `filters`. """
+
+        self._ensure_table(collection)
+        where, params = self._where(collection, filters)
+
+        return (
+            self._database.connection()
+            .execute(f"SELECT COUNT(*) FROM {_table(collection)}{where}", params)
+            .fetchone()[0]
+        )
+
+    def get(self, collection: str, id: str) -> Optional[Dict[str, Any]]:
+        """ Returns the mirrored record `id` of `collection`, if any. """
+
+        records = self.query(collection, filters={"id": id})
+
+        return records[0] if records else None
+
+    def checkpoint(self, collection: str) -> Optional[SyncCheckpoint]:
+        """ Returns how far `collection` has been mirrored. """
+
+        return _MirrorCheckpointStore(self._database.connection()).load(collection)
+
+    def close(self) -> None:
+        """ Closes the calling thread's connection. """
+
+        self._database.close()
@@ -0,0 +1,505 @@
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from sys import intern
+import json
+import zlib
+
+from .codec import encode_default
+
+R = TypeVar("R", bound="Record")
+
+# Values repeated across most records of every collection.
+COMMON_INTERNED = frozenset(
+    {"status", "currency", "customer_id", "created_by", "updated_by"}
+)
+
+
+# Nested values encoding to more bytes than this are compressed as well.
+COMPRESS_THRESHOLD = 512
+
+
+def _encode(value: Any) -> bytes:
+    encoded = json.dumps(
+        value, separators=(",", ":"), ensure_ascii=False, default=encode_default
+    ).encode("utf-8")
+
+    # JSON never starts with zlib's header byte, so compressed values are told apart by it.
+    return zlib.compress(encoded, 1) if len(encoded) > COMPRESS_THRESHOLD else encoded
+
+
+# Records block assignment, so their slots are filled through `object`.
+_set = object.__setattr__
+
+
+def _decode(encoded: bytes) -> Any:
+    if encoded[:1] == b"\x78":
+        encoded = zlib.decompress(encoded)
+
+    return json.loads(encoded)
+
+
+class _Nested:
+    """Exposes a nested field, kept as compact JSON until it's first read.
+
+    The encoded value lives in the slot `_<name>`, and is replaced by the decoded one.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.slot = f"_{name}"
+
+    def __get__(self, record: Optional["Record"], owner: type) -> Any:
+        if record is None:
+            return self
+
+        value = getattr(record, self.slot, None)
+
+        if isinstance(value, bytes):
+            value = _decode(value)
+            _set(record, self.slot, value)
+
+        return value
+
+
+def slots(fields: Tuple[str, ...], nested: Tuple[str, ...] = ()) -> Tuple[str, ...]:
+    """ The `__slots__` of a `Record` subclass with `fields` and `nested` fields. """
+
+    return fields + tuple(f"_{name}" for name in nested)
+
+
+class Record(Mapping):  # pylint: disable=too-many-ancestors
+    """A compact Ordway resource, in place of a dict.
+
+    Subclasses declare their `FIELDS` as `__slots__` (see `slots`), so records don't
+    each carry a dict of keys. `NESTED` fields, such as line items, are kept as compact
+    JSON, compressed past `COMPRESS_THRESHOLD` bytes, and only decoded when first read.
+    Strings in `INTERNED` and `COMMON_INTERNED` fields share a single copy between
+    records, as do dates in `*_date` fields. Any other field is kept in `extra`.
+
+    Fields are read as attributes (`invoice.status`, None when Ordway didn't return the
+    field) or like a dict (`invoice["status"]`), and `to_dict` returns the plain
+    resource. Records are read-only.
+    """
+
+    __slots__ = ("_extra",)
+
+    FIELDS: ClassVar[Tuple[str, ...]] = ()
+    NESTED: ClassVar[Tuple[str, ...]] = ()
+    INTERNED: ClassVar[FrozenSet[str]] = frozenset()
+
+    _fields: ClassVar[FrozenSet[str]] = frozenset()
+    _interned: ClassVar[FrozenSet[str]] = COMMON_INTERNED
+
+    _extra: Optional[Dict[str, Any]]
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)  # type: ignore
+
+        cls._fields = frozenset(cls.FIELDS + cls.NESTED)
+        cls._interned = COMMON_INTERNED | cls.INTERNED
+
+        for name in cls.NESTED:
+            setattr(cls, name, _Nested(name))
+
+    @classmethod
+    def from_dict(cls: Type[R], data: Mapping[str, Any]) -> R:
+        """ Builds a record from a resource as Ordway returns it. """
+
+        record = cls.__new__(cls)
+        fields = cls._fields
+        nested = cls.NESTED
+        interned = cls._interned
+        extra: Optional[Dict[str, Any]] = None
+
+        for key, value in data.items():
+            if key in fields:
+                if key in nested:
+                    _set(
+                        record,
+                        f"_{key}",
+                        _encode(value) if isinstance(value, (list, dict)) else value,
+                    )
+
+                    continue
+
+                if isinstance(value, str) and (
+                    key in interned or (len(value) == 10 and key.endswith("_date"))
+                ):
+                    value = intern(value)
+
+                _set(record, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+
+                extra[intern(key)] = value
+
+        _set(record, "_extra", extra)
+
+        return record
+
+    @property
+    def extra(self) -> Dict[str, Any]:
+        """ Fields returned by Ordway which aren't among the record's `FIELDS`. """
+
+        return {} if self._extra is None else self._extra
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} records are read-only.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} records are read-only.")
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for fields Ordway didn't return, as their slot is empty.
+        if name in self._fields:
+            return None
+
+        extra = self._extra
+
+        if extra is not None and name in extra:
+            return extra[name]
+
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def _has(self, key: str) -> bool:
+        slot = f"_{key}" if key in self.NESTED else key
+
+        try:
+            object.__getattribute__(self, slot)
+        except AttributeError:
+            return False
+
+        return True
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            if not self._has(key):
+                raise KeyError(key)
+
+            return getattr(self, key)
+
+        if self._extra is None:
+            raise KeyError(key)
+
+        return self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.FIELDS + self.NESTED:
+            if self._has(key):
+                yield key
+
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, str) and key in self._fields:
+            return self._has(key)
+
+        return self._extra is not None and key in self._extra
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ The record as a plain dict, like the resource Ordway returned. """
+
+        return {key: self[key] for key in self}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        restored = self.from_dict(state)
+
+        for slot in slots(self.FIELDS, self.NESTED) + ("_extra",):
+            try:
+                _set(self, slot, object.__getattribute__(restored, slot))
+            except AttributeError:
+                pass
+
+
+_TIMESTAMPS = ("created_date", "updated_date")
+
+
+class Customer(Record):
+    FIELDS = (
+        "id",
+        "name",
+        "description",
+        "parent_customer",
+        "status",
+        "currency",
+        "website",
+        "payment_terms",
+        "billing_batch",
+        "balance",
+        "unbilled",
+        "created_by",
+        "updated_by",
+        *_TIMESTAMPS,
+    )
+    NESTED = ("contacts", "billing_contact", "shipping_contact", "custom_fields")
+    INTERNED = frozenset({"payment_terms", "billing_batch", "parent_customer"})
+    __slots__ = slots(FIELDS, NESTED)
+
+
+class Product(Record):
+    FIELDS = (
+        "id",
+        "name",
+        "description",
+        "sku",
+        "status",
+        "product_type",
+        "income_account",
+        "created_by",
+        "updated_by",
+        *_TIMESTAMPS,
+    )
+    NESTED = ("custom_fields",)
+    INTERNED = frozenset({"product_type", "income_account"})
+    __slots__ = slots(FIELDS, NESTED)
+
+
+class Plan(Record):
+    FIELDS = (
+        "id",
+        "name",
+        "description",
+        "status",
+        "currency",
+        "created_by",
+        "updated_by",
+        *_TIMESTAMPS,
+    )
+    NESTED = ("charges", "custom_fields")
+    __slots__ = slots(FIELDS, NESTED)
+
+
+class Subscription(Record):
+    FIELDS = (
+        "id",
+        "customer_id",
+        "billing_contact_id",
+        "shipping_contact_id",
+        "status",
+        "currency",
+        "billing_start_date",
+        "service_start_date",
+        "contract_effective_date",
+        "cancellation_date",
+        "contract_term",
+        "renewal_term",
+        "auto_renew",
+        "separate_invoice",
+        "version",
+        "notes",
+        "created_by",
+        "updated_by",
+        *_TIMESTAMPS,
+    )
+    NESTED = ("plans", "custom_fields")
+    INTERNED = frozenset(
+        {"billing_contact_id", "shipping_contact_id", "contract_term", "renewal_term"}
+    )
+    __slots__ = slots(FIELDS, NESTED)
+
+
+class Order(Record):
+    FIELDS = (
+        "id",
+        "customer_id",
+        "status",
+        "currency",
+        "order_date",
+        "amount",
+        "notes",
+        "created_by",
+        "updated_by",
+        *_TIMESTAMPS,
+    )
+    NESTED = ("line_items", "custom_fields")
+    __slots__ = slots(FIELDS, NESTED)
+
+
+class Invoice(Record):
+    FIELDS = (
+        "id",
+        "customer_id",
+        "customer_name",
+        "billing_contact_id",
+        "status",
+        "currency",
+        "invoice_date",
+        "due_date",
+        "billing_period_start",
+        "billing_period_end",
+        "subtotal",
+        "invoice_tax",
+        "invoice_amount",
+        "paid_amount",
+        "balance",
+        "payment_terms",
+        "template_id",
+        "notes",
+        "created_by",
+        "updated_by",
+        *_TIMESTAMPS,
+    )
+    NESTED = ("line_items", "custom_fields")
+    INTERNED = frozenset(
+        {"customer_name", "billing_contact_id", "payment_terms", "template_id"}
+    )
+    __slots__ = slots(FIELDS, NESTED)
+
+
+class Payment(Record):
+    FIELDS = (
+        "id",
+        "customer_id",
+        "status",
+        "currency",
+        "payment_date",
+        "payment_type",
+        "payment_method",
+        "amount",
+        "fee_amount",
+        "applied_amount",
+        "unapplied_amount",
+        "reference_number",
+        "notes",
+        "created_by",
+        "updated_by",
+        *_TIMESTAMPS,
+    )
+    NESTED = ("applied_to", "custom_fields")
+    INTERNED = frozenset({"payment_type", "payment_method"})
+    __slots__ = slots(FIELDS, NESTED)
+
+
+class Credit(Record):
+    FIELDS = (
+        "id",
+        "customer_id",
+        "status",
+        "currency",
+        "credit_date",
+        "amount",
+        "applied_amount",
+        "unapplied_amount",
+        "notes",
+        "created_by",
+        "updated_by",
+        *_TIMESTAMPS,
+    )
+    NESTED = ("applied_to", "custom_fields")
+    __slots__ = slots(FIELDS, NESTED)
+
+
+class Refund(Record):
+    FIELDS = (
+        "id",
+        "customer_id",
+        "status",
+        "currency",
+        "refund_date",
+        "refund_type",
+        "amount",
+        "payment_id",
+        "credit_id",
+        "notes",
+        "created_by",
+        "updated_by",
+        *_TIMESTAMPS,
+    )
+    NESTED = ("custom_fields",)
+    INTERNED = frozenset({"refund_type"})
+    __slots__ = slots(FIELDS, NESTED)
+
+
+class Usage(Record):
+    FIELDS = (
+        "id",
+        "customer_id",
+        "subscription_id",
+        "charge_id",
+        "product_id",
+        "date",
+        "quantity",
+        "unit_of_measure",
+        "status",
+        "created_by",
+        "updated_by",
+        *_TIMESTAMPS,
+    )
+    NESTED = ("custom_fields",)
+    INTERNED = frozenset(
+        {"subscription_id", "charge_id", "product_id", "unit_of_measure"}
+    )
+    __slots__ = slots(FIELDS, NESTED)
+
+
+class BillingSchedule(Record):
+    FIELDS = (
+        "id",
+        "customer_id",
+        "subscription_id",
+        "charge_id",
+        "product_id",
+        "status",
+        "currency",
+        "billing_date",
+        "service_start_date",
+        "service_end_date",
+        "amount",
+        "invoice_id",
+        "created_by",
+        "updated_by",
+        *_TIMESTAMPS,
+    )
+    NESTED = ("custom_fields",)
+    INTERNED = frozenset({"subscription_id", "charge_id", "product_id"})
+    __slots__ = slots(FIELDS, NESTED)
+
+
+class RevenueSchedule(Record):
+    FIELDS = (
+        "id",
+        "customer_id",
+        "subscription_id",
+        "charge_id",
+        "product_id",
+        "invoice_id",
+        "revenue_rule_id",
+        "status",
+        "currency",
+        "start_date",
+        "end_date",
+        "total_amount",
+        "recognized_amount",
+        "unrecognized_amount",
+        "created_by",
+        "updated_by",
+        *_TIMESTAMPS,
+    )
+    NESTED = ("schedule", "custom_fields")
+    INTERNED = frozenset(
+        {"subscription_id", "charge_id", "product_id", "revenue_rule_id"}
+    )
+    __slots__ = slots(FIELDS, NESTED)
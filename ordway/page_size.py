@@ -0,0 +1,283 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from threading import Lock
+from logging import getLogger
+import json
+import os
+import tempfile
+
+logger = getLogger(__name__)
+
+# The page size of `list` and `all` calls which don't pass one, unless a `PageSizer` picks it.
+DEFAULT_PAGE_SIZE = 20
+
+
+class PageSizer:
+    """Picks the page size of `list` and `all` calls which don't pass `size`.
+
+    This base class always picks `DEFAULT_PAGE_SIZE`, within the collection's
+    `MAX_PAGE_SIZE`, and is the default. Pages aren't timed while `enabled` is False.
+    """
+
+    enabled = False
+
+    def size(self, collection: str, max_page_size: int) -> int:
+        """ The page size for a scan of `collection`, whose documented limit is `max_page_size`. """
+
+        return min(DEFAULT_PAGE_SIZE, max_page_size)
+
+    def max_page_size(self, collection: str, max_page_size: int) -> int:
+        """ The largest page size picked for `collection`, sizes callers pass being held to `max_page_size`. """
+
+        return max_page_size
+
+    def observe(  # pylint: disable=too-many-arguments
+        self,
+        collection: str,
+        size: int,
+        records: int,
+        seconds: float,
+        response_bytes: int,
+    ) -> None:
+        """ Records a page of `records`, requested with `size` and fetched in `seconds`. """
+
+    def observe_cap(self, collection: str, size: int) -> None:
+        """ Records that Ordway returns at most `size` records per page of `collection`. """
+
+    def after_fork(self) -> None:
+        """ Resets state a forked child can't share with its parent, such as locks and threads. """
+
+
+class _CollectionSizes:
+    """ What `AdaptivePageSizer` learned about a collection. """
+
+    def __init__(self):
+        self.cap: Optional[int] = None
+        # Records per second, and how many pages were measured, by page size.
+        self.rates: Dict[int, float] = {}
+        self.samples: Dict[int, int] = {}
+        self.bytes_per_record: Optional[float] = None
+        self.best: Optional[int] = None
+        # The collection's documented `MAX_PAGE_SIZE`, where scans start.
+        self.documented = DEFAULT_PAGE_SIZE
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cap": self.cap,
+            "rates": {str(size): rate for size, rate in self.rates.items()},
+            "samples": {str(size): count for size, count in self.samples.items()},
+            "bytes_per_record": self.bytes_per_record,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "_CollectionSizes":
+        sizes = cls()
+        sizes.cap = data.get("cap")
+        sizes.rates = {int(size): rate for size, rate in data["rates"].items()}
+        sizes.samples = {int(size): count for size, count in data["samples"].items()}
+        sizes.bytes_per_record = data.get("bytes_per_record")
+
+        return sizes
+
+
+class AdaptivePageSizer(PageSizer):
+    """Learns the page size that retrieves each collection fastest.
+
+    client = OrdwayClient(..., page_sizer=AdaptivePageSizer(path="page_sizes.json"))
+
+    Every full page fetched updates a moving average of records per second for its size.
+    Scans start at the collection's `MAX_PAGE_SIZE` and then try the neighbouring
+    `candidates`, settling on the fastest once both neighbours were measured
+    `min_samples` times. Sizes above `MAX_PAGE_SIZE` are tried as well: when Ordway
+    returns fewer records than asked for on a page that isn't the last, that's its real
+    limit, and larger sizes are never picked again. Sizes whose responses would exceed
+    `max_response_bytes`, going by the bytes per record seen so far, are skipped.
+
+    What was learned is kept for the sizer's lifetime, so it's shared by every scan of the
+    client. With `path`, it's also loaded from and saved to a JSON file, whenever a
+    collection's best size or limit changes.
+    """
+
+    enabled = True
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        candidates: Iterable[int] = (10, 20, 50, 100, 200, 500, 1000),
+        min_samples: int = 3,
+        smoothing: float = 0.3,
+        max_response_bytes: int = 8 * 1024 * 1024,
+        path: Optional[str] = None,
+    ):
+        self.candidates = sorted(set(candidates))
+        self.min_samples = min_samples
+        self.smoothing = smoothing
+        self.max_response_bytes = max_response_bytes
+        self.path = path
+
+        self._lock = Lock()
+        self._save_lock = Lock()
+        self._collections: Dict[str, _CollectionSizes] = {}
+
+        if path is not None:
+            self._collections = self._read(path)
+
+    def after_fork(self) -> None:
+        self._lock = Lock()
+        self._save_lock = Lock()
+
+    @staticmethod
+    def _read(path: str) -> Dict[str, _CollectionSizes]:
+        try:
+            with open(path, encoding="utf-8") as sizes_file:
+                data = json.load(sizes_file)
+        except FileNotFoundError:
+            return {}
+
+        return {
+            collection: _CollectionSizes.from_dict(sizes)
+            for collection, sizes in data.items()
+        }
+
+    def _candidates(self, sizes: _CollectionSizes) -> List[int]:
+        candidates = set(self.candidates) | {sizes.documented}
+
+        if sizes.cap is not None:
+            candidates = {size for size in candidates if size <= sizes.cap}
+            candidates.add(sizes.cap)
+
+        if sizes.bytes_per_record:
+            budget = self.max_response_bytes / sizes.bytes_per_record
+            candidates = {size for size in candidates if size <= budget} or {
+                min(candidates)
+            }
+
+        return sorted(candidates)
+
+    def _choose(self, sizes: _CollectionSizes) -> Tuple[int, int]:
+        """ Returns the size to use next, and the best measured so far. """
+
+        candidates = self._candidates(sizes)
+        measured = [size for size in candidates if size in sizes.rates]
+
+        if measured:
+            best = max(measured, key=sizes.rates.__getitem__)
+        else:
+            # Nothing measured yet, start from the largest size Ordway documents.
+            best = max(
+                [size for size in candidates if size <= sizes.documented],
+                default=candidates[0],
+            )
+
+        if sizes.samples.get(best, 0) < self.min_samples:
+            return best, best
+
+        index = candidates.index(best)
+
+        for neighbour in (index + 1, index - 1):
+            if (
+                0 <= neighbour < len(candidates)
+                and sizes.samples.get(candidates[neighbour], 0) < self.min_samples
+            ):
+                return candidates[neighbour], best
+
+        return best, best
+
+    def size(self, collection: str, max_page_size: int) -> int:
+        with self._lock:
+            sizes = self._collections.setdefault(collection, _CollectionSizes())
+            sizes.documented = max_page_size
+
+            return self._choose(sizes)[0]
+
+    def max_page_size(self, collection: str, max_page_size: int) -> int:
+        with self._lock:
+            sizes = self._collections.get(collection)
+            cap = None if sizes is None else sizes.cap
+
+        return max(self.candidates[-1], max_page_size) if cap is None else cap
+
+    def observe(  # pylint: disable=too-many-arguments
+        self,
+        collection: str,
+        size: int,
+        records: int,
+        seconds: float,
+        response_bytes: int,
+    ) -> None:
+        # Only full pages show how long a page of `size` takes.
+        if records < size or records == 0 or seconds <= 0:
+            return
+
+        with self._lock:
+            sizes = self._collections.setdefault(collection, _CollectionSizes())
+            rate = records / seconds
+            previous = sizes.rates.get(size)
+
+            sizes.rates[size] = (
+                rate
+                if previous is None
+                else previous + self.smoothing * (rate - previous)
+            )
+            sizes.samples[size] = sizes.samples.get(size, 0) + 1
+
+            if response_bytes > 0:
+                per_record = response_bytes / records
+                sizes.bytes_per_record = (
+                    per_record
+                    if sizes.bytes_per_record is None
+                    else sizes.bytes_per_record
+                    + self.smoothing * (per_record - sizes.bytes_per_record)
+                )
+
+            best = self._choose(sizes)[1]
+            changed = best != sizes.best
+            sizes.best = best
+
+        if changed:
+            self._save()
+
+    def observe_cap(self, collection: str, size: int) -> None:
+        with self._lock:
+            sizes = self._collections.setdefault(collection, _CollectionSizes())
+
+            if sizes.cap is not None and sizes.cap <= size:
+                return
+
+            logger.info(
+                'Ordway returns at most %s records per page of "%s".', size, collection
+            )
+
+            sizes.cap = size
+
+            for larger in [measured for measured in sizes.rates if measured > size]:
+                del sizes.rates[larger]
+                sizes.samples.pop(larger, None)
+
+        self._save()
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                collection: sizes.to_dict()
+                for collection, sizes in self._collections.items()
+            }
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+
+        # Saves happen one at a time, so an older state never replaces a newer one.
+        with self._save_lock:
+            data = self.to_dict()
+            descriptor, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp"
+            )
+
+            try:
+                with os.fdopen(descriptor, "w", encoding="utf-8") as temp_file:
+                    json.dump(data, temp_file, indent=2, sort_keys=True)
+
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+
+                raise
@@ -0,0 +1,305 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from contextlib import closing
+from datetime import date, datetime, time, timedelta, timezone
+from itertools import islice
+
+from .sync import parse_timestamp
+
+if TYPE_CHECKING:
+    from .api.base import ListAPIMixin  # pylint: disable=cyclic-import
+
+T = TypeVar("T")
+
+# A half-open range of timestamps, [start, end).
+Window = Tuple[datetime, datetime]
+
+# Windows this short aren't split any further, however many records they hold.
+MIN_WINDOW = timedelta(seconds=1)
+
+
+class ScanCursor(NamedTuple):
+    """Where an `all()` scan of a collection is at, to resume it with `all(resume_from=...)`.
+
+    `page` is the page the scan's next record is on, `offset` how many records of `page`
+    were already yielded, which are skipped when resuming, and `yielded` how many records
+    the scan yielded in total. Both are tracked as pages are read, rather than worked out
+    from `yielded`, since Ordway may return fewer than `size` records per page.
+    """
+
+    collection: str
+    sort: str
+    filters: Dict[str, str]
+    ascending: bool
+    size: int
+    page: int = 1
+    yielded: int = 0
+    offset: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScanCursor":
+        page = data["page"]
+        offset = data.get("offset")
+
+        if offset is None:
+            # Cursors persisted without an offset assumed pages of exactly `size` records.
+            offset = data["yielded"] - (page - 1) * data["size"]
+
+        return cls(
+            data["collection"],
+            data["sort"],
+            dict(data["filters"]),
+            data["ascending"],
+            data["size"],
+            page,
+            data["yielded"],
+            offset,
+        )
+
+
+class Scan(Generator[T, None, None]):
+    """The records of an `all()` scan, with a `cursor` tracking how far it got.
+
+    `cursor` can be persisted at any point, including after the scan failed, and passed
+    to `all(resume_from=...)` to carry on from the next record. It's None for scans that
+    can't be resumed, such as partitioned ones.
+    """
+
+    def __init__(self, records: Iterator[T], paginator: Optional["Paginator"]):
+        self._records = records
+        self._paginator = paginator
+
+    @property
+    def cursor(self) -> Optional[ScanCursor]:
+        return None if self._paginator is None else self._paginator.cursor
+
+    def send(self, value: Optional[Any]) -> T:
+        return next(self._records)
+
+    def throw(self, typ: Any, val: Any = None, tb: Any = None) -> T:
+        throw = getattr(self._records, "throw", None)
+
+        if throw is None:
+            raise typ if val is None else val
+
+        return throw(typ, val, tb)
+
+    def close(self) -> None:
+        close = getattr(self._records, "close", None)
+
+        if close is not None:
+            close()
+
+
+class Paginator:  # pylint: disable=too-many-instance-attributes
+    """Pages through a collection for a single scan, from `cursor` on.
+
+    All of the scan's state lives on the paginator, so any number of them can run at
+    once on one client, from any threads. `records()` (or iterating the paginator)
+    yields records and `pages()` yields whole pages. Either can be stopped early by
+    breaking out of the loop or closing the generator, which also cancels prefetched
+    pages. A paginator is meant to be iterated once.
+
+    `exhausted` is True once the end of the collection was reached, and `pages_read`
+    counts the pages read so far.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        endpoint: "ListAPIMixin",
+        cursor: ScanCursor,
+        ignore_max_pages: bool = False,
+        prefetch: int = 0,
+        stream: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ):
+        if prefetch > 0 and stream:
+            raise ValueError("`prefetch` and `stream` can't be used together.")
+
+        self.endpoint = endpoint
+        self.ignore_max_pages = ignore_max_pages
+        self.prefetch = prefetch
+        self.stream = stream
+        self.fields = fields
+        self.exhausted = False
+        self.pages_read = 0
+
+        self._start = cursor
+        self._yielded = cursor.yielded
+        # The page being read, and how many of its records were read.
+        self._page = cursor.page
+        self._read = cursor.offset
+        # Past the documented limit, Ordway may return shorter pages than asked for.
+        self._detect_cap = (
+            endpoint.client.page_sizer.enabled and cursor.size > endpoint.MAX_PAGE_SIZE
+        )
+        self._short: Optional[int] = None
+
+    @property
+    def cursor(self) -> ScanCursor:
+        """ Where the paginator is at, counting the records it handed out. """
+
+        return self._start._replace(
+            page=self._page, yielded=self._yielded, offset=self._read
+        )
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.records()
+
+    def records(self) -> Generator[Dict[str, Any], None, None]:
+        """ Yields every record, streaming each page with `stream`. """
+
+        with closing(self._pages()) as pages:
+            for records in pages:
+                yield from records
+
+    def pages(self) -> Generator[List[Dict[str, Any]], None, None]:
+        """ Yields every page as a list of records, without the empty page ending the scan. """
+
+        with closing(self._pages()) as pages:
+            for records in pages:
+                page = list(records)
+
+                if page:
+                    yield page
+
+    def _count(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for record in records:
+            self._read += 1
+            self._yielded += 1
+
+            yield record
+
+    def _page_read(self, records: int, size: int) -> None:
+        self.pages_read += 1
+
+        if not self._detect_cap:
+            return
+
+        # A short page followed by more records shows Ordway's real page size limit.
+        if self._short is not None:
+            self.endpoint.client.page_sizer.observe_cap(
+                self.endpoint.collection, self._short
+            )
+
+            self._detect_cap = False
+
+        self._short = records if records < size else None
+
+    def _pages(  # pylint: disable=protected-access
+        self,
+    ) -> Generator[Iterator[Dict[str, Any]], None, None]:
+        """Yields an iterator over the records of each page, including the last, empty one.
+
+        The next page is only requested once the previous one was read.
+        """
+
+        endpoint = self.endpoint
+        cursor = self._start
+        # Records of the first page which were yielded before the scan was resumed.
+        skip = cursor.offset
+
+        try:
+            if self.prefetch > 0:
+                prefetched = endpoint._prefetch_pages(
+                    self.prefetch,
+                    cursor.size,
+                    cursor.sort,
+                    cursor.filters,
+                    cursor.ascending,
+                    self.ignore_max_pages,
+                    cursor.page,
+                )
+
+                with closing(prefetched):
+                    for results in prefetched:
+                        self._page = cursor.page + self.pages_read
+                        self._read = skip
+
+                        yield self._count(results[skip:])
+
+                        skip = 0
+                        self._page_read(len(results), cursor.size)
+
+                # Prefetching stops at the first empty page, or at `MAX_PAGES`.
+                self.exhausted = not endpoint._reached_max_pages(
+                    cursor.page + self.pages_read, self.ignore_max_pages, warn=False
+                )
+
+                return
+
+            page = cursor.page
+            # Sizes past the documented limit only come from the page sizer, while `list`
+            # holds sizes to it.
+            list_page = (
+                endpoint.list
+                if cursor.size <= endpoint.MAX_PAGE_SIZE
+                else endpoint._list_records
+            )
+
+            while not endpoint._reached_max_pages(page, self.ignore_max_pages):
+                records: Iterator[Dict[str, Any]] = list_page(
+                    page=page,
+                    size=cursor.size,
+                    sort=cursor.sort,
+                    filters=cursor.filters,
+                    ascending=cursor.ascending,
+                    stream=self.stream,
+                    fields=self.fields,
+                )
+                self._page = page
+                self._read = skip
+
+                if skip > 0:
+                    records = islice(records, skip, None)
+                    skip = 0
+
+                yield self._count(records)
+
+                if self._read == 0:
+                    self.exhausted = True
+
+                    break
+
+                self._page_read(self._read, cursor.size)
+                page += 1
+        finally:
+            endpoint._observe_pages(self.pages_read)
+
+
+def to_timestamp(value: Union[str, date, datetime]) -> datetime:
+    """ Converts a window's bound to a datetime, treating dates and naive datetimes as UTC. """
+
+    if isinstance(value, str):
+        return parse_timestamp(value)
+
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def split_window(window: Window, parts: int) -> List[Window]:
+    """ Splits `window` into up to `parts` windows of equal length, none shorter than `MIN_WINDOW`. """
+
+    start, end = window
+    parts = max(min(parts, int((end - start) / MIN_WINDOW)), 1)
+    step = (end - start) / parts
+    bounds = [start + step * part for part in range(parts)] + [end]
+
+    return list(zip(bounds, bounds[1:]))
@@ -0,0 +1,263 @@
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional
+from collections import OrderedDict
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from time import monotonic
+from os import getpid
+from logging import getLogger
+
+from requests.adapters import DEFAULT_POOLSIZE
+
+from .client import OrdwayClient
+from .session import session_factory, observe_retries, PoolStats
+from .exceptions import OrdwayClientException
+from .consts import API_ENDPOINT_BASE
+
+if TYPE_CHECKING:
+    from requests import Session
+
+logger = getLogger(__name__)
+
+# Client arguments the pool decides on, or which mustn't be shared between companies.
+_RESERVED_KWARGS = frozenset(
+    {
+        "email",
+        "api_key",
+        "company",
+        "user_token",
+        "session",
+        "shared_session",
+        "pool_connections",
+        "pool_maxsize",
+        "pool_block",
+        "keep_alive",
+        "cache",
+    }
+)
+
+
+class _Tenant(NamedTuple):
+    client: OrdwayClient
+    last_used: float
+
+
+class OrdwayClientPool:
+    """Hands out clients for many Ordway companies, all sharing one connection pool.
+
+        pool = OrdwayClientPool(max_tenants=256, pool_maxsize=32, rate_limit=5)
+        pool.client("acme", email, api_key, user_token).invoices.all()
+
+    Every client sends its own company's credentials with each request, and gets its own
+    rate limiter (`rate_limit`/`rate_limit_burst`, or those passed to `client`), which
+    also sees the 429s urllib3 retries on its behalf. Connections, on the other hand, are
+    shared: the pool's session keeps at most `pool_maxsize` connections per host and,
+    with `pool_block`, makes requests wait for a free one instead of opening more.
+
+    Clients are kept for `company` until `max_tenants` other companies were used more
+    recently, or they were unused for `idle_timeout` seconds. An evicted client keeps
+    working, but the next `client` call for its company builds a new one, with a fresh
+    rate limiter. Other `client_kwargs` (`api_version`, `staging`, `base_url`, `metrics`,
+    `concurrency_limiter`, ...) are passed to every client. Caches aren't, since they
+    aren't keyed by company.
+
+    In a forked child, the pool starts over with a new session and no clients, and the
+    clients it handed out before the fork get sessions of their own.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_tenants: int = 256,
+        idle_timeout: Optional[float] = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = True,
+        keep_alive: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        session: Optional["Session"] = None,
+        **client_kwargs: Any,
+    ):
+        if max_tenants < 1:
+            raise ValueError("`max_tenants` must be at least 1.")
+
+        reserved = _RESERVED_KWARGS.intersection(client_kwargs)
+
+        if reserved:
+            raise OrdwayClientException(
+                f"`OrdwayClientPool` can't pass {', '.join(sorted(reserved))} to its clients."
+            )
+
+        self.max_tenants = max_tenants
+        self.idle_timeout = idle_timeout
+        self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.client_kwargs = client_kwargs
+        # How many clients were dropped, for being least recently used or idle.
+        self.evictions = 0
+
+        self._session_settings: Dict[str, Any] = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "keep_alive": keep_alive,
+            "retry_observer": observe_retries,
+        }
+        self._session = self._new_session(session)
+        self._pid = getpid()
+
+        self._lock = Lock()
+        self._tenants: "OrderedDict[str, _Tenant]" = OrderedDict()
+
+    @property
+    def session(self) -> "Session":
+        """ The session shared by the pool's clients, replaced with a new one in a forked child. """
+
+        if self._pid != getpid():
+            self._pid = getpid()
+            self._lock = Lock()
+            self._tenants = OrderedDict()
+            self._session = self._new_session()
+
+        return self._session
+
+    def _new_session(self, session: Optional["Session"] = None) -> "Session":
+        session = session_factory(session, **self._session_settings)
+        # Cookies one company's responses set would otherwise be sent for every company.
+        session.cookies.clear()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        return session
+
+    def client(  # pylint: disable=too-many-arguments
+        self,
+        company: str,
+        email: str,
+        api_key: str,
+        user_token: str,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+    ) -> OrdwayClient:
+        """Returns the client for `company`, creating it if it isn't pooled.
+
+        When the credentials changed since the client was created, it's replaced by a new
+        one with the same rate limiter, leaving requests already made with the old
+        credentials untouched. `rate_limit` and `rate_limit_burst` override the pool's, and
+        only apply to new clients.
+        """
+
+        now = monotonic()
+        session = self.session
+
+        with self._lock:
+            self._evict_idle(now)
+
+            tenant = self._tenants.get(company)
+
+            if tenant is not None:
+                client = tenant.client
+
+                if (client.email, client.api_key, client.user_token) != (
+                    email,
+                    api_key,
+                    user_token,
+                ):
+                    rate_limiter = client.rate_limiter
+                    client = self._new_client(
+                        session, company, email, api_key, user_token, None, None
+                    )
+                    client.rate_limiter = rate_limiter
+
+                self._tenants[company] = _Tenant(client, now)
+                self._tenants.move_to_end(company)
+
+                return client
+
+            client = self._new_client(
+                session,
+                company,
+                email,
+                api_key,
+                user_token,
+                rate_limit,
+                rate_limit_burst,
+            )
+            self._tenants[company] = _Tenant(client, now)
+
+            while len(self._tenants) > self.max_tenants:
+                evicted, _ = self._tenants.popitem(last=False)
+                self.evictions += 1
+
+                logger.debug('Evicted the least recently used company "%s".', evicted)
+
+            return client
+
+    def _new_client(  # pylint: disable=too-many-arguments
+        self,
+        session: "Session",
+        company: str,
+        email: str,
+        api_key: str,
+        user_token: str,
+        rate_limit: Optional[float],
+        rate_limit_burst: Optional[int],
+    ) -> OrdwayClient:
+        return OrdwayClient(
+            email=email,
+            api_key=api_key,
+            company=company,
+            user_token=user_token,
+            session=session,
+            shared_session=True,
+            rate_limit=self.rate_limit if rate_limit is None else rate_limit,
+            rate_limit_burst=self.rate_limit_burst
+            if rate_limit_burst is None
+            else rate_limit_burst,
+            **self.client_kwargs,
+        )
+
+    def _evict_idle(self, now: float) -> None:
+        if self.idle_timeout is None:
+            return
+
+        # Tenants are ordered by last use, so idle ones are at the front.
+        while self._tenants:
+            company, tenant = next(iter(self._tenants.items()))
+
+            if now - tenant.last_used < self.idle_timeout:
+                return
+
+            del self._tenants[company]
+            self.evictions += 1
+
+            logger.debug('Evicted idle company "%s".', company)
+
+    def evict(self, company: str) -> bool:
+        """ Drops the client for `company`, returning whether there was one. """
+
+        with self._lock:
+            return self._tenants.pop(company, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def __contains__(self, company: object) -> bool:
+        return company in self._tenants
+
+    def pool_stats(self) -> PoolStats:
+        """ Returns a snapshot of the shared HTTP connection pool's usage. """
+
+        return self.session.get_adapter(API_ENDPOINT_BASE).pool_stats()
+
+    def close(self) -> None:
+        """ Drops every client and closes the shared session's connections. """
+
+        with self._lock:
+            self._tenants.clear()
+
+        self.session.close()
+
+    def __enter__(self) -> "OrdwayClientPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
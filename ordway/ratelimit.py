@@ -0,0 +1,166 @@
+from typing import Optional, Mapping, Callable
+from threading import Lock
+from time import monotonic, sleep, time
+from email.utils import parsedate_to_datetime
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+RATE_LIMITED_STATUS = 429
+
+# Header names are checked in order, the first one present wins.
+_LIMIT_HEADERS = ("X-RateLimit-Limit", "RateLimit-Limit")
+_REMAINING_HEADERS = ("X-RateLimit-Remaining", "RateLimit-Remaining")
+_RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset")
+
+# Reset headers larger than this are epoch timestamps rather than a number of seconds.
+_EPOCH_THRESHOLD = 10 ** 9
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """ Parses a `Retry-After` header, either a number of seconds or an HTTP date, into seconds from now. """
+
+    value = value.strip()
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time())
+
+
+def _header(headers: Mapping[str, str], names) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+
+        if value is None:
+            continue
+
+        try:
+            # Some servers send a list, e.g. "100, 100;w=60". Only the first value is relevant.
+            return float(str(value).split(",")[0].split(";")[0])
+        except ValueError:
+            logger.debug(
+                'Ignoring unparseable rate limit header "%s: %s".', name, value
+            )
+
+    return None
+
+
+class RateLimiter:
+    """A thread-safe token bucket limiting requests to `rate` per second, allowing bursts of up to `burst`.
+
+    Callers reserve a token before every request. When the bucket is empty the token is
+    borrowed from the future, so concurrent callers are queued behind each other rather
+    than all waking at the same instant. Responses are fed back through `update`, which
+    honors `Retry-After` and retunes the rate from any rate limit headers Ordway sends.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("`rate` must be greater than zero.")
+
+        self.max_rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+
+        self._rate = rate
+        self._tokens = float(self.burst)
+        self._clock = clock
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = Lock()
+
+    @property
+    def rate(self) -> float:
+        """ The currently enforced number of requests per second. """
+
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def reserve(self) -> float:
+        """ Takes a token and returns how many seconds the caller must wait before sending its request. """
+
+        with self._lock:
+            now = self._clock()
+
+            self._refill(now)
+            self._tokens -= 1
+
+            delay = max(0.0, self._blocked_until - now)
+
+            if self._tokens < 0:
+                delay = max(delay, -self._tokens / self._rate)
+
+            return delay
+
+    def acquire(self) -> None:
+        """ Blocks until a request may be sent. """
+
+        delay = self.reserve()
+
+        if delay > 0:
+            sleep(delay)
+
+    def block_for(self, seconds: float) -> None:
+        """ Holds back every caller for `seconds` from now. """
+
+        with self._lock:
+            now = self._clock()
+
+            self._refill(now)
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            # Whatever was saved up no longer reflects what the server will accept.
+            self._tokens = min(self._tokens, 0.0)
+
+    def update(self, status: int, headers: Mapping[str, str]) -> None:
+        """ Adjusts the limiter from a response's status code and headers. """
+
+        retry_after = headers.get("Retry-After")
+        retry_after_seconds = (
+            parse_retry_after(retry_after) if retry_after is not None else None
+        )
+
+        remaining = _header(headers, _REMAINING_HEADERS)
+        reset = _header(headers, _RESET_HEADERS)
+
+        if reset is not None and reset > _EPOCH_THRESHOLD:
+            reset = max(0.0, reset - time())
+
+        if retry_after_seconds is not None:
+            self.block_for(retry_after_seconds)
+        elif status == RATE_LIMITED_STATUS:
+            self.block_for(reset if reset is not None else 1 / self._rate)
+        elif remaining is not None and remaining <= 0 and reset is not None:
+            self.block_for(reset)
+
+        if remaining is None:
+            return
+
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tokens, remaining)
+
+            if reset is not None and reset > 0:
+                # Spread what's left of the window over the time until it resets.
+                self._rate = min(self.max_rate, max(remaining / reset, 1 / reset))
+            else:
+                limit = _header(headers, _LIMIT_HEADERS)
+
+                if limit is None or remaining >= limit:
+                    self._rate = self.max_rate
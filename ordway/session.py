@@ -1,14 +1,183 @@
-from typing import TYPE_CHECKING, Optional
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Dict,
+    Iterator,
+    List,
+    Tuple,
+    NamedTuple,
+    Callable,
+)
+from threading import Lock, local
+from contextlib import contextmanager
+from time import perf_counter
+import socket
 from requests import Session
-from requests.adapters import HTTPAdapter
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE, DEFAULT_POOLBLOCK
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, PoolManager
+from urllib3.connection import HTTPConnection, HTTPSConnection
 from urllib3.util.retry import Retry
 
+from .exceptions import OrdwayClientException
+from .tracing import ACQUIRE, CONNECT, TLS, current_span
+
 if TYPE_CHECKING:
+    from queue import Queue
+    from urllib3 import HTTPResponse  # pylint: disable=ungrouped-imports
     from requests import PreparedRequest  # pylint: disable=ungrouped-imports
+    from aiohttp import ClientSession
+
+
+class PoolStats(NamedTuple):
+    """ A snapshot of a `TimeoutAdapter`'s connection pool usage. """
+
+    connections_created: int
+    connections_reused: int
+    connections_in_use: int
+    connections_idle: int
+    connections_discarded: int
+
+
+class _PoolCounters:
+    """ Thread-safe connection counters shared by every pool of an adapter. """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.created = 0
+        self.reused = 0
+        self.in_use = 0
+        self.discarded = 0
+
+
+class _CountingPoolMixin:
+    """ Records connection pool usage to the `_PoolCounters` attached by `_CountingPoolManager`. """
+
+    counters: _PoolCounters
+    pool: "Queue"
+
+    def _new_conn(self):
+        conn = super()._new_conn()  # type: ignore
+
+        with self.counters.lock:
+            self.counters.created += 1
+
+        return conn
+
+    def _get_conn(self, timeout=None):
+        span = current_span()
+
+        if span is None:
+            conn = super()._get_conn(timeout=timeout)  # type: ignore
+        else:
+            with span.phase(ACQUIRE):
+                conn = super()._get_conn(timeout=timeout)  # type: ignore
+
+        with self.counters.lock:
+            self.counters.in_use += 1
+
+            if getattr(conn, "_ordway_checked_out", False):
+                self.counters.reused += 1
+
+        conn._ordway_checked_out = True
+
+        return conn
+
+    def _put_conn(self, conn):
+        with self.counters.lock:
+            self.counters.in_use -= 1
+
+            if conn is not None and self.pool is not None and self.pool.full():
+                self.counters.discarded += 1
+
+        super()._put_conn(conn)  # type: ignore
+
+
+class _TracedConnectionMixin:
+    """ Reports how long connecting took to the active span, if any. """
+
+    def _new_conn(self):
+        span = current_span()
+
+        if span is None:
+            return super()._new_conn()  # type: ignore
+
+        with span.phase(CONNECT):
+            return super()._new_conn()  # type: ignore
+
+
+class _TracedHTTPConnection(_TracedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TracedHTTPSConnection(_TracedConnectionMixin, HTTPSConnection):
+    def connect(self):
+        span = current_span()
+
+        if span is None:
+            return super().connect()
+
+        started = perf_counter()
+        connecting = span.phases.get(CONNECT, 0.0)
+
+        try:
+            return super().connect()
+        finally:
+            # Everything but opening the socket is the handshake.
+            span.add_phase(
+                TLS,
+                perf_counter() - started - (span.phases.get(CONNECT, 0.0) - connecting),
+            )
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _TracedHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _TracedHTTPSConnection
+
+
+class _CountingPoolManager(PoolManager):
+    """ A `PoolManager` whose pools report to a shared set of `_PoolCounters`. """
+
+    def __init__(self, counters: _PoolCounters, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.counters = counters
+        self.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        pool.counters = self.counters
+
+        return pool
+
+
+def keep_alive_socket_options(idle: int) -> List[Tuple[int, int, int]]:
+    """ Socket options enabling TCP keep-alive probes after a connection has been idle for `idle` seconds. """
+
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+    # Named TCP_KEEPALIVE on macOS.
+    idle_option = getattr(
+        socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None)
+    )
+
+    if idle_option is not None:
+        options.append((socket.IPPROTO_TCP, idle_option, idle))
+
+    return options
 
 
 class TimeoutAdapter(HTTPAdapter):
-    """ Adds a default timeout to request Requests. """
+    """Adds a default timeout to request Requests.
+
+    Each adapter owns its connection pools, which can optionally keep idle sockets alive
+    with TCP keep-alive probes, and records their usage (see `pool_stats`).
+    """
 
     DEFAULT_TIMEOUT = 10
 
@@ -20,15 +189,73 @@ class TimeoutAdapter(HTTPAdapter):
         else:
             self.timeout = _timeout
 
+        self.socket_options: Optional[List[Tuple[int, int, int]]] = kwargs.pop(
+            "socket_options", None
+        )
+        self._pool_counters = _PoolCounters()
+
         super().__init__(*args, **kwargs)
 
     def __getstate__(self):
         state = super().__getstate__()
 
         state["timeout"] = self.timeout
+        state["socket_options"] = self.socket_options
 
         return state
 
+    def __setstate__(self, state):
+        self._pool_counters = _PoolCounters()
+        self.socket_options = state.get("socket_options")
+
+        super().__setstate__(state)
+
+    def init_poolmanager(
+        self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs
+    ):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+
+        if self.socket_options is not None:
+            pool_kwargs.setdefault(
+                "socket_options",
+                HTTPConnectionPool.ConnectionCls.default_socket_options
+                + self.socket_options,
+            )
+
+        self.poolmanager = _CountingPoolManager(
+            self._pool_counters,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            strict=True,
+            **pool_kwargs,
+        )
+
+    def pool_stats(self) -> PoolStats:
+        """ Returns a snapshot of connection usage across all of this adapter's pools. """
+
+        idle = 0
+        pools = self.poolmanager.pools
+
+        for key in pools.keys():
+            pool = pools.get(key)
+
+            if pool is not None and pool.pool is not None:
+                idle += sum(1 for conn in list(pool.pool.queue) if conn is not None)
+
+        counters = self._pool_counters
+
+        with counters.lock:
+            return PoolStats(
+                connections_created=counters.created,
+                connections_reused=counters.reused,
+                connections_in_use=counters.in_use,
+                connections_idle=idle,
+                connections_discarded=counters.discarded,
+            )
+
     def send(
         self, request: "PreparedRequest", *args, **kwargs
     ):  # pragma: no cover # pylint: disable=signature-differs
@@ -37,26 +264,150 @@ class TimeoutAdapter(HTTPAdapter):
         return super().send(request, *args, **kwargs)
 
 
-retry_strategy = Retry(
+RetryObserver = Callable[[Retry, Optional["HTTPResponse"], Optional[Exception]], None]
+
+
+_observing = local()
+
+
+@contextmanager
+def observing_retries(observer: RetryObserver) -> Iterator[None]:
+    """Sends retries of requests made on the calling thread meanwhile to `observer`.
+
+    For sessions shared by several clients, whose retry observer is `observe_retries`.
+    """
+
+    previous = getattr(_observing, "observer", None)
+    _observing.observer = observer
+
+    try:
+        yield
+    finally:
+        _observing.observer = previous
+
+
+def observe_retries(
+    retry: Retry, response: Optional["HTTPResponse"], error: Optional[Exception]
+) -> None:
+    """ A retry observer handing retries to the observer of the calling thread, see `observing_retries`. """
+
+    observer = getattr(_observing, "observer", None)
+
+    if observer is not None:
+        observer(retry, response, error)
+
+
+class ObservedRetry(Retry):
+    """ A `Retry` which reports every retry urllib3 is about to make to `observer`. """
+
+    def __init__(self, *args, observer: Optional[RetryObserver] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.observer = observer
+
+    def new(self, **kw):
+        kw.setdefault("observer", self.observer)
+
+        return super().new(**kw)
+
+    def increment(  # pylint: disable=too-many-arguments
+        self,
+        method=None,
+        url=None,
+        response=None,
+        error=None,
+        _pool=None,
+        _stacktrace=None,
+    ):
+        new_retry = super().increment(
+            method=method,
+            url=url,
+            response=response,
+            error=error,
+            _pool=_pool,
+            _stacktrace=_stacktrace,
+        )
+
+        if self.observer is not None:
+            self.observer(new_retry, response, error)
+
+        return new_retry
+
+
+retry_strategy = ObservedRetry(
     total=3,
     status_forcelist=[429, 500, 502, 503, 504],
     backoff_factor=3,
 )
 
-timeout_retry_adapter = TimeoutAdapter(max_retries=retry_strategy)
-
 DEFAULT_HEADERS = {"Accept": "application/json"}
 
 
-def session_factory(session: Optional[Session] = None) -> Session:
-    """ Creates or modifies `requests.Session` by attaching a timeout adapter with a retry strategy and default headers. """
+def session_factory(  # pylint: disable=too-many-arguments
+    session: Optional[Session] = None,
+    pool_connections: int = DEFAULT_POOLSIZE,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    pool_block: bool = DEFAULT_POOLBLOCK,
+    keep_alive: Optional[int] = None,
+    timeout: Optional[float] = None,
+    retry_observer: Optional[RetryObserver] = None,
+) -> Session:
+    """Creates or modifies `requests.Session` by attaching a timeout adapter with a retry strategy and default headers.
+
+    Every session gets its own adapter, and therefore its own connection pools:
+    - `pool_connections` is the number of hosts to keep pools for.
+    - `pool_maxsize` is the number of connections kept open per host.
+    - `pool_block` makes requests wait for a free connection instead of opening (and then discarding) extra ones.
+    - `keep_alive` enables TCP keep-alive probes after a connection is idle for that many seconds.
+
+    `retry_observer` is called every time the retry strategy retries a request.
+    """
 
     if session is None:
         session = Session()
 
-    session.mount("https://", timeout_retry_adapter)
-    session.mount("http://", timeout_retry_adapter)
+    adapter = TimeoutAdapter(
+        max_retries=retry_strategy
+        if retry_observer is None
+        else retry_strategy.new(observer=retry_observer),
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        timeout=timeout,
+        socket_options=None
+        if keep_alive is None
+        else keep_alive_socket_options(keep_alive),
+    )
+
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
 
     session.headers.update(DEFAULT_HEADERS)
 
     return session
+
+
+def async_session_factory(
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = TimeoutAdapter.DEFAULT_TIMEOUT,
+    limit: int = 100,
+) -> "ClientSession":
+    """ Creates an `aiohttp.ClientSession` with the same default timeout and headers used by `session_factory`. """
+
+    try:
+        from aiohttp import (  # pylint: disable=import-outside-toplevel
+            ClientSession,
+            ClientTimeout,
+            TCPConnector,
+        )
+    except ImportError as err:
+        raise OrdwayClientException(
+            "aiohttp is required to use `AsyncOrdwayClient`. Install it with `pip install ordway[async]`."
+        ) from err
+
+    return ClientSession(
+        connector=TCPConnector(limit=limit),
+        # requests applies its timeout to both connecting and reading, so do the same.
+        timeout=ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout),
+        headers={**DEFAULT_HEADERS, **(headers or {})},
+    )
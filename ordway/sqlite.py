@@ -0,0 +1,64 @@
+from typing import Iterator
+from contextlib import contextmanager
+from threading import local
+import os
+import sqlite3
+
+
+class SQLiteDatabase:
+    """A SQLite file shared between threads and processes.
+
+    Every thread gets its own connection, reopened after a fork, since SQLite connections
+    can't be shared. The database runs in WAL mode so readers never block each other or a
+    writer. Writers wait up to `timeout` seconds for the lock before giving up.
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        self.path = path
+        self.timeout = timeout
+
+        self._local = local()
+
+    def connection(self) -> sqlite3.Connection:
+        """ Returns this thread's connection, opening a new one in a forked child. """
+
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None or self._local.pid != os.getpid():
+            # Transactions are managed explicitly, see `transaction`.
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+
+        return connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """ Runs a write transaction, taking the write lock up front so reads inside it can't go stale. """
+
+        connection = self.connection()
+        connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+
+            raise
+
+        connection.execute("COMMIT")
+
+    def close(self) -> None:
+        """ Closes the calling thread's connection. """
+
+        connection = getattr(self._local, "connection", None)
+
+        if connection is not None:
+            connection.close()
+
+            self._local.connection = None
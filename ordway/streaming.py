@@ -0,0 +1,315 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+import codecs
+import json
+import re
+
+# A complete string, or a container bracket. A lone quote is a string cut off by the end of the buffer.
+_STRUCTURE = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}]|"')
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+_SCALAR_END = re.compile(r"[\s,\]}]")
+_NON_WHITESPACE = re.compile(r"\S")
+
+# Once this much of the buffer has been consumed, it's dropped.
+_COMPACT_AFTER = 1 << 16
+
+# A projection maps field names to the projection of their nested fields, or None for the whole value.
+Projection = Dict[str, Optional["Projection"]]
+
+
+def build_projection(fields: Iterable[str]) -> Projection:
+    """Builds a projection from field names, where dots select nested fields.
+
+    `("id", "line_items.amount")` keeps `id` and the `amount` of every line item.
+    """
+
+    projection: Projection = {}
+
+    for field in fields:
+        node = projection
+        *parents, name = field.split(".")
+
+        for parent in parents:
+            child = node.get(parent, {})
+
+            if child is None:
+                # The whole parent is already selected.
+                break
+
+            node[parent] = child
+            node = child
+        else:
+            node[name] = None
+
+    return projection
+
+
+class _Reader:
+    """ A buffer over text decoded from byte chunks, read on demand. """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        # While set, the buffer is kept from this position on.
+        self.anchor: Optional[int] = None
+
+    @classmethod
+    def from_text(cls, text: str) -> "_Reader":
+        reader = cls(())
+        reader.buffer = text
+        reader.eof = True
+
+        return reader
+
+    def fill(self) -> bool:
+        """ Reads another chunk into the buffer, returning False at the end of the stream. """
+
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+
+            if text:
+                self.buffer += text
+
+                return True
+
+        if not self.eof:
+            self.eof = True
+            self.buffer += self._decoder.decode(b"", final=True)
+
+        return False
+
+    def advance(self, end: int) -> None:
+        self.pos = end
+
+        if self.pos > _COMPACT_AFTER and self.anchor is None:
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+
+    def peek(self) -> str:
+        """ Skips whitespace and returns the next character, or "" at the end of the stream. """
+
+        while True:
+            match = _NON_WHITESPACE.search(self.buffer, self.pos)
+
+            if match is not None:
+                self.pos = match.start()
+
+                return match.group()
+
+            self.pos = len(self.buffer)
+
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' at position {self.pos}.")
+
+        self.advance(self.pos + 1)
+
+    def value_end(self) -> int:
+        """ Returns where the JSON value starting at the next character ends, reading as much as it needs. """
+
+        first = self.peek()
+
+        if first == "":
+            raise ValueError("Unexpected end of JSON.")
+
+        if first == '"':
+            while True:
+                match = _STRING.match(self.buffer, self.pos)
+
+                if match is not None:
+                    return match.end()
+
+                if not self.fill():
+                    raise ValueError("Unterminated JSON string.")
+
+        if first not in "[{":
+            while True:
+                match = _SCALAR_END.search(self.buffer, self.pos)
+
+                if match is not None:
+                    return match.start()
+
+                if not self.fill():
+                    return len(self.buffer)
+
+        depth = 0
+        index = self.pos
+
+        while True:
+            for match in _STRUCTURE.finditer(self.buffer, index):
+                token = match.group()
+
+                if token == '"':
+                    # Cut off, rescan it once there's more.
+                    index = match.start()
+
+                    break
+
+                index = match.end()
+
+                if token in "[{":
+                    depth += 1
+                elif token in "]}":
+                    depth -= 1
+
+                    if depth == 0:
+                        return index
+            else:
+                index = len(self.buffer)
+
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON.")
+
+    def take(self) -> str:
+        """ Returns the text of the next JSON value and moves past it. """
+
+        end = self.value_end()
+        text = self.buffer[self.pos : end]
+
+        self.advance(end)
+
+        return text
+
+    def skip(self) -> None:
+        self.advance(self.value_end())
+
+
+Loads = Callable[[str], Any]
+
+
+def _decode(reader: _Reader, projection: Optional[Projection], loads: Loads) -> Any:
+    """ Decodes the next value, only building the fields `projection` selects. """
+
+    if projection is None:
+        return loads(reader.take())
+
+    first = reader.peek()
+
+    if first == "[":
+        reader.advance(reader.pos + 1)
+        items = []
+
+        while reader.peek() != "]":
+            items.append(_decode(reader, projection, loads))
+
+            if reader.peek() == ",":
+                reader.advance(reader.pos + 1)
+
+        reader.advance(reader.pos + 1)
+
+        return items
+
+    if first != "{":
+        return loads(reader.take())
+
+    reader.advance(reader.pos + 1)
+    result: Dict[str, Any] = {}
+
+    while reader.peek() != "}":
+        key = json.loads(reader.take())
+        reader.expect(":")
+
+        if key in projection:
+            result[key] = _decode(reader, projection[key], loads)
+        else:
+            reader.skip()
+
+        if reader.peek() == ",":
+            reader.advance(reader.pos + 1)
+
+    reader.advance(reader.pos + 1)
+
+    return result
+
+
+def _decode_record(text: str, projection: Optional[Projection], loads: Loads) -> Any:
+    if projection is None:
+        return loads(text)
+
+    return _decode(_Reader.from_text(text), projection, loads)
+
+
+def _iter_array(
+    reader: _Reader, projection: Optional[Projection], loads: Loads
+) -> Iterator[Any]:
+    """ Yields the elements of the array starting at the next character, one at a time. """
+
+    reader.expect("[")
+
+    while True:
+        char = reader.peek()
+
+        if char == "]":
+            reader.advance(reader.pos + 1)
+
+            return
+
+        if char == ",":
+            reader.advance(reader.pos + 1)
+
+            continue
+
+        # Only one record is ever held in the buffer, and it's decoded from a
+        # complete slice, which is much faster than decoding as it arrives.
+        yield _decode_record(reader.take(), projection, loads)
+
+
+def iter_records(
+    chunks: Iterable[bytes],
+    collection: str,
+    fields: Optional[Union[Iterable[str], Projection]] = None,
+    loads: Loads = json.loads,
+) -> Iterator[Dict[str, Any]]:
+    """Incrementally parses a list response, yielding each record as soon as it's been read.
+
+    Accepts the same shapes `ListAPIMixin.list` does: an array of records, records nested
+    under the collection's name such as `{"usages": [...], "total": 0}`, or a single record.
+    With `fields`, only those fields (dots select nested fields) of each record are built.
+    Values are decoded with `loads`, such as a `JSONCodec`'s.
+    """
+
+    projection = (
+        fields
+        if fields is None or isinstance(fields, dict)
+        else build_projection(fields)
+    )
+    reader = _Reader(chunks)
+    first = reader.peek()
+
+    if first == "[":
+        yield from _iter_array(reader, projection, loads)
+
+        return
+
+    if first != "{":
+        raise ValueError("Expected a JSON array or object.")
+
+    start = reader.anchor = reader.pos
+    reader.advance(reader.pos + 1)
+
+    while reader.peek() != "}":
+        key = json.loads(reader.take())
+        reader.expect(":")
+
+        if key == collection.lower() and reader.peek() == "[":
+            reader.anchor = None
+
+            yield from _iter_array(reader, projection, loads)
+
+            # Whatever follows, such as "total", is of no interest.
+            return
+
+        reader.skip()
+
+        if reader.peek() == ",":
+            reader.advance(reader.pos + 1)
+
+    # No nested records, the object is a single record.
+    reader.advance(reader.pos + 1)
+
+    yield _decode_record(reader.buffer[start : reader.pos], projection, loads)
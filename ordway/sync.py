@@ -0,0 +1,132 @@
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Optional, Union
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timezone
+from threading import Lock
+from logging import getLogger
+import json
+import os
+import tempfile
+
+from .utils import parse_datetime
+
+logger = getLogger(__name__)
+
+
+class SyncCheckpoint(NamedTuple):
+    """How far a collection has been synced.
+
+    `high_water_mark` is the latest `updated_date` seen, exactly as Ordway returned it.
+    `boundary_ids` are the ids of the records updated at exactly that time, which were
+    already yielded and must be skipped when they're fetched again.
+    """
+
+    collection: str
+    high_water_mark: str
+    boundary_ids: FrozenSet[str]
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "collection": self.collection,
+            "high_water_mark": self.high_water_mark,
+            "boundary_ids": sorted(self.boundary_ids),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SyncCheckpoint":
+        return cls(
+            data["collection"], data["high_water_mark"], frozenset(data["boundary_ids"])
+        )
+
+
+class CheckpointStore(ABC):
+    """ Where `ListAPIMixin.sync` keeps a checkpoint per collection. """
+
+    @abstractmethod
+    def load(self, collection: str) -> Optional[SyncCheckpoint]:
+        """ Returns the last checkpoint saved for `collection`, if any. """
+
+    @abstractmethod
+    def save(self, checkpoint: SyncCheckpoint) -> None:
+        """ Durably records `checkpoint`, replacing the previous one for its collection. """
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """ Keeps checkpoints in memory, for the lifetime of the process. """
+
+    def __init__(self, checkpoints: Optional[Iterable[SyncCheckpoint]] = None):
+        self.checkpoints: Dict[str, SyncCheckpoint] = {
+            checkpoint.collection: checkpoint for checkpoint in checkpoints or ()
+        }
+
+    def load(self, collection: str) -> Optional[SyncCheckpoint]:
+        return self.checkpoints.get(collection)
+
+    def save(self, checkpoint: SyncCheckpoint) -> None:
+        self.checkpoints[checkpoint.collection] = checkpoint
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Keeps the checkpoints of every collection in a JSON file.
+
+    The file is replaced atomically on every save, so a crash leaves either the previous
+    or the new checkpoint behind, never a partially written one.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self._lock = Lock()
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, encoding="utf-8") as checkpoint_file:
+                return json.load(checkpoint_file)
+        except FileNotFoundError:
+            return {}
+
+    def load(self, collection: str) -> Optional[SyncCheckpoint]:
+        with self._lock:
+            data = self._read().get(collection)
+
+        return None if data is None else SyncCheckpoint.from_dict(data)
+
+    def save(self, checkpoint: SyncCheckpoint) -> None:
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[checkpoint.collection] = checkpoint.to_dict()
+
+            descriptor, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp"
+            )
+
+            try:
+                with os.fdopen(descriptor, "w", encoding="utf-8") as temp_file:
+                    json.dump(checkpoints, temp_file, indent=2, sort_keys=True)
+                    temp_file.flush()
+                    os.fsync(temp_file.fileno())
+
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+
+                raise
+
+        logger.debug(
+            'Saved sync checkpoint for "%s" at %s.',
+            checkpoint.collection,
+            checkpoint.high_water_mark,
+        )
+
+
+def parse_timestamp(value: str) -> datetime:
+    """ Parses an `updated_date`, treating timestamps without a UTC offset as UTC so they compare with ones that have it. """
+
+    parsed = parse_datetime(value)
+
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def format_since(since: Union[str, date, datetime]) -> str:
+    """ Formats the `since` argument of `ListAPIMixin.sync` as a high-water mark. """
+
+    return since if isinstance(since, str) else since.isoformat()
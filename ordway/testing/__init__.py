@@ -0,0 +1,3 @@
+""" Tools for testing code built on the client without reaching Ordway. """
+from .server import FakeOrdway, endpoint_collections
+from .load import LoadReport, run_load
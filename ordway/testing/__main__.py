@@ -0,0 +1,72 @@
+"""Drives an `OrdwayClient` at a target concurrency and reports throughput and latency.
+
+    python -m ordway.testing --operation get --concurrency 16 --duration 10 --latency 0.05
+
+Requests go to a `FakeOrdway` started for the run, seeded with `--records` records of
+`--collection` and injecting the faults given.
+"""
+from typing import Any, Callable, List
+from argparse import ArgumentParser
+import sys
+
+from ordway.client import OrdwayClient
+
+from .load import run_load
+from .server import FakeOrdway
+
+
+def _operation(
+    client: OrdwayClient, name: str, collection: str, ids: List[str]
+) -> Callable[[int], Any]:
+    interface = getattr(client, collection)
+
+    if name == "get":
+        return lambda index: interface.get(ids[index % len(ids)])
+
+    if name == "list":
+        return lambda index: list(interface.list(page=index % 10 + 1, size=20))
+
+    return lambda index: interface.create({"name": f"Load {index}"})
+
+
+def main() -> int:
+    parser = ArgumentParser(prog="python -m ordway.testing")
+    parser.add_argument("--operation", choices=("get", "list", "create"), default="get")
+    parser.add_argument("--collection", default="customers")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--operations", type=int)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    args = parser.parse_args()
+
+    with FakeOrdway(
+        latency=args.latency,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        retry_after=args.retry_after,
+    ) as server:
+        server.add(
+            args.collection,
+            ({"name": f"Record {index}"} for index in range(max(args.records, 1))),
+        )
+
+        client = server.client(pool_maxsize=args.concurrency)
+        ids = [record["id"] for record in server.records(args.collection)]
+        report = run_load(
+            _operation(client, args.operation, args.collection, ids),
+            concurrency=args.concurrency,
+            operations=args.operations,
+            duration=None if args.operations is not None else args.duration,
+        )
+
+    print(report.format())
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
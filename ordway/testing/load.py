@@ -0,0 +1,133 @@
+from typing import (
+    Any,
+    Callable,
+    Counter as CounterType,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+)
+from collections import Counter
+from math import ceil
+from threading import Lock, Thread
+from time import perf_counter
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """ The nearest-rank percentile of sorted `values`, or 0 without any. """
+
+    if not values:
+        return 0.0
+
+    rank = max(ceil(percent / 100 * len(values)), 1)
+
+    return values[rank - 1]
+
+
+class LoadReport(NamedTuple):
+    """ The outcome of `run_load`. Latencies include failed operations. """
+
+    operations: int
+    errors: Dict[str, int]
+    seconds: float
+    # Sorted.
+    latencies: List[float]
+
+    @property
+    def throughput(self) -> float:
+        """ Operations per second. """
+
+        return self.operations / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def p50(self) -> float:
+        return percentile(self.latencies, 50)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.latencies, 95)
+
+    @property
+    def p99(self) -> float:
+        return percentile(self.latencies, 99)
+
+    def format(self) -> str:
+        errors = ", ".join(
+            f"{name}: {count}" for name, count in sorted(self.errors.items())
+        )
+
+        return (
+            f"{self.operations} operations in {self.seconds:.2f}s, {self.throughput:.1f}/s\n"
+            f"p50 {self.p50 * 1000:.1f}ms, p95 {self.p95 * 1000:.1f}ms, p99 {self.p99 * 1000:.1f}ms\n"
+            f"errors: {errors or 'none'}"
+        )
+
+
+def run_load(
+    operation: Callable[[int], Any],
+    concurrency: int = 8,
+    operations: Optional[int] = None,
+    duration: Optional[float] = None,
+) -> LoadReport:
+    """Calls `operation` from `concurrency` threads, until `operations` calls were made or `duration` seconds passed.
+
+    `operation` receives the call's index, e.g. to pick which record to get. Exceptions
+    are counted by type rather than stopping the run.
+    """
+
+    if operations is None and duration is None:
+        raise ValueError(
+            "Either `operations` or `duration` must be passed to run_load."
+        )
+
+    lock = Lock()
+    latencies: List[float] = []
+    errors: CounterType[str] = Counter()
+    started = perf_counter()
+    deadline = None if duration is None else started + duration
+    issued = 0
+
+    def work() -> None:
+        nonlocal issued
+
+        while True:
+            with lock:
+                if operations is not None and issued >= operations:
+                    return
+
+                index = issued
+                issued += 1
+
+            if deadline is not None and perf_counter() >= deadline:
+                return
+
+            called = perf_counter()
+            error = None
+
+            try:
+                operation(index)
+            except Exception as err:  # pylint: disable=broad-except
+                error = type(err).__name__
+
+            elapsed = perf_counter() - called
+
+            with lock:
+                latencies.append(elapsed)
+
+                if error is not None:
+                    errors[error] += 1
+
+    threads = [
+        Thread(target=work, name=f"ordway-load-{number}", daemon=True)
+        for number in range(concurrency)
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return LoadReport(
+        len(latencies), dict(errors), perf_counter() - started, sorted(latencies)
+    )
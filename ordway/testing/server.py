@@ -0,0 +1,482 @@
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from collections import Counter, OrderedDict, deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from threading import Lock, Thread
+from time import sleep
+from urllib.parse import parse_qsl, urlsplit
+import json
+import random
+import re
+from requests.structures import CaseInsensitiveDict
+
+from ordway.api import endpoints
+from ordway.api.base import (
+    CreateAPIMixin,
+    DeleteAPIMixin,
+    GetAPIMixin,
+    ListAPIMixin,
+    UpdateAPIMixin,
+)
+from ordway.client import OrdwayClient
+from ordway.sync import parse_timestamp
+from ordway.utils import split_filter
+
+# Collections whose lists Ordway nests, like `{"usages": [...], "total": 0}`.
+NESTED_COLLECTIONS = ("usages",)
+
+LIST, GET, CREATE, UPDATE, DELETE = "list", "get", "create", "update", "delete"
+
+_OPERATIONS = (
+    (ListAPIMixin, LIST),
+    (GetAPIMixin, GET),
+    (CreateAPIMixin, CREATE),
+    (UpdateAPIMixin, UPDATE),
+    (DeleteAPIMixin, DELETE),
+)
+
+# Query params which aren't filters.
+_RESERVED_PARAMS = ("page", "size", "sort", "callback_url")
+
+_CREDENTIAL_HEADERS = ("X-User-Company", "X-API-Key", "X-User-Token", "X-User-Email")
+
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# A status, headers and JSON body.
+Reply = Tuple[int, Dict[str, str], Any]
+
+
+def endpoint_collections() -> Dict[str, FrozenSet[str]]:
+    """ The collections `ordway.api.endpoints` implements, and which operations each supports. """
+
+    collections = {}
+
+    for interface in vars(endpoints).values():
+        collection = getattr(interface, "collection", None)
+
+        if not isinstance(interface, type) or not isinstance(collection, str):
+            continue
+
+        collections[collection] = frozenset(
+            operation
+            for mixin, operation in _OPERATIONS
+            if issubclass(interface, mixin)
+        )
+
+    return collections
+
+
+def _id_prefix(collection: str) -> str:
+    """ e.g. "C" for customers, "BR" for billing_runs. """
+
+    return "".join(word[0] for word in collection.split("_")).upper()
+
+
+def _sort_key(value: Any) -> Tuple[Any, ...]:
+    """ Orders numbers, then strings, then anything else, with missing values last. """
+
+    if value is None:
+        return (3,)
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return (0, value)
+
+    if isinstance(value, str):
+        return (1, value)
+
+    return (2, json.dumps(value, sort_keys=True))
+
+
+def _compare(actual: Any, operator: str, expected: str) -> bool:
+    """ Compares a record's value to a filter's, as numbers or timestamps when they are. """
+
+    if actual is None:
+        return operator == "!="
+
+    left: Any = actual
+    right: Any = expected
+
+    if isinstance(actual, (int, float)) and not isinstance(actual, bool):
+        try:
+            right = float(expected)
+        except ValueError:
+            left = str(actual)
+    elif (
+        isinstance(actual, str)
+        and _TIMESTAMP.match(actual)
+        and _TIMESTAMP.match(expected)
+    ):
+        try:
+            left, right = parse_timestamp(actual), parse_timestamp(expected)
+        except ValueError:
+            pass
+    else:
+        left = actual if isinstance(actual, str) else json.dumps(actual)
+
+    if operator == "=":
+        return left == right
+    if operator == "!=":
+        return left != right
+    if operator == "<":
+        return left < right
+    if operator == "<=":
+        return left <= right
+    if operator == ">":
+        return left > right
+
+    return left >= right
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class FakeOrdway:  # pylint: disable=too-many-instance-attributes
+    """An in-process fake of Ordway's API, for load tests and offline development.
+
+    Serves every collection in `ordway.api.endpoints` with the operations its interface
+    supports: paginated lists (nested for `NESTED_COLLECTIONS`), sorting, filters written
+    like Ordway's (`updated_date>`, `status!=`, ...), and create, update, delete and
+    actions such as `subscriptions/{id}/cancel`. Records are kept in memory.
+
+    Faults can be injected at random with `throttle_rate` (429s, with a `Retry-After` of
+    `retry_after` seconds unless None) and `error_rate` (one of `error_statuses`), or
+    deterministically with `inject`. `latency` seconds, or a callable returning them, are
+    added to every response.
+
+        with FakeOrdway(latency=0.02, throttle_rate=0.01) as server:
+            server.add("customers", [{"name": "Acme"}])
+            client = server.client()
+            client.customers.all()
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Union[float, Callable[[], float]] = 0.0,
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (500, 502, 503, 504),
+        retry_after: Optional[int] = 1,
+        nested: Iterable[str] = NESTED_COLLECTIONS,
+        max_page_size: int = ListAPIMixin.MAX_PAGE_SIZE,
+        seed: Optional[int] = None,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.retry_after = retry_after
+        self.nested = frozenset(nested)
+        self.max_page_size = max_page_size
+        self.collections = endpoint_collections()
+        self.statuses: Counter = Counter()
+
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._random = random.Random(seed)
+        self._lock = Lock()
+        self._records: Dict[str, "OrderedDict[str, Dict[str, Any]]"] = {
+            collection: OrderedDict() for collection in self.collections
+        }
+        self._next_ids: Counter = Counter()
+        self._injected: Deque[Tuple[int, Optional[int]]] = deque()
+        self._server: Optional[HTTPServer] = None
+        self._thread: Optional[Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """ The URL to pass as an `OrdwayClient`'s `base_url`. """
+
+        return f"http://{self.host}:{self.port}/api"
+
+    def client(self, **kwargs: Any) -> OrdwayClient:
+        """ Returns an `OrdwayClient` using this server, with any credentials. """
+
+        for name in ("email", "api_key", "company", "user_token"):
+            kwargs.setdefault(name, f"fake_{name}")
+
+        return OrdwayClient(base_url=self.base_url, **kwargs)
+
+    def start(self) -> "FakeOrdway":
+        """ Starts serving on a background thread. """
+
+        self._server = _ThreadingHTTPServer((self.host, self.port), self._handler())
+        self.port = self._server.server_address[1]
+        self._thread = Thread(
+            target=self._server.serve_forever,
+            # Keeps `stop` quick.
+            kwargs={"poll_interval": 0.05},
+            name="fake-ordway",
+            daemon=True,
+        )
+        self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeOrdway":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def _timestamp(self) -> str:
+        return self._clock().strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+    def _store(self, collection: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """ Stores a record, assigning an id and timestamps it lacks. Expects the lock to be held. """
+
+        record = dict(record)
+
+        if "id" not in record:
+            self._next_ids[collection] += 1
+            record["id"] = f"{_id_prefix(collection)}-{self._next_ids[collection]:05}"
+
+        now = self._timestamp()
+        record.setdefault("created_date", now)
+        record.setdefault("updated_date", now)
+
+        self._records[collection][str(record["id"])] = record
+
+        return record
+
+    def add(self, collection: str, records: Iterable[Dict[str, Any]]) -> None:
+        """ Stores records as they are, adding any missing `id`, `created_date` and `updated_date`. """
+
+        with self._lock:
+            for record in records:
+                self._store(collection, record)
+
+    def records(self, collection: str) -> List[Dict[str, Any]]:
+        """ Every record of `collection`, in the order they were created. """
+
+        with self._lock:
+            return [dict(record) for record in self._records[collection].values()]
+
+    def inject(
+        self, status: int, count: int = 1, retry_after: Optional[int] = None
+    ) -> None:
+        """ Answers the next `count` requests with `status`, and a `Retry-After` header unless `retry_after` is None. """
+
+        with self._lock:
+            self._injected.extend((status, retry_after) for _ in range(count))
+
+    def _fault(self) -> Optional[Reply]:
+        with self._lock:
+            if self._injected:
+                status, retry_after = self._injected.popleft()
+            elif self._random.random() < self.throttle_rate:
+                status, retry_after = 429, self.retry_after
+            elif self._random.random() < self.error_rate:
+                status = self._random.choice(self.error_statuses)
+                retry_after = self.retry_after if status == 503 else None
+            else:
+                return None
+
+        headers = {} if retry_after is None else {"Retry-After": str(retry_after)}
+
+        return status, headers, {"message": f"Injected HTTP {status}."}
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        headers: Mapping[str, str],
+        body: Optional[bytes] = None,
+    ) -> Reply:
+        """ Answers a request without going through HTTP. `path` includes the query string. """
+
+        delay = self.latency() if callable(self.latency) else self.latency
+
+        if delay > 0:
+            sleep(delay)
+
+        reply = self._reply(method, path, headers, body)
+
+        with self._lock:
+            self.statuses[reply[0]] += 1
+
+        return reply
+
+    def _reply(  # pylint: disable=too-many-return-statements
+        self,
+        method: str,
+        path: str,
+        headers: Mapping[str, str],
+        body: Optional[bytes],
+    ) -> Reply:
+        if any(not headers.get(header) for header in _CREDENTIAL_HEADERS):
+            return 401, {}, {"message": "Missing credentials."}
+
+        fault = self._fault()
+
+        if fault is not None:
+            return fault
+
+        url = urlsplit(path)
+        segments = [segment for segment in url.path.split("/") if segment]
+
+        # api/v1/{collection}[/{id}[/{action}]]
+        if (
+            len(segments) < 3
+            or segments[0] != "api"
+            or segments[2] not in self.collections
+        ):
+            return 404, {}, {"message": "Not found."}
+
+        collection, rest = segments[2], segments[3:]
+        operations = self.collections[collection]
+
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {}, {"message": "Invalid JSON."}
+
+        if len(rest) == 0 and method == "GET" and LIST in operations:
+            return self._list(collection, parse_qsl(url.query))
+
+        if len(rest) == 0 and method == "POST" and CREATE in operations:
+            with self._lock:
+                return 201, {}, self._store(collection, payload)
+
+        if len(rest) == 0 or len(rest) > 2:
+            return 405, {}, {"message": "Method not allowed."}
+
+        return self._resource(collection, rest, method, payload)
+
+    def _resource(
+        self, collection: str, rest: List[str], method: str, payload: Dict[str, Any]
+    ) -> Reply:
+        operations = self.collections[collection]
+        id = rest[0]
+
+        with self._lock:
+            record = self._records[collection].get(id)
+
+            if record is None:
+                return 404, {}, {"message": f'"{id}" was not found.'}
+
+            if len(rest) == 1 and method == "GET" and GET in operations:
+                return 200, {}, dict(record)
+
+            if len(rest) == 1 and method == "DELETE" and DELETE in operations:
+                del self._records[collection][id]
+
+                return 200, {}, {}
+
+            # Updates, and actions such as `cancel`.
+            if method == "PUT" and (len(rest) == 2 or UPDATE in operations):
+                record.update(payload)
+                record["id"] = id
+                record["updated_date"] = self._timestamp()
+
+                return 200, {}, dict(record)
+
+        return 405, {}, {"message": "Method not allowed."}
+
+    def _list(self, collection: str, query: List[Tuple[str, str]]) -> Reply:
+        params = dict(query)
+
+        try:
+            page = max(int(params.get("page", 1)), 1)
+            size = min(max(int(params.get("size", 20)), 1), self.max_page_size)
+        except ValueError:
+            return 400, {}, {"message": "`page` and `size` must be integers."}
+
+        filters = [
+            (*split_filter(key), value)
+            for key, value in query
+            if key not in _RESERVED_PARAMS
+        ]
+
+        with self._lock:
+            records = [
+                dict(record)
+                for record in self._records[collection].values()
+                if all(
+                    _compare(record.get(field), operator, value)
+                    for field, operator, value in filters
+                )
+            ]
+
+        sort = params.get("sort", "").strip()
+
+        if sort:
+            fields, _, order = sort.rpartition(" ")
+
+            if order not in ("asc", "desc"):
+                fields, order = sort, "asc"
+
+            names = [name.strip() for name in fields.split(",") if name.strip()]
+            records.sort(
+                key=lambda record: tuple(_sort_key(record.get(name)) for name in names),
+                reverse=order == "desc",
+            )
+
+        results = records[(page - 1) * size : page * size]
+
+        if collection in self.nested:
+            return 200, {}, {collection: results, "total": len(records)}
+
+        return 200, {}, results
+
+    def _handler(self) -> type:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, which Nagle's algorithm would delay.
+            disable_nagle_algorithm = True
+
+            def _respond(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                status, headers, payload = fake.handle(
+                    self.command,
+                    self.path,
+                    CaseInsensitiveDict(self.headers.items()),
+                    body,
+                )
+                content = json.dumps(payload).encode("utf-8")
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+
+                for name, value in headers.items():
+                    self.send_header(name, value)
+
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+            def log_message(
+                self, *args: Any
+            ) -> None:  # pylint: disable=arguments-differ
+                pass
+
+        return Handler
@@ -0,0 +1,371 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from threading import Lock, local
+from time import perf_counter, time
+from uuid import uuid4
+import json
+
+from .exceptions import OrdwayClientException
+
+T = TypeVar("T")
+
+# The phases of a request, in the order they happen.
+QUEUE = "queue"  # Waiting on the client's rate and concurrency limiters.
+ACQUIRE = "acquire"  # Waiting for a connection from the pool.
+CONNECT = "connect"  # Opening a new TCP connection.
+TLS = "tls"  # The TLS handshake of a new connection.
+TTFB = "ttfb"  # Sending the request, until the response's headers arrive.
+DOWNLOAD = "download"  # Reading the response's body.
+DECODE = "decode"  # Decoding JSON.
+YIELD = "yield"  # Handing records to the caller, until it asks for the next one.
+
+_local = local()
+
+
+def current_span() -> Optional["Span"]:
+    """ The span active on the calling thread, if any. """
+
+    return getattr(_local, "span", None)
+
+
+@contextmanager
+def activate(span: Optional["Span"]) -> Iterator[Optional["Span"]]:
+    """ Makes `span` the calling thread's active span, so spans started meanwhile are its children. """
+
+    previous = current_span()
+    _local.span = span
+
+    try:
+        yield span
+    finally:
+        _local.span = previous
+
+
+def bind(function: Callable[..., T]) -> Callable[..., T]:
+    """ Wraps `function` to run under the calling thread's active span, e.g. on an executor's thread. """
+
+    span = current_span()
+
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with activate(span):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+class Span:  # pylint: disable=too-many-instance-attributes
+    """A timed operation, such as a request or an `all()` scan.
+
+    `phases` adds up the seconds spent in each phase (see `QUEUE`, `TTFB`, ...). Whatever
+    isn't in a phase was spent in the client itself.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["Span"] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.parent = parent
+        self.trace_id: str = uuid4().hex if parent is None else parent.trace_id
+        self.span_id = uuid4().hex[:16]
+        self.attributes: Dict[str, Any] = {} if attributes is None else attributes
+        self.phases: Dict[str, float] = {}
+        self.start_time = time()
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+        # Anything a `Tracer` needs to keep along with the span, such as an OpenTelemetry span.
+        self.handle: Any = None
+
+        self._started = perf_counter()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """ Adds the time spent in the block to the phase `name`. """
+
+        started = perf_counter()
+
+        try:
+            yield
+        finally:
+            self.add_phase(name, perf_counter() - started)
+
+    def record_error(self, error: BaseException) -> None:
+        self.error = f"{type(error).__name__}: {error}"
+
+    def finish(self) -> None:
+        if self.duration is None:
+            self.duration = perf_counter() - self._started
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": None if self.parent is None else self.parent.span_id,
+            "start_time": self.start_time,
+            "duration": self.duration,
+            "phases": self.phases,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class Tracer:
+    """The tracing interface `OrdwayClient` reports requests and scans to.
+
+    This base class traces nothing, and is the default. Clients don't start spans or
+    time anything while `enabled` is False.
+    """
+
+    enabled = False
+
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Span:
+        """ Starts a span, as a child of the calling thread's active span. """
+
+        return Span(name, parent=current_span(), attributes=attributes)
+
+    def end_span(self, span: Span) -> None:
+        span.finish()
+
+    def after_fork(self) -> None:
+        """ Resets state a forked child can't share with its parent, such as locks and threads. """
+
+    @contextmanager
+    def span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Span]:
+        """ Starts a span, active for the duration of the block. """
+
+        span = self.start_span(name, attributes)
+
+        try:
+            with activate(span):
+                yield span
+        except BaseException as err:
+            span.record_error(err)
+
+            raise
+        finally:
+            self.end_span(span)
+
+
+def traced(
+    tracer: Tracer, span: Span, iterator: Iterator[T]
+) -> Generator[T, None, None]:
+    """Yields from `iterator`, with `span` active only while it produces items.
+
+    Time spent by the caller between items is the `YIELD` phase. `span` ends with
+    `iterator`, including when the caller stops early.
+    """
+
+    records = 0
+
+    try:
+        while True:
+            with activate(span):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+
+            records += 1
+            started = perf_counter()
+
+            yield item
+
+            span.add_phase(YIELD, perf_counter() - started)
+    except GeneratorExit:
+        raise
+    except BaseException as err:
+        span.record_error(err)
+
+        raise
+    finally:
+        close = getattr(iterator, "close", None)
+
+        if close is not None:
+            with activate(span):
+                close()
+
+        span.set_attribute("ordway.records", records)
+        tracer.end_span(span)
+
+
+def timed(
+    span: Span, phase: str, iterable: Iterable[T], exclude: Optional[str] = None
+) -> Iterator[T]:
+    """Yields from `iterable`, adding the time it takes to produce each item to `phase`.
+
+    Time added to the phase `exclude` meanwhile, such as the download of a body being
+    decoded, is left out.
+    """
+
+    iterator = iter(iterable)
+
+    while True:
+        started = perf_counter()
+        excluded = 0.0 if exclude is None else span.phases.get(exclude, 0.0)
+
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            elapsed = perf_counter() - started
+
+            if exclude is not None:
+                elapsed -= span.phases.get(exclude, 0.0) - excluded
+
+            span.add_phase(phase, elapsed)
+
+        yield item
+
+
+class SpanExporter(ABC):
+    """ Receives every span an `ExportingTracer` ends. """
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """ Handles `span`, which has ended. """
+
+    def close(self) -> None:
+        pass
+
+    def after_fork(self) -> None:
+        """ Resets state a forked child can't share with its parent, such as locks and threads. """
+
+
+class InMemorySpanExporter(SpanExporter):
+    """ Keeps ended spans in `spans`. """
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def after_fork(self) -> None:
+        self._lock = Lock()
+
+
+class FileSpanExporter(SpanExporter):
+    """Appends ended spans to a file, one JSON object (see `Span.to_dict`) per line.
+
+    client = OrdwayClient(..., tracer=ExportingTracer(FileSpanExporter("spans.jsonl")))
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self._lock = Lock()
+        self._file = open(  # pylint: disable=consider-using-with
+            path, "a", encoding="utf-8"
+        )
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def after_fork(self) -> None:
+        self._lock = Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class ExportingTracer(Tracer):
+    """ Hands every span to `exporter` as it ends. """
+
+    enabled = True
+
+    def __init__(self, exporter: SpanExporter):
+        self.exporter = exporter
+
+    def end_span(self, span: Span) -> None:
+        span.finish()
+        self.exporter.export(span)
+
+    def after_fork(self) -> None:
+        self.exporter.after_fork()
+
+
+class OpenTelemetryTracer(Tracer):
+    """Reports spans to OpenTelemetry, requiring `opentelemetry-api`.
+
+    Spans are children of the OpenTelemetry span current when they start. Phases become
+    `ordway.phase.<name>` attributes, in seconds.
+    """
+
+    enabled = True
+
+    def __init__(self, tracer: Any = None):
+        try:
+            from opentelemetry import (  # pylint: disable=import-outside-toplevel
+                trace,
+            )
+        except ImportError as err:
+            raise OrdwayClientException(
+                "`OpenTelemetryTracer` requires opentelemetry-api. Please install it with `pip install opentelemetry-api`."
+            ) from err
+
+        self._trace = trace
+        self.tracer = trace.get_tracer("ordway") if tracer is None else tracer
+
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Span:
+        span = super().start_span(name, attributes)
+        context = (
+            None
+            if span.parent is None or span.parent.handle is None
+            else self._trace.set_span_in_context(span.parent.handle)
+        )
+        span.handle = self.tracer.start_span(name, context=context)
+
+        return span
+
+    def end_span(self, span: Span) -> None:
+        span.finish()
+
+        handle = span.handle
+
+        for key, value in span.attributes.items():
+            if value is not None:
+                handle.set_attribute(key, value)
+
+        for phase, seconds in span.phases.items():
+            handle.set_attribute(f"ordway.phase.{phase}", seconds)
+
+        if span.error is not None:
+            handle.set_status(
+                self._trace.Status(self._trace.StatusCode.ERROR, span.error)
+            )
+
+        handle.end()
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Tuple
 from datetime import datetime, date
 
 
@@ -18,3 +18,50 @@ def transform_datetimes(data: Any) -> Any:
             data[key] = transform_datetimes(val)
 
     return data
+
+
+_DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f%z",
+    "%Y-%m-%d %H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+
+def parse_datetime(value: str) -> datetime:
+    """ Parses an ISO 8601 date or datetime, as Ordway returns them, into a datetime. """
+
+    value = value.strip()
+
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+
+    # `%z` doesn't accept a colon in the UTC offset before Python 3.7.
+    if len(value) > 6 and value[-3] == ":" and value[-6] in "+-":
+        value = value[:-3] + value[-2:]
+
+    for datetime_format in _DATETIME_FORMATS:
+        try:
+            return datetime.strptime(value, datetime_format)
+        except ValueError:
+            continue
+
+    raise ValueError(f'"{value}" is not an ISO 8601 date or datetime.')
+
+
+# Two character operators must be matched before their one character prefixes.
+FILTER_OPERATORS = ("<=", ">=", "!=", "<", ">")
+
+
+def split_filter(key: str) -> Tuple[str, str]:
+    """ Splits a filter key like `updated_date>` into its field and operator, as Ordway's filters are written. """
+
+    for operator in FILTER_OPERATORS:
+        if key.endswith(operator):
+            return key[: -len(operator)].strip(), operator
+
+    return key.strip(), "="
@@ -29,7 +29,11 @@ setup(
     url="https://github.com/efnineio/ordway",
     packages=find_packages(exclude=["tests", "tests.*", "docs"]),
     install_requires=requirements,
-    extras_require={"testing": ["tox==3.17.1"]},
+    extras_require={
+        "testing": ["tox==3.17.1"],
+        "async": ["aiohttp>=3.6.2"],
+        "parquet": ["pyarrow>=7.0.0"],
+    },
     project_urls={
         "Documentation": "https://github.com/efnineio/ordway/blob/master/README.md",
         "Source": "https://github.com/efnineio/ordway",
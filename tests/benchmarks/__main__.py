@@ -0,0 +1,105 @@
+"""Runs the client's benchmarks and compares them to the stored baseline.
+
+    python -m tests.benchmarks                   # Compare every benchmark to the baseline.
+    python -m tests.benchmarks all_pagination    # Only some of them.
+    python -m tests.benchmarks --save            # Store the results as the new baseline.
+
+Exits with status 1 when a benchmark is slower than its baseline by more than
+`--threshold`, plus the spread of its rounds. Benchmarks that look slower are run again
+before they're reported, so a burst of noise doesn't fail the run. Baselines only
+compare on the machine and Python they were recorded with, so none is committed: record
+one before making changes, and compare after.
+"""
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+import os
+import platform
+import sys
+
+from .suite import BENCHMARKS, compare, load_baseline, run_all, save_baseline
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main() -> int:
+    parser = ArgumentParser(prog="python -m tests.benchmarks")
+    parser.add_argument("names", nargs="*", help="Benchmarks to run, all by default.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument("--save", action="store_true")
+    args = parser.parse_args()
+
+    unknown = set(args.names) - {benchmark.name for benchmark in BENCHMARKS}
+
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    benchmarks = {
+        benchmark.name: benchmark
+        for benchmark in BENCHMARKS
+        if not args.names or benchmark.name in args.names
+    }
+    results = run_all(benchmarks.values(), rounds=args.rounds, min_time=args.min_time)
+
+    for result in results:
+        print(
+            f"{result.name:<24} {result.seconds * 1e6:>12.1f} us/op"
+            f" {result.per_unit * 1e6:>10.2f} us/{result.unit}"
+            f" (median +{result.spread:.0%})"
+        )
+
+    if args.save:
+        save_baseline(
+            args.baseline,
+            results,
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "recorded_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+        print(f"Saved the baseline to {args.baseline}.")
+
+        return 0
+
+    baseline = load_baseline(args.baseline)
+
+    if not baseline:
+        print(f"No baseline at {args.baseline}, record one with --save.")
+
+        return 0
+
+    comparisons = compare(results, baseline, args.threshold)
+    suspects = {comparison.name for comparison in comparisons if comparison.regressed}
+
+    if suspects:
+        # Keep the faster of both runs of every benchmark that looked slower.
+        reruns = {
+            result.name: result
+            for result in run_all(
+                (benchmarks[name] for name in sorted(suspects)),
+                rounds=args.rounds,
+                min_time=args.min_time,
+            )
+        }
+        results = [
+            min(
+                result, reruns.get(result.name, result), key=lambda timed: timed.seconds
+            )
+            for result in results
+        ]
+        comparisons = compare(results, baseline, args.threshold)
+
+    for comparison in comparisons:
+        print(
+            f"{comparison.name:<24} {comparison.ratio:>6.2f}x baseline"
+            f"{'  REGRESSED' if comparison.regressed else ''}"
+        )
+
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
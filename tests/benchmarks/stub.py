@@ -0,0 +1,121 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from datetime import timedelta
+from urllib.parse import parse_qs, urlsplit
+import json
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from ordway import OrdwayClient
+
+# Returns the status and JSON body of a response.
+Handler = Callable[[PreparedRequest, Dict[str, str]], Tuple[int, Any]]
+
+
+class StubAdapter(BaseAdapter):
+    """A transport answering requests in-process, without sockets or urllib3.
+
+    `routes` maps `(method, collection)` to a handler. Bodies are encoded once per
+    distinct response, so benchmarks measure the client rather than the stub.
+    """
+
+    def __init__(self, routes: Dict[Tuple[str, str], Handler]):
+        super().__init__()
+
+        self.routes = routes
+        self.requests = 0
+        self._encoded: Dict[int, bytes] = {}
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:  # type: ignore
+        url = urlsplit(request.url)
+        collection = url.path.rstrip("/").split("/")[3]
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        status, body = self.routes[(request.method or "GET", collection)](
+            request, params
+        )
+
+        content = self._encoded.get(id(body))
+
+        if content is None:
+            content = self._encoded[id(body)] = json.dumps(body).encode("utf-8")
+
+        response = Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": "application/json", "Content-Length": str(len(content))}
+        )
+        response._content = content  # pylint: disable=protected-access
+        response.url = request.url or ""
+        response.request = request
+        response.elapsed = timedelta(0)
+        response.encoding = "utf-8"
+        self.requests += 1
+
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def customer(index: int) -> Dict[str, Any]:
+    """ A customer shaped like Ordway's, with a few nested contacts. """
+
+    return {
+        "id": f"C-{index:05}",
+        "name": f"Customer {index}",
+        "status": "Active",
+        "currency": "USD",
+        "balance": "1250.00",
+        "created_date": "2021-01-04T10:15:30.000Z",
+        "updated_date": "2021-03-18T08:00:12.000Z",
+        "contacts": [
+            {
+                "id": f"CON-{index:05}-{contact}",
+                "email": f"billing{contact}@example.com",
+                "address": {"city": "Austin", "state": "TX", "zip": "78701"},
+            }
+            for contact in range(3)
+        ],
+        "custom_fields": {"segment": "Enterprise", "region": "NA"},
+    }
+
+
+def paginated(records: List[Dict[str, Any]], nested: Optional[str] = None) -> Handler:
+    """ Serves `records` a page at a time, optionally nested like `{"usages": [...], "total": 0}`. """
+
+    pages: Dict[Tuple[int, int], Any] = {}
+
+    def handler(
+        request: PreparedRequest,
+        params: Dict[str, str],  # pylint: disable=unused-argument
+    ) -> Tuple[int, Any]:
+        key = (int(params.get("page", 1)), int(params.get("size", 20)))
+        body = pages.get(key)
+
+        if body is None:
+            page, size = key
+            results = records[(page - 1) * size : page * size]
+            body = pages[key] = (
+                results if nested is None else {nested: results, "total": len(records)}
+            )
+
+        return 200, body
+
+    return handler
+
+
+def stub_client(
+    routes: Dict[Tuple[str, str], Handler]
+) -> Tuple[OrdwayClient, StubAdapter]:
+    """ An `OrdwayClient` whose requests are all answered by a `StubAdapter`. """
+
+    client = OrdwayClient(
+        email="bench@example.com",
+        api_key="bench_api_key",
+        company="bench_company",
+        user_token="bench_user_token",
+    )
+    adapter = StubAdapter(routes)
+
+    client.session.mount("https://", adapter)
+
+    return client, adapter
@@ -0,0 +1,331 @@
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+from datetime import date, datetime, timezone
+from statistics import median
+from time import perf_counter
+import json
+from ordway.codec import StdlibCodec
+from ordway.utils import transform_datetimes
+
+from .stub import customer, paginated, stub_client
+
+# An operation returns how many units (requests, records, ...) it processed.
+Operation = Callable[[], int]
+
+
+class Benchmark(NamedTuple):
+    name: str
+    unit: str
+    setup: Callable[[], Operation]
+
+
+class Result(NamedTuple):
+    name: str
+    unit: str
+    # The time of a single operation in the fastest round, the least disturbed by noise.
+    seconds: float
+    units: int
+    # How much slower the median round was than the fastest, e.g. 0.05 for 5%.
+    spread: float = 0.0
+    # The lowest ratio of a round to the reference workload timed right before it, which
+    # a machine running slower as a whole doesn't change.
+    relative: float = 0.0
+
+    @property
+    def per_unit(self) -> float:
+        return self.seconds / self.units
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "unit": self.unit,
+            "seconds": self.seconds,
+            "units": self.units,
+            "spread": self.spread,
+            "relative": self.relative,
+        }
+
+
+class Comparison(NamedTuple):
+    name: str
+    # Seconds, or ratios to the reference workload when both results have them.
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def _request_overhead() -> Operation:
+    record = customer(1)
+    client, _ = stub_client(
+        {("GET", "customers"): lambda request, params: (200, record)}
+    )
+    interface = client.customers
+
+    def operation() -> int:
+        interface._request(  # pylint: disable=protected-access
+            "GET", "customers/C-00001"
+        )
+
+        return 1
+
+    return operation
+
+
+def _invoice_payload() -> Dict[str, Any]:
+    return {
+        "customer_id": "C-00001",
+        "invoice_date": date(2021, 3, 1),
+        "due_date": date(2021, 3, 31),
+        "line_items": [
+            {
+                "product_id": f"P-{line:04}",
+                "quantity": line % 7 + 1,
+                "service_start": date(2021, 3, 1),
+                "service_end": date(2021, 3, 31),
+                "recorded_at": datetime(2021, 3, 1, 12, 30, tzinfo=timezone.utc),
+                "tiers": [{"from": 0, "to": 100, "price": "1.50"}],
+            }
+            for line in range(500)
+        ],
+    }
+
+
+def _transform_datetimes() -> Operation:
+    payload = _invoice_payload()
+    # `transform_datetimes` converts dicts in place, so their values are put back first.
+    originals = [
+        (target, key, value)
+        for target in [payload, *payload["line_items"]]
+        for key, value in target.items()
+        if isinstance(value, (date, datetime))
+    ]
+
+    def operation() -> int:
+        for target, key, value in originals:
+            target[key] = value
+
+        transform_datetimes(payload)
+
+        return 1
+
+    return operation
+
+
+def _encode_payload() -> Operation:
+    payload = _invoice_payload()
+    codec = StdlibCodec()
+
+    def operation() -> int:
+        codec.dumps(payload)
+
+        return 1
+
+    return operation
+
+
+def _list_unwrap() -> Operation:
+    records = [customer(index) for index in range(50)]
+    client, _ = stub_client({("GET", "usages"): paginated(records, nested="usages")})
+    interface = client.usages
+
+    def operation() -> int:
+        return sum(1 for _ in interface.list(page=1, size=50))
+
+    return operation
+
+
+def _all_pagination() -> Operation:
+    records = [customer(index) for index in range(1000)]
+    client, _ = stub_client({("GET", "customers"): paginated(records)})
+    interface = client.customers
+
+    def operation() -> int:
+        return sum(1 for _ in interface.all(size=50))
+
+    return operation
+
+
+def _get_round_trip() -> Operation:
+    record = customer(1)
+    client, _ = stub_client(
+        {("GET", "customers"): lambda request, params: (200, record)}
+    )
+    interface = client.customers
+
+    def operation() -> int:
+        interface.get("C-00001")
+
+        return 1
+
+    return operation
+
+
+def _create_round_trip() -> Operation:
+    record = customer(1)
+    payload = {key: value for key, value in record.items() if key != "id"}
+    client, _ = stub_client(
+        {("POST", "customers"): lambda request, params: (201, record)}
+    )
+    interface = client.customers
+
+    def operation() -> int:
+        interface.create(payload)
+
+        return 1
+
+    return operation
+
+
+BENCHMARKS = (
+    Benchmark("request_overhead", "request", _request_overhead),
+    Benchmark("transform_datetimes", "payload", _transform_datetimes),
+    Benchmark("encode_payload", "payload", _encode_payload),
+    Benchmark("list_unwrap", "record", _list_unwrap),
+    Benchmark("all_pagination", "record", _all_pagination),
+    Benchmark("get_round_trip", "request", _get_round_trip),
+    Benchmark("create_round_trip", "request", _create_round_trip),
+)
+
+
+def _reference() -> int:
+    """ Fixed pure-Python work, timed alongside every round to tell how fast the machine is. """
+
+    return sum(len(str(number)) for number in range(2000))
+
+
+def _round(operation: Operation, number: int) -> float:
+    """ Runs `operation` `number` times, returning the seconds a single run took. """
+
+    started = perf_counter()
+
+    for _ in range(number):
+        operation()
+
+    return (perf_counter() - started) / number
+
+
+def _calibrate(operation: Operation, min_time: float) -> int:
+    """ How many runs of `operation` take at least `min_time`. """
+
+    number = 1
+
+    while True:
+        elapsed = _round(operation, number) * number
+
+        if elapsed >= min_time:
+            return number
+
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+
+
+def run_all(
+    benchmarks: Iterable[Benchmark], rounds: int = 15, min_time: float = 0.1
+) -> List[Result]:
+    """Times `benchmarks`, in rounds of however many operations take at least `min_time`.
+
+    Every round times each benchmark once, so a benchmark's rounds are spread over the
+    whole run instead of all landing in one busy stretch. The fastest round is kept,
+    since noise only ever slows rounds down, along with how far the median round was
+    from it.
+    """
+
+    benchmarks = list(benchmarks)
+    operations = [benchmark.setup() for benchmark in benchmarks]
+    # Also warms up caches and imports.
+    units = [operation() for operation in operations]
+    numbers = [_calibrate(operation, min_time) for operation in operations]
+    reference = _calibrate(_reference, min_time / 4)
+    timings: List[List[float]] = [[] for _ in benchmarks]
+    ratios: List[List[float]] = [[] for _ in benchmarks]
+
+    for _ in range(rounds):
+        for operation, number, times, relative in zip(
+            operations, numbers, timings, ratios
+        ):
+            machine = _round(_reference, reference)
+            times.append(_round(operation, number))
+            relative.append(times[-1] / machine)
+
+    results = []
+
+    for benchmark, count, times, relative in zip(benchmarks, units, timings, ratios):
+        fastest = min(times)
+        results.append(
+            Result(
+                benchmark.name,
+                benchmark.unit,
+                fastest,
+                count,
+                median(times) / fastest - 1,
+                min(relative),
+            )
+        )
+
+    return results
+
+
+def run(benchmark: Benchmark, rounds: int = 15, min_time: float = 0.1) -> Result:
+    """ Times a single benchmark, see `run_all`. """
+
+    return run_all([benchmark], rounds, min_time)[0]
+
+
+def compare(
+    results: List[Result], baseline: Dict[str, Dict[str, Any]], threshold: float
+) -> List[Comparison]:
+    """Compares results to a baseline, flagging those more than `threshold` (e.g. 0.25 for 25%) slower.
+
+    Results are compared relative to the reference workload when both have it, so a
+    machine that's busier or slower as a whole doesn't look like a regression. The spread
+    of the noisier of the two runs is added to `threshold`, so benchmarks whose rounds
+    vary a lot need to slow down by more before they're flagged.
+    """
+
+    comparisons = []
+
+    for result in results:
+        previous: Optional[Dict[str, Any]] = baseline.get(result.name)
+
+        if previous is None:
+            continue
+
+        if result.relative and previous.get("relative"):
+            before, after = previous["relative"], result.relative
+        else:
+            before, after = previous["seconds"], result.seconds
+
+        noise = max(result.spread, previous.get("spread", 0.0))
+        comparisons.append(
+            Comparison(
+                result.name,
+                before,
+                after,
+                after > before * (1 + threshold + noise),
+            )
+        )
+
+    return comparisons
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as baseline:
+            return json.load(baseline)["results"]
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(path: str, results: List[Result], metadata: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as baseline:
+        json.dump(
+            {
+                **metadata,
+                "results": {result.name: result.to_dict() for result in results},
+            },
+            baseline,
+            indent=2,
+            sort_keys=True,
+        )
+        baseline.write("\n")
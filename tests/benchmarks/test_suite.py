@@ -0,0 +1,87 @@
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+import os
+
+from .suite import BENCHMARKS, Result, compare, load_baseline, run, save_baseline
+
+
+class TestBenchmarks(TestCase):
+    def test_every_benchmark_runs(self):
+        for benchmark in BENCHMARKS:
+            with self.subTest(benchmark.name):
+                result = run(benchmark, rounds=1, min_time=0)
+
+                self.assertGreater(result.units, 0)
+                self.assertGreater(result.seconds, 0)
+
+    def test_all_pagination_reads_every_record(self):
+        benchmark = next(
+            benchmark for benchmark in BENCHMARKS if benchmark.name == "all_pagination"
+        )
+
+        self.assertEqual(benchmark.setup()(), 1000)
+
+    def test_compare_flags_regressions(self):
+        results = [
+            Result("fast", "request", 1.0, 1),
+            Result("slow", "request", 1.5, 1),
+            Result("new", "request", 1.0, 1),
+        ]
+        baseline = {"fast": {"seconds": 1.1}, "slow": {"seconds": 1.0}}
+
+        self.assertEqual(
+            [
+                (comparison.name, comparison.regressed)
+                for comparison in compare(results, baseline, threshold=0.25)
+            ],
+            [("fast", False), ("slow", True)],
+        )
+
+    def test_compare_allows_for_noisy_rounds(self):
+        baseline = {"noisy": {"seconds": 1.0, "spread": 0.4}}
+
+        self.assertFalse(
+            compare([Result("noisy", "request", 1.5, 1)], baseline, threshold=0.25)[
+                0
+            ].regressed
+        )
+        self.assertTrue(
+            compare([Result("noisy", "request", 1.7, 1)], baseline, threshold=0.25)[
+                0
+            ].regressed
+        )
+
+    def test_compare_discounts_a_slower_machine(self):
+        baseline = {"steady": {"seconds": 1.0, "relative": 2.0}}
+
+        self.assertFalse(
+            compare([Result("steady", "request", 1.6, 1, 0, 2.1)], baseline, 0.25)[
+                0
+            ].regressed
+        )
+        self.assertTrue(
+            compare([Result("steady", "request", 1.0, 1, 0, 3.0)], baseline, 0.25)[
+                0
+            ].regressed
+        )
+
+    def test_baseline_round_trip(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+
+            self.assertEqual(load_baseline(path), {})
+
+            save_baseline(path, [Result("fast", "request", 1.0, 2)], {"python": "3"})
+
+            self.assertEqual(
+                load_baseline(path),
+                {
+                    "fast": {
+                        "unit": "request",
+                        "seconds": 1.0,
+                        "units": 2,
+                        "spread": 0.0,
+                        "relative": 0.0,
+                    }
+                },
+            )
@@ -1,6 +1,7 @@
 from unittest import TestCase
 from ordway.api.base import APIBase
 from ordway import OrdwayClient
+from ordway.codec import StdlibCodec
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -12,6 +13,8 @@ class APITestCase(TestCase):
             company="TestCompany",
             user_token="TestUserToken",
             api_key="TestAPIKey",
+            # Responses are mocked through `Response.json`.
+            codec=StdlibCodec(),
         )
         self.response_patcher = patch.object(self.client.session, "request")
         self.mocked_response = self.response_patcher.start()
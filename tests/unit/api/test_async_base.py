@@ -0,0 +1,228 @@
+from asyncio import new_event_loop
+from datetime import date
+from unittest import TestCase
+from unittest.mock import patch
+from aiohttp import ClientConnectorError
+from ordway import AsyncOrdwayClient
+from ordway.api.exceptions import OrdwayAPIRequestException, OrdwayAPIException
+from ordway.api.async_base import AsyncAPIBase, AsyncListAPIMixin, AsyncGetAPIMixin
+from ordway.api.bulk import is_not_found
+
+
+def run(coro):
+    loop = new_event_loop()
+
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def collect(async_gen):
+    return [item async for item in async_gen]
+
+
+async def no_sleep(_):
+    pass
+
+
+class FakeResponse:
+    def __init__(self, status=200, body=b"{}", headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def read(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+
+        response = self.responses.pop(0)
+
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+
+class AsyncAPITestCase(TestCase):
+    def setUp(self):
+        self.client = AsyncOrdwayClient(
+            email="TestEmail",
+            company="TestCompany",
+            user_token="TestUserToken",
+            api_key="TestAPIKey",
+        )
+        self.sleep_patcher = patch("ordway.api.async_base.asyncio.sleep", new=no_sleep)
+        self.sleep_patcher.start()
+
+    def tearDown(self):
+        self.sleep_patcher.stop()
+
+    def use_responses(self, *responses):
+        self.client._session = FakeSession(*responses)
+
+        return self.client._session
+
+
+class TestAsyncAPIBase(AsyncAPITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.api_base = AsyncAPIBase(self.client)
+
+    def test_request_sends_ordway_headers(self):
+        session = self.use_responses(FakeResponse(body=b'{"foo": "bar"}'))
+
+        response = run(self.api_base._get_request("test", params={"page": "1"}))
+
+        self.assertDictEqual(response, {"foo": "bar"})
+
+        method, url, kwargs = session.calls[0]
+
+        self.assertEqual(method, "GET")
+        self.assertEqual(url, "https://app.ordwaylabs.com/api/v1/test")
+        self.assertEqual(kwargs["params"], {"page": "1"})
+        self.assertEqual(kwargs["headers"]["X-User-Company"], "TestCompany")
+
+    def test_post_request_raises_value_error_without_data_and_json(self):
+        with self.assertRaises(ValueError):
+            run(self.api_base._post_request("test"))
+
+    def test_request_retries_on_retryable_status(self):
+        session = self.use_responses(
+            FakeResponse(status=503), FakeResponse(status=429), FakeResponse()
+        )
+
+        self.assertDictEqual(run(self.api_base._get_request("test")), {})
+        self.assertEqual(len(session.calls), 3)
+
+    def test_request_gives_up_after_max_retries(self):
+        session = self.use_responses(*[FakeResponse(status=500) for _ in range(4)])
+
+        with self.assertRaises(OrdwayAPIRequestException):
+            run(self.api_base._get_request("test"))
+
+        self.assertEqual(len(session.calls), 4)
+
+    def test_request_does_not_retry_post_on_retryable_status(self):
+        session = self.use_responses(FakeResponse(status=503), FakeResponse())
+
+        with self.assertRaises(OrdwayAPIRequestException):
+            run(self.api_base._post_request("test", json={}))
+
+        self.assertEqual(len(session.calls), 1)
+
+    def test_request_retries_connection_errors(self):
+        error = ClientConnectorError(None, OSError("Connection refused"))
+        session = self.use_responses(error, FakeResponse())
+
+        self.assertDictEqual(run(self.api_base._post_request("test", json={})), {})
+        self.assertEqual(len(session.calls), 2)
+
+    def test_request_raises_with_errors_from_body(self):
+        errors = {"status": 404, "source": "refunds", "details": "Not found."}
+        self.use_responses(
+            FakeResponse(
+                status=404,
+                body=b'{"errors": %s}' % str(errors).replace("'", '"').encode(),
+            )
+        )
+
+        with self.assertRaises(OrdwayAPIRequestException) as ctx:
+            run(self.api_base._get_request("test"))
+
+        self.assertDictEqual(ctx.exception.errors, errors)
+
+    def test_request_raises_not_found_with_the_response(self):
+        self.use_responses(FakeResponse(status=404))
+
+        with self.assertRaises(OrdwayAPIRequestException) as ctx:
+            run(self.api_base._get_request("test"))
+
+        self.assertEqual(ctx.exception.response.status_code, 404)
+        self.assertTrue(is_not_found(ctx.exception))
+
+    def test_request_raises_server_errors_with_the_response(self):
+        self.client.retry_strategy = self.client.retry_strategy.new(total=0)
+        self.use_responses(FakeResponse(status=500))
+
+        with self.assertRaises(OrdwayAPIRequestException) as ctx:
+            run(self.api_base._get_request("test"))
+
+        self.assertEqual(ctx.exception.response.status_code, 500)
+        self.assertFalse(is_not_found(ctx.exception))
+
+    def test_request_transforms_datetimes_in_data(self):
+        session = self.use_responses(FakeResponse())
+
+        run(self.api_base._post_request("test", data={"date": date(2020, 1, 2)}))
+
+        self.assertEqual(session.calls[0][2]["data"], {"date": "2020-01-02"})
+
+    def test_request_raises_ordway_api_exception_on_invalid_json(self):
+        self.use_responses(FakeResponse(body=b"<html></html>"))
+
+        with self.assertRaises(OrdwayAPIRequestException):
+            run(self.api_base._get_request("test"))
+
+
+class TestAsyncListMixin(AsyncAPITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.list_api_mixin = AsyncListAPIMixin(self.client)
+        self.list_api_mixin.collection = "usages"
+
+    def test_list_unwraps_nested_results(self):
+        self.use_responses(FakeResponse(body=b'{"usages": [{"id": "1"}], "total": 1}'))
+
+        results = run(collect(self.list_api_mixin.list(page=1)))
+
+        self.assertEqual(results, [{"id": "1"}])
+
+    def test_all_pages_until_empty(self):
+        session = self.use_responses(
+            FakeResponse(body=b'[{"id": "1"}, {"id": "2"}]'),
+            FakeResponse(body=b'[{"id": "3"}]'),
+            FakeResponse(body=b"[]"),
+        )
+
+        results = run(collect(self.list_api_mixin.all(size=2)))
+
+        self.assertEqual(results, [{"id": "1"}, {"id": "2"}, {"id": "3"}])
+        self.assertEqual(
+            [call[2]["params"]["page"] for call in session.calls], ["1", "2", "3"]
+        )
+
+
+class TestAsyncGetMixin(AsyncAPITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.get_api_mixin = AsyncGetAPIMixin(self.client)
+        self.get_api_mixin.collection = "test_collection"
+
+    def test_get_handles_single_element_list_response(self):
+        self.use_responses(FakeResponse(body=b'[{"foo": "bar"}]'))
+
+        self.assertEqual(run(self.get_api_mixin.get(id="foo_id")), {"foo": "bar"})
+
+    def test_get_raises_exception_if_list_returned_has_more_than_one_element(self):
+        self.use_responses(FakeResponse(body=b'[{"foo": "bar"}, {"roy": "gbiv"}]'))
+
+        with self.assertRaises(OrdwayAPIException):
+            run(self.get_api_mixin.get(id="foo_id"))
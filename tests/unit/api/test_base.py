@@ -1,8 +1,24 @@
 from ordway.api.exceptions import OrdwayAPIRequestException, OrdwayAPIException
+from ordway.exceptions import OrdwayClientException
 from ordway.api.base import ListAPIMixin, GetAPIMixin, _remove_order_from_sort
+from ordway.cache import ResponseCache
+from ordway.metrics import InMemoryMetrics
+from ordway.models import Invoice
+from ordway.pagination import ScanCursor
+from ordway.testing import FakeOrdway
+from ordway.api.bulk import run_concurrently
+from ordway.tracing import ExportingTracer, InMemorySpanExporter
+from ordway.sync import MemoryCheckpointStore, SyncCheckpoint, parse_timestamp
+from requests import Response
 from requests.exceptions import RequestException
+from io import BytesIO
+import json
+from datetime import date
+from decimal import Decimal
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import patch, Mock
+from threading import Lock
+from time import sleep
 
 from .base import APITestCase
 
@@ -21,6 +37,27 @@ class TestAPIBase(APITestCase):
             },
         )
 
+    def test_request_encodes_json_with_codec(self):
+        self.mocked_response().json.return_value = {}
+        payload = {"date": date(2020, 1, 2), "amount": Decimal("1.10")}
+
+        self.api_base._post_request("test", json=payload)
+
+        self.assertEqual(
+            self.mocked_response.call_args[1]["data"],
+            b'{"date": "2020-01-02", "amount": "1.10"}',
+        )
+        self.assertEqual(payload["date"], date(2020, 1, 2))
+
+    def test_request_transforms_datetimes_in_data(self):
+        self.mocked_response().json.return_value = {}
+
+        self.api_base._post_request("test", data={"date": date(2020, 1, 2)})
+
+        self.assertEqual(
+            self.mocked_response.call_args[1]["data"], {"date": "2020-01-02"}
+        )
+
     def test_get_request_calls_request(self):
         self.mocked_response().json.return_value = {}
 
@@ -39,6 +76,63 @@ class TestAPIBase(APITestCase):
 
         self.assertDictEqual(response, {})
 
+    def test_request_goes_through_rate_limiter(self):
+        self.client.rate_limiter = Mock()
+        self.mocked_response().json.return_value = {}
+        self.mocked_response().status_code = 200
+
+        self.api_base._get_request("test")
+
+        self.client.rate_limiter.acquire.assert_called_once_with()
+        self.client.rate_limiter.update.assert_called_once_with(
+            200, self.mocked_response().headers
+        )
+
+    def test_request_goes_through_concurrency_limiter(self):
+        self.client.concurrency_limiter = Mock()
+        self.mocked_response().json.return_value = {}
+        self.mocked_response().status_code = 200
+
+        self.api_base._get_request("test")
+
+        permit = self.client.concurrency_limiter.acquire.return_value
+        self.client.concurrency_limiter.release.assert_called_once_with(permit, 200)
+
+    def test_request_releases_concurrency_limiter_on_request_exception(self):
+        self.client.concurrency_limiter = Mock()
+        self.mocked_response.side_effect = RequestException
+
+        with self.assertRaises(OrdwayAPIRequestException):
+            self.api_base._request("GET", "test")
+
+        permit = self.client.concurrency_limiter.acquire.return_value
+        self.client.concurrency_limiter.release.assert_called_once_with(permit, None)
+
+    def test_request_records_metrics(self):
+        self.client.metrics = InMemoryMetrics()
+        response = Response()
+        response.status_code = 201
+        response._content = b'{"id": "C-1"}'
+        self.mocked_response.return_value = response
+
+        self.api_base._post_request("customers", json={"id": "C-1"})
+        self.mocked_response.side_effect = RequestException
+
+        with self.assertRaises(OrdwayAPIRequestException):
+            self.api_base._get_request("customers/C-1")
+
+        snapshot = self.client.metrics.snapshot()
+
+        self.assertEqual(
+            snapshot["requests_total"],
+            {("customers", "POST", "201"): 1, ("customers", "GET", "error"): 1},
+        )
+        self.assertEqual(snapshot["request_bytes_total"][("customers", "POST")], 13)
+        self.assertEqual(snapshot["response_bytes_total"][("customers", "POST")], 13)
+        self.assertEqual(
+            snapshot["request_duration_seconds"][("customers", "GET")].samples, 1
+        )
+
     def test_request_raises_ordway_api_exception_on_request_exception(self):
         self.mocked_response.side_effect = RequestException
 
@@ -154,6 +248,514 @@ class TestListMixin(APITestCase):
             self.assertEqual(next(results), {"test": "1"})
             self.assertEqual(next(results), {"test": "2"})
 
+    def test_all_returns_models(self):
+        self.mocked_get_request.side_effect = [
+            [{"id": "INV-1", "status": "Paid", "line_items": [{"amount": 1}]}],
+            [],
+        ]
+        self.list_api_mixin.model = Invoice
+
+        results = list(self.list_api_mixin.all(model=True))
+
+        self.assertEqual(len(results), 1)
+        self.assertIsInstance(results[0], Invoice)
+        self.assertEqual(results[0].status, "Paid")
+        self.assertEqual(results[0].line_items, [{"amount": 1}])
+
+    def test_all_with_prefetch_yields_pages_in_order(self):
+        def get_request(endpoint, params):
+            page = int(params["page"])
+
+            # Later pages return first to ensure ordering doesn't depend on completion.
+            sleep(0.01 * (4 - page) if page < 4 else 0)
+
+            return [{"page": page, "i": i} for i in range(2)] if page < 4 else []
+
+        self.mocked_get_request.side_effect = get_request
+
+        results = list(self.list_api_mixin.all(size=2, prefetch=3))
+
+        self.assertEqual(
+            [(result["page"], result["i"]) for result in results],
+            [(1, 0), (1, 1), (2, 0), (2, 1), (3, 0), (3, 1)],
+        )
+
+    def test_all_resumes_from_cursor(self):
+        requested = []
+        fail_on = [3]
+
+        def get_request(endpoint, params):
+            page = int(params["page"])
+            requested.append(page)
+
+            if page in fail_on:
+                fail_on.remove(page)
+
+                raise OrdwayAPIRequestException("Timed out.", Mock(), Mock())
+
+            return [{"page": page, "i": i} for i in range(2)] if page < 5 else []
+
+        self.mocked_get_request.side_effect = get_request
+
+        scan = self.list_api_mixin.all(size=2, filters={"status": "Paid"})
+        results = []
+
+        with self.assertRaises(OrdwayAPIRequestException):
+            for result in scan:
+                results.append((result["page"], result["i"]))
+
+        cursor = ScanCursor.from_dict(json.loads(json.dumps(scan.cursor.to_dict())))
+
+        self.assertEqual(cursor.page, 3)
+        self.assertEqual(cursor.yielded, 4)
+        self.assertEqual(cursor.filters, {"status": "Paid"})
+
+        requested.clear()
+        resumed = self.list_api_mixin.all(resume_from=cursor)
+        results.extend((result["page"], result["i"]) for result in resumed)
+
+        self.assertEqual(requested, [3, 4, 5])
+        self.assertEqual(results, [(page, i) for page in range(1, 5) for i in range(2)])
+        self.assertEqual(resumed.cursor.yielded, 8)
+
+    def test_all_resumes_within_a_page(self):
+        self.mocked_get_request.side_effect = lambda endpoint, params: (
+            [{"page": int(params["page"]), "i": i} for i in range(3)]
+            if int(params["page"]) < 3
+            else []
+        )
+
+        for prefetch in (0, 2):
+            with self.subTest(prefetch=prefetch):
+                scan = self.list_api_mixin.all(size=3)
+                next(scan)
+                next(scan)
+                next(scan)
+                next(scan)
+                scan.close()
+
+                resumed = self.list_api_mixin.all(
+                    resume_from=scan.cursor, prefetch=prefetch
+                )
+
+                self.assertEqual(
+                    [(result["page"], result["i"]) for result in resumed],
+                    [(2, 1), (2, 2)],
+                )
+
+    def test_interleaved_scans_do_not_end_each_other(self):
+        self.mocked_get_request.side_effect = lambda endpoint, params: (
+            [{"page": int(params["page"])}] * 2 if int(params["page"]) < 4 else []
+        )
+
+        first = self.list_api_mixin.all(size=2)
+        second = self.list_api_mixin.all(size=2)
+        next(first)
+
+        self.assertEqual(len(list(second)), 6)
+        self.assertEqual(len(list(self.list_api_mixin.list(page=9))), 0)
+        self.assertEqual(len(list(first)), 5)
+
+    def test_paginate_yields_pages(self):
+        self.mocked_get_request.side_effect = lambda endpoint, params: (
+            [{"page": int(params["page"])}] * 2 if int(params["page"]) < 3 else []
+        )
+
+        for prefetch in (0, 2):
+            with self.subTest(prefetch=prefetch):
+                paginator = self.list_api_mixin.paginate(size=2, prefetch=prefetch)
+
+                self.assertEqual(
+                    list(paginator.pages()),
+                    [[{"page": 1}] * 2, [{"page": 2}] * 2],
+                )
+                self.assertTrue(paginator.exhausted)
+                self.assertEqual(paginator.pages_read, 2)
+                self.assertEqual(paginator.cursor.yielded, 4)
+
+    def test_paginate_stops_early(self):
+        requested = []
+
+        def get_request(endpoint, params):
+            requested.append(int(params["page"]))
+
+            return [{"page": int(params["page"])}] * 2
+
+        self.mocked_get_request.side_effect = get_request
+
+        paginator = self.list_api_mixin.paginate(size=2)
+
+        for page in paginator.pages():
+            break
+
+        self.assertEqual(requested, [1])
+        self.assertFalse(paginator.exhausted)
+
+    def test_all_cannot_resume_another_collection(self):
+        cursor = ScanCursor("customers", "", {}, False, 20)
+
+        with self.assertRaises(ValueError):
+            self.list_api_mixin.all(resume_from=cursor)
+
+    def test_all_with_prefetch_bounds_pages_in_flight(self):
+        lock = Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+
+        def get_request(endpoint, params):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+
+            sleep(0.01)
+
+            with lock:
+                in_flight[0] -= 1
+
+            return [{"page": params["page"]}] if int(params["page"]) < 20 else []
+
+        self.mocked_get_request.side_effect = get_request
+
+        results = list(self.list_api_mixin.all(prefetch=2))
+
+        self.assertEqual(len(results), 19)
+        self.assertLessEqual(max_in_flight[0], 2)
+
+    def test_all_with_prefetch_respects_max_pages(self):
+        self.mocked_get_request.return_value = [{"test": "1"}]
+
+        with patch.object(self.list_api_mixin, "MAX_PAGES", 5):
+            results = list(self.list_api_mixin.all(prefetch=3))
+
+        self.assertEqual(len(results), 4)
+
+    def make_streamed_response(self, body, status_code=200):
+        response = Response()
+        response.status_code = status_code
+        response.raw = BytesIO(body)
+
+        return response
+
+    def test_list_stream(self):
+        self.mocked_response.return_value = self.make_streamed_response(
+            b'{"test_collection": [{"id": "A", "lines": [1]}, {"id": "B"}], "total": 2}'
+        )
+
+        self.assertEqual(
+            list(self.list_api_mixin.list(page=1, stream=True, fields=("id",))),
+            [{"id": "A"}, {"id": "B"}],
+        )
+        self.assertTrue(self.mocked_response.call_args[1]["stream"])
+        self.mocked_get_request.assert_not_called()
+
+    def test_list_stream_errors(self):
+        self.mocked_response.return_value = self.make_streamed_response(b"[{", 200)
+
+        with self.assertRaises(OrdwayAPIRequestException):
+            list(self.list_api_mixin.list(page=1, stream=True))
+
+        self.mocked_response.return_value = self.make_streamed_response(b"", 500)
+
+        with self.assertRaises(OrdwayAPIRequestException):
+            list(self.list_api_mixin.list(page=1, stream=True))
+
+    def test_all_stream(self):
+        self.mocked_response.side_effect = [
+            self.make_streamed_response(b'[{"id": "A"}]'),
+            self.make_streamed_response(b"[]"),
+        ]
+
+        self.assertEqual(list(self.list_api_mixin.all(stream=True)), [{"id": "A"}])
+
+        with self.assertRaises(ValueError):
+            list(self.list_api_mixin.all(stream=True, prefetch=2))
+
+        with self.assertRaises(ValueError):
+            list(self.list_api_mixin.list(page=1, fields=("id",)))
+
+    def test_all_records_pages(self):
+        self.client.metrics = InMemoryMetrics()
+        self.mocked_get_request.side_effect = [[{"id": "A"}], [{"id": "B"}], []]
+
+        list(self.list_api_mixin.all())
+
+        histogram = self.client.metrics.snapshot()["pages_per_scan"][
+            ("test_collection",)
+        ]
+
+        self.assertEqual((histogram.sum, histogram.samples), (2, 1))
+
+    def test_all_is_traced(self):
+        exporter = InMemorySpanExporter()
+        self.client.tracer = ExportingTracer(exporter)
+        self.mocked_get_request.side_effect = (
+            lambda endpoint, params: self.list_api_mixin._request(
+                "GET", endpoint, params=params
+            )
+        )
+        self.mocked_response.side_effect = [
+            self.make_streamed_response(b'[{"id": "A"}, {"id": "B"}]'),
+            self.make_streamed_response(b"[]"),
+        ]
+
+        self.assertEqual(len(list(self.list_api_mixin.all())), 2)
+
+        spans = {
+            (span.name, span.attributes.get("ordway.page")): span
+            for span in exporter.spans
+        }
+        scan = spans[("ordway.all", None)]
+        page = spans[("ordway.list", 1)]
+        request = next(span for span in exporter.spans if span.name == "ordway.request")
+
+        self.assertEqual(len(exporter.spans), 5)
+        self.assertIs(page.parent, scan)
+        self.assertIs(request.parent, page)
+        self.assertEqual(scan.attributes["ordway.pages"], 1)
+        self.assertEqual(scan.attributes["ordway.records"], 2)
+        self.assertEqual(request.attributes["http.status_code"], 200)
+        self.assertTrue({"queue", "ttfb", "download", "decode"} <= set(request.phases))
+        self.assertIn("yield", page.phases)
+
+    def test_stream_is_traced(self):
+        exporter = InMemorySpanExporter()
+        self.client.tracer = ExportingTracer(exporter)
+        self.mocked_response.return_value = self.make_streamed_response(
+            b'[{"id": "A"}]'
+        )
+
+        list(self.list_api_mixin.list(page=1, stream=True))
+
+        request, page = exporter.spans
+
+        self.assertEqual((request.name, page.name), ("ordway.request", "ordway.list"))
+        self.assertIs(request.parent, page)
+        self.assertEqual(request.attributes["ordway.records"], 1)
+        self.assertTrue({"download", "decode", "yield"} <= set(request.phases))
+
+    def test_list_pages_are_cached_until_collection_changes(self):
+        self.client.cache = ResponseCache()
+        self.mocked_get_request.return_value = [{"id": "foo_id"}]
+
+        self.assertEqual(
+            list(self.list_api_mixin.list(page=1, cache=True)), [{"id": "foo_id"}]
+        )
+        self.assertEqual(
+            list(self.list_api_mixin.list(page=1, cache=True)), [{"id": "foo_id"}]
+        )
+        self.assertEqual(self.mocked_get_request.call_count, 1)
+
+        self.mocked_response().json.return_value = {}
+        self.list_api_mixin._post_request("test_collection", json={})
+        list(self.list_api_mixin.list(page=1, cache=True))
+
+        self.assertEqual(self.mocked_get_request.call_count, 2)
+
+    def test_list_and_all_bypass_cache_by_default(self):
+        self.client.cache = ResponseCache()
+        self.mocked_get_request.side_effect = [[{"id": "foo_id"}], [], []]
+
+        list(self.list_api_mixin.list(page=1))
+        list(self.list_api_mixin.all())
+        list(self.list_api_mixin.list(page=1))
+
+        self.assertEqual(self.mocked_get_request.call_count, 3)
+
+
+class TestListMixinSync(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.records = [
+            {"id": "C-1", "updated_date": "2021-01-01T00:00:00Z"},
+            {"id": "C-2", "updated_date": "2021-01-02T00:00:00Z"},
+            {"id": "C-3", "updated_date": "2021-01-02T00:00:00Z"},
+            {"id": "C-4", "updated_date": "2021-01-02T00:00:00Z"},
+            {"id": "C-5", "updated_date": "2021-01-03T00:00:00Z"},
+        ]
+        self.requested_params = []
+
+        self.get_request_patcher = patch(
+            "ordway.api.base.APIBase._get_request", side_effect=self.fake_get_request
+        )
+        self.get_request_patcher.start()
+
+        self.list_api_mixin = ListAPIMixin(self.client)
+        self.list_api_mixin.collection = "customers"
+        self.store = MemoryCheckpointStore()
+
+    def tearDown(self):
+        super().tearDown()
+
+        self.get_request_patcher.stop()
+
+    def fake_get_request(self, endpoint, params):
+        self.requested_params.append(params)
+        self.assertEqual(params["sort"], "updated_date asc")
+
+        records = sorted(
+            self.records, key=lambda r: (r.get("updated_date", ""), r["id"])
+        )
+
+        if "updated_date>" in params:
+            since = parse_timestamp(params["updated_date>"])
+            records = [r for r in records if parse_timestamp(r["updated_date"]) > since]
+
+        size, page = int(params["size"]), int(params["page"])
+
+        return records[(page - 1) * size : page * size]
+
+    def test_sync_with_cache_sees_new_records(self):
+        self.client.cache = ResponseCache(ttl=300)
+
+        self.assertEqual(self.sync_ids(since="2021-01-02T12:00:00Z"), ["C-5"])
+
+        self.records.append({"id": "C-6", "updated_date": "2021-01-04T00:00:00Z"})
+        self.store = MemoryCheckpointStore()
+
+        self.assertEqual(self.sync_ids(since="2021-01-02T12:00:00Z"), ["C-5", "C-6"])
+
+    def sync_ids(self, **kwargs):
+        return [
+            record["id"]
+            for record in self.list_api_mixin.sync(
+                checkpoint_store=self.store, **kwargs
+            )
+        ]
+
+    def test_syncs_everything_then_only_changes(self):
+        self.assertEqual(self.sync_ids(size=2), ["C-1", "C-2", "C-3", "C-4", "C-5"])
+        self.assertEqual(
+            self.store.load("customers"),
+            SyncCheckpoint("customers", "2021-01-03T00:00:00Z", frozenset({"C-5"})),
+        )
+
+        self.assertEqual(self.sync_ids(size=2), [])
+
+        self.records.append({"id": "C-2", "updated_date": "2021-01-04T00:00:00Z"})
+
+        self.assertEqual(self.sync_ids(size=2), ["C-2"])
+
+    def test_boundary_records_are_not_missed_or_repeated(self):
+        self.store.save(
+            SyncCheckpoint("customers", "2021-01-02T00:00:00Z", frozenset({"C-2"}))
+        )
+
+        self.assertEqual(self.sync_ids(size=2), ["C-3", "C-4", "C-5"])
+        self.assertEqual(
+            self.requested_params[0]["updated_date>"], "2021-01-01T23:59:59+00:00"
+        )
+
+    def test_resumes_after_crash(self):
+        synced = []
+
+        for record in self.list_api_mixin.sync(checkpoint_store=self.store, size=2):
+            synced.append(record["id"])
+
+            if record["id"] == "C-3":
+                break  # The process dies before finishing the page.
+
+        self.assertEqual(self.sync_ids(size=2), ["C-3", "C-4", "C-5"])
+
+    def test_since_overrides_checkpoint(self):
+        self.store.save(
+            SyncCheckpoint("customers", "2021-01-03T00:00:00Z", frozenset())
+        )
+
+        self.assertEqual(
+            self.sync_ids(since="2021-01-02T00:00:00Z"), ["C-2", "C-3", "C-4", "C-5"]
+        )
+
+    def test_requires_updated_date(self):
+        self.records.append({"id": "C-0"})
+
+        with self.assertRaises(OrdwayClientException):
+            self.sync_ids()
+
+
+class TestListMixinPartitioned(TestCase):
+    def setUp(self):
+        self.server = FakeOrdway().start()
+        self.server.add(
+            "customers",
+            [
+                {
+                    "id": f"C-{index:03d}",
+                    "created_date": f"2021-01-{1 + index // 4:02d}T{index % 4:02d}:00:00Z",
+                }
+                for index in range(40)
+            ],
+        )
+        self.client = self.server.client()
+
+    def tearDown(self):
+        self.client.session.close()
+        self.server.stop()
+
+    def test_scans_every_window_splitting_large_ones(self):
+        scan = self.client.customers.all(
+            size=2,
+            partition_by="created_date",
+            windows=2,
+            concurrency=3,
+            page_budget=2,
+            ascending=True,
+        )
+        ids = [record["id"] for record in scan]
+
+        self.assertEqual(ids, [f"C-{index:03d}" for index in range(40)])
+        self.assertIsNone(scan.cursor)
+
+    def test_scans_given_windows(self):
+        ids = [
+            record["id"]
+            for record in self.client.customers.all(
+                partition_by="created_date",
+                windows=[
+                    (date(2021, 1, 3), date(2021, 1, 4)),
+                    ("2021-01-09", "2021-01-20"),
+                ],
+                ascending=True,
+            )
+        ]
+
+        self.assertEqual(
+            ids, [f"C-{index:03d}" for index in [*range(8, 12), *range(32, 40)]]
+        )
+
+    def test_records_pages_read(self):
+        self.client.metrics = InMemoryMetrics()
+
+        list(
+            self.client.customers.all(
+                size=2,
+                partition_by="created_date",
+                windows=[(date(2021, 1, 3), date(2021, 1, 4))],
+            )
+        )
+
+        pages = self.client.metrics.snapshot()["pages_per_scan"][("customers",)]
+
+        self.assertEqual((pages.samples, pages.sum), (1, 2))
+
+    def test_concurrent_scans_of_one_client(self):
+        scans = run_concurrently(
+            lambda _: [record["id"] for record in self.client.customers.all(size=3)],
+            range(6),
+            6,
+        )
+
+        for result in scans:
+            self.assertIsNone(result.error)
+            self.assertEqual(len(result.result), 40)
+
+    def test_empty_collection(self):
+        self.assertEqual(list(self.client.usages.all(partition_by="created_date")), [])
+
+    def test_cannot_be_resumed(self):
+        with self.assertRaises(ValueError):
+            self.client.customers.all(partition_by="created_date", prefetch=2)
+
 
 class TestGetMixin(APITestCase):
     def setUp(self):
@@ -177,8 +779,77 @@ class TestGetMixin(APITestCase):
         self.mocked_get_request.return_value = {"foo": "bar"}
         self.assertEqual(self.get_api_mixin.get(id="foo_id"), {"foo": "bar"})
 
+    def test_get_returns_model(self):
+        self.mocked_get_request.return_value = {"id": "INV-1", "status": "Paid"}
+        self.get_api_mixin.model = Invoice
+
+        record = self.get_api_mixin.get(id="INV-1", model=True)
+
+        self.assertIsInstance(record, Invoice)
+        self.assertEqual(record.to_dict(), {"id": "INV-1", "status": "Paid"})
+
     def test_get_raises_exception_if_list_returned_has_more_than_one_element(self):
         self.mocked_get_request.return_value = [{"foo": "bar"}, {"roy": "gbiv"}]
 
         with self.assertRaises(OrdwayAPIException):
             self.get_api_mixin.get(id="foo_id")
+
+    def test_get_many_deduplicates_and_preserves_order(self):
+        def get_request(endpoint):
+            return {"id": endpoint.split("/")[-1]}
+
+        self.mocked_get_request.side_effect = get_request
+
+        result = self.get_api_mixin.get_many(["B", "A", "B", "C"], concurrency=2)
+
+        self.assertEqual(
+            [record["id"] for record in result.records], ["B", "A", "B", "C"]
+        )
+        self.assertEqual(self.mocked_get_request.call_count, 3)
+        self.assertEqual(result.missing, [])
+        self.assertEqual(result.failed, {})
+
+    def test_get_many_reports_missing_and_failed_ids(self):
+        not_found = Mock(status_code=404)
+        server_error = Mock(status_code=500)
+
+        def get_request(endpoint):
+            id = endpoint.split("/")[-1]
+
+            if id == "missing":
+                raise OrdwayAPIRequestException("404", response=not_found)
+            if id == "broken":
+                raise OrdwayAPIRequestException("500", response=server_error)
+
+            return {"id": id}
+
+        self.mocked_get_request.side_effect = get_request
+
+        result = self.get_api_mixin.get_many(["A", "missing", "broken"])
+
+        self.assertEqual(result.records, [{"id": "A"}, None, None])
+        self.assertEqual(result.missing, ["missing"])
+        self.assertEqual(list(result.failed), ["broken"])
+
+        result = self.get_api_mixin.get_many(["A", "missing", "A"], as_dict=True)
+
+        self.assertEqual(result.records, {"A": {"id": "A"}})
+
+    def test_get_uses_cache(self):
+        self.client.cache = ResponseCache()
+        self.mocked_get_request.return_value = {"foo": "bar"}
+
+        self.assertEqual(self.get_api_mixin.get(id="foo_id"), {"foo": "bar"})
+        self.assertEqual(self.get_api_mixin.get(id="foo_id"), {"foo": "bar"})
+        self.assertEqual(self.mocked_get_request.call_count, 1)
+
+    def test_writes_invalidate_cache(self):
+        self.client.cache = ResponseCache()
+        self.mocked_get_request.return_value = {"foo": "bar"}
+        self.get_api_mixin.get(id="foo_id")
+
+        self.mocked_response().json.return_value = {}
+        self.get_api_mixin._put_request("test_collection/foo_id/cancel", json={})
+        self.get_api_mixin.get(id="foo_id")
+
+        self.assertEqual(self.mocked_get_request.call_count, 2)
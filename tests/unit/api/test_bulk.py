@@ -0,0 +1,117 @@
+from unittest import TestCase
+from unittest.mock import patch
+from threading import Lock
+from time import sleep
+from ordway.api.base import CreateAPIMixin, UpdateAPIMixin, DeleteAPIMixin
+from ordway.api.bulk import run_concurrently, BulkReport
+from ordway.api.exceptions import OrdwayAPIRequestException
+
+from .base import APITestCase
+
+
+class RunConcurrentlyTestCase(TestCase):
+    def test_reports_errors_with_their_input(self):
+        error = {"status": 422, "details": "Invalid."}
+
+        def func(item):
+            if item % 2:
+                raise OrdwayAPIRequestException(errors=error)
+
+            return item * 10
+
+        report = BulkReport(run_concurrently(func, range(6), max_workers=3)).wait()
+
+        self.assertEqual(
+            sorted((r.position, r.input, r.result) for r in report.succeeded),
+            [(0, 0, 0), (2, 2, 20), (4, 4, 40)],
+        )
+        self.assertEqual(sorted(r.input for r in report.failed), [1, 3, 5])
+        self.assertTrue(all(r.errors == error for r in report.failed))
+        self.assertFalse(any(r.ok for r in report.failed))
+
+    def test_reports_other_exceptions_without_stopping(self):
+        def func(item):
+            if item == 1:
+                raise TypeError("Object of type set is not JSON serializable")
+
+            return item
+
+        report = BulkReport(run_concurrently(func, range(6), max_workers=2)).wait()
+
+        self.assertEqual(sorted(r.result for r in report.succeeded), [0, 2, 3, 4, 5])
+        self.assertEqual([r.input for r in report.failed], [1])
+        self.assertIsInstance(report.failed[0].error, TypeError)
+        self.assertIsNone(report.failed[0].errors)
+
+    def test_reads_input_lazily_and_bounds_in_flight(self):
+        lock = Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+        consumed = []
+
+        def items():
+            for item in range(20):
+                consumed.append(item)
+                yield item
+
+        def func(item):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+
+            sleep(0.005)
+
+            with lock:
+                in_flight[0] -= 1
+
+            return item
+
+        results = run_concurrently(func, items(), max_workers=4)
+        next(results)
+
+        self.assertLessEqual(len(consumed), 8)
+
+        self.assertEqual(len(list(results)), 19)
+        self.assertLessEqual(max_in_flight[0], 4)
+
+    def test_rejects_invalid_max_workers(self):
+        with self.assertRaises(ValueError):
+            list(run_concurrently(str, [1], max_workers=0))
+
+
+class TestBulkMixins(APITestCase):
+    def test_create_many(self):
+        api = CreateAPIMixin(self.client)
+        api.collection = "customers"
+
+        with patch.object(
+            api, "_post_request", side_effect=lambda *a, **kw: kw["json"]
+        ):
+            report = api.create_many([{"id": "C-1"}, {"id": "C-2"}]).wait()
+
+        self.assertEqual(
+            sorted(r.result["id"] for r in report.succeeded), ["C-1", "C-2"]
+        )
+
+    def test_update_many(self):
+        api = UpdateAPIMixin(self.client)
+        api.collection = "customers"
+
+        with patch.object(api, "_put_request") as mocked_put:
+            report = api.update_many([("C-1", {"name": "A"})]).wait()
+
+        mocked_put.assert_called_once_with(
+            "customers/C-1", json={"name": "A"}, data=None, params=None
+        )
+        self.assertEqual(report.succeeded[0].input, ("C-1", {"name": "A"}))
+
+    def test_delete_many(self):
+        api = DeleteAPIMixin(self.client)
+        api.collection = "customers"
+
+        with patch.object(
+            api, "_request", side_effect=OrdwayAPIRequestException("Not found")
+        ):
+            report = api.delete_many(["C-1", "C-2"]).wait()
+
+        self.assertEqual(sorted(r.input for r in report.failed), ["C-1", "C-2"])
@@ -0,0 +1,59 @@
+from asyncio import new_event_loop
+from unittest import TestCase
+from ordway import AsyncOrdwayClient
+from ordway.api import AsyncSubscriptions
+
+
+def run(coro):
+    loop = new_event_loop()
+
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestAsyncOrdwayClient(TestCase):
+    def setUp(self):
+        self.default_kwargs = {
+            "email": "TestEmail",
+            "company": "TestCompany",
+            "user_token": "TestUserToken",
+            "api_key": "TestAPIKey",
+        }
+
+    def test_mirrors_interfaces(self):
+        client = AsyncOrdwayClient(**self.default_kwargs)
+
+        self.assertIsInstance(client.subscriptions, AsyncSubscriptions)
+        self.assertIs(client.subscriptions.client, client)
+
+    def test_creates_session_lazily_and_closes_it(self):
+        async def use_client():
+            async with AsyncOrdwayClient(
+                **self.default_kwargs, headers={"User-Agent": "007"}
+            ) as client:
+                self.assertIsNone(client._session)
+
+                session = client.session
+
+                self.assertEqual(session.headers["User-Agent"], "007")
+                self.assertEqual(session.headers["Accept"], "application/json")
+
+            self.assertTrue(session.closed)
+            self.assertIsNone(client._session)
+
+        run(use_client())
+
+    def test_proxy_for_uses_url_scheme(self):
+        client = AsyncOrdwayClient(
+            **self.default_kwargs, proxies={"https": "http://192.168.0.1"}
+        )
+
+        self.assertEqual(client.proxy_for("https://ordway"), "http://192.168.0.1")
+        self.assertIsNone(client.proxy_for("http://ordway"))
+
+    def test_removes_v_from_api_version(self):
+        client = AsyncOrdwayClient(**self.default_kwargs, api_version="v1")
+
+        self.assertEqual(client.api_version, "1")
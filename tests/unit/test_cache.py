@@ -0,0 +1,199 @@
+from unittest import TestCase
+from threading import Event, Thread
+from tempfile import TemporaryDirectory
+from os.path import join
+from ordway.cache import (
+    BaseCache,
+    ResponseCache,
+    SQLiteCache,
+    cache_key,
+    list_cache_key,
+    FRESH,
+    STALE,
+    MISS,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ResponseCacheTestCase(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(
+            ttl=10, ttls={"plans": 100, "webhooks": 0}, max_entries=2, clock=self.clock
+        )
+
+    def test_hit_until_ttl_expires(self):
+        self.cache.store("customers", "customers/C-1", {"id": "C-1"})
+
+        self.assertEqual(self.cache.lookup("customers/C-1"), (FRESH, {"id": "C-1"}))
+
+        self.clock.now = 10
+
+        self.assertEqual(self.cache.lookup("customers/C-1"), (MISS, None))
+        self.assertEqual(self.cache.stats().hits, 1)
+        self.assertEqual(self.cache.stats().misses, 1)
+
+    def test_per_collection_ttls(self):
+        self.cache.store("plans", "plans/P-1", {"id": "P-1"})
+        self.cache.store("webhooks", "webhooks/W-1", {"id": "W-1"})
+
+        self.clock.now = 50
+
+        self.assertEqual(self.cache.lookup("plans/P-1")[0], FRESH)
+        self.assertEqual(self.cache.lookup("webhooks/W-1")[0], MISS)
+
+    def test_returns_copies(self):
+        self.cache.store("customers", "customers/C-1", {"id": "C-1"})
+        self.cache.lookup("customers/C-1")[1]["id"] = "changed"
+
+        self.assertEqual(self.cache.lookup("customers/C-1")[1], {"id": "C-1"})
+
+    def test_evicts_least_recently_used(self):
+        self.cache.store("customers", "customers/C-1", {})
+        self.cache.store("customers", "customers/C-2", {})
+        self.cache.lookup("customers/C-1")
+        self.cache.store("customers", "customers/C-3", {})
+
+        self.assertEqual(self.cache.lookup("customers/C-2")[0], MISS)
+        self.assertEqual(self.cache.lookup("customers/C-1")[0], FRESH)
+        self.assertEqual(self.cache.stats().evictions, 1)
+
+    def test_invalidate(self):
+        self.cache = ResponseCache(ttl=10, clock=self.clock)
+        self.cache.store("customers", cache_key("customers", "C-1"), {})
+        self.cache.store("customers", "customers?page=1", [])
+        self.cache.store("products", "products?page=1", [])
+        generation = self.cache.generation
+        self.cache.invalidate("customers", "C-1")
+
+        self.assertEqual(self.cache.lookup("customers/C-1")[0], MISS)
+        self.assertEqual(self.cache.lookup("customers?page=1")[0], MISS)
+        self.assertEqual(self.cache.lookup("products?page=1")[0], FRESH)
+
+        # A response fetched before the invalidation isn't stored.
+        self.cache.store("customers", "customers/C-1", {}, generation=generation)
+
+        self.assertEqual(self.cache.lookup("customers/C-1")[0], MISS)
+
+    def test_stale_while_revalidate(self):
+        cache = ResponseCache(ttl=10, stale_ttl=5, clock=self.clock)
+        cache.store("customers", "customers/C-1", {"v": 1})
+        self.clock.now = 12
+
+        self.assertEqual(cache.lookup("customers/C-1"), (STALE, {"v": 1}))
+
+        refreshed = Event()
+
+        def fetch():
+            refreshed.set()
+
+            return {"v": 2}
+
+        cache.revalidate("customers", "customers/C-1", fetch)
+
+        self.assertTrue(refreshed.wait(1))
+        cache._executor.shutdown(wait=True)
+
+        self.assertEqual(cache.lookup("customers/C-1"), (FRESH, {"v": 2}))
+        self.assertEqual(cache.stats().refreshes, 1)
+
+
+class SQLiteCacheTestCase(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = join(self.directory.name, "cache.sqlite")
+        self.clock = FakeClock()
+        self.cache = SQLiteCache(self.path, ttl=10, clock=self.clock)
+
+    def tearDown(self):
+        self.cache.close()
+        self.directory.cleanup()
+
+    def test_shared_between_instances(self):
+        other = SQLiteCache(self.path, ttl=10, clock=self.clock)
+        other.store("plans", "plans/P-1", {"id": "P-1", "amount": 1.5})
+
+        self.assertEqual(
+            self.cache.lookup("plans/P-1"), (FRESH, {"id": "P-1", "amount": 1.5})
+        )
+
+        other.close()
+
+    def test_expires(self):
+        self.cache.store("plans", "plans/P-1", {})
+        self.clock.now = 10
+
+        self.assertEqual(self.cache.lookup("plans/P-1"), (MISS, None))
+
+    def test_evicts_oldest_over_max_entries(self):
+        cache = SQLiteCache(self.path, max_entries=2, clock=self.clock)
+
+        for id in ("P-1", "P-2", "P-3"):
+            self.clock.now += 1
+            cache.store("plans", f"plans/{id}", {})
+
+        self.assertEqual(cache.lookup("plans/P-1")[0], MISS)
+        self.assertEqual(cache.lookup("plans/P-3")[0], FRESH)
+        self.assertEqual(cache.stats().size, 2)
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_evicts_oldest_over_max_bytes(self):
+        cache = SQLiteCache(self.path, max_entries=None, max_bytes=30, clock=self.clock)
+
+        for id in ("P-1", "P-2", "P-3"):
+            self.clock.now += 1
+            cache.store("plans", f"plans/{id}", {"id": id})  # 12 bytes each
+
+        self.assertEqual(cache.lookup("plans/P-1")[0], MISS)
+        self.assertEqual(cache.lookup("plans/P-2")[0], FRESH)
+
+    def test_invalidate_drops_resource_and_pages(self):
+        page_key = list_cache_key("plans", {"page": "1", "size": "20"})
+        self.cache.store("plans", "plans/P-1", {})
+        self.cache.store("plans", "plans/P-2", {})
+        self.cache.store("plans", page_key, [{}])
+        self.cache.store("products", "products?page=1", [{}])
+        generation = self.cache.generation
+
+        self.cache.invalidate("plans", "P-1")
+
+        self.assertEqual(self.cache.lookup("plans/P-1")[0], MISS)
+        self.assertEqual(self.cache.lookup(page_key)[0], MISS)
+        self.assertEqual(self.cache.lookup("plans/P-2")[0], FRESH)
+        self.assertEqual(self.cache.lookup("products?page=1")[0], FRESH)
+
+        self.cache.store("plans", "plans/P-1", {}, generation=generation)
+
+        self.assertEqual(self.cache.lookup("plans/P-1")[0], MISS)
+
+    def test_concurrent_writers(self):
+        def write(thread):
+            for index in range(20):
+                self.cache.store("plans", f"plans/{thread}-{index}", {"index": index})
+                self.cache.lookup(f"plans/{thread}-{index}")
+
+        threads = [Thread(target=write, args=(thread,)) for thread in range(4)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.cache.stats().size, 80)
+
+
+class BaseCacheTestCase(TestCase):
+    def test_incomplete_backend_cannot_be_created(self):
+        class LookupOnlyCache(BaseCache):
+            def lookup(self, key):
+                return MISS, None
+
+        with self.assertRaises(TypeError):
+            LookupOnlyCache()
@@ -1,7 +1,15 @@
-from unittest import TestCase
+from unittest import TestCase, skipUnless
+import os
+import pickle
+import signal
+from time import sleep
 from unittest.mock import MagicMock, patch
 from ordway import OrdwayClient
 from ordway.exceptions import OrdwayClientException
+from ordway.metrics import InMemoryMetrics
+from ordway.cache import ResponseCache
+from ordway.concurrency import AdaptiveConcurrencyLimiter
+from ordway.testing import FakeOrdway
 from os import environ
 from logging import getLogger, CRITICAL
 
@@ -80,3 +88,130 @@ class TestOrdwayClient(TestCase):
         with patch.dict(environ, new_environ, clear=True):
             with self.assertRaises(OrdwayClientException):
                 OrdwayClient.from_env()
+
+    def test_builds_dedicated_connection_pool(self):
+        new_client = OrdwayClient(
+            **self.default_kwargs, pool_maxsize=32, pool_block=True
+        )
+        adapter = new_client.session.adapters["https://"]
+
+        self.assertIsNot(adapter, self.client.session.adapters["https://"])
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 32)
+        self.assertEqual(new_client.pool_stats().connections_created, 0)
+
+    def test_rate_limiter_sees_retried_responses(self):
+        new_client = OrdwayClient(**self.default_kwargs, rate_limit=5)
+        response = MagicMock(status=429, headers={"Retry-After": "3"})
+
+        with patch.object(new_client.rate_limiter, "update") as mocked_update:
+            new_client.session.adapters["https://"].max_retries.increment(
+                method="GET", url="/", response=response
+            )
+
+        mocked_update.assert_called_once_with(429, {"Retry-After": "3"})
+
+    def test_metrics_see_retries(self):
+        new_client = OrdwayClient(**self.default_kwargs, metrics=InMemoryMetrics())
+        response = MagicMock(status=429, headers={"Retry-After": "3"})
+        response.getheader.return_value = "3"
+
+        new_client.session.adapters["https://"].max_retries.increment(
+            method="GET",
+            url="https://api.ordwaylabs.com/api/v1/customers",
+            response=response,
+        )
+
+        snapshot = new_client.metrics.snapshot()
+
+        self.assertEqual(snapshot["retries_total"], {("customers", "GET", "429"): 1})
+        self.assertEqual(
+            snapshot["retry_backoff_seconds_total"], {("customers", "GET"): 3}
+        )
+
+    def test_pickles_settings_with_a_new_session(self):
+        new_client = OrdwayClient(
+            **self.default_kwargs,
+            staging=True,
+            headers={"User-Agent": "007"},
+            pool_maxsize=32,
+            rate_limit=5,
+        )
+
+        unpickled = pickle.loads(pickle.dumps(new_client))
+
+        self.assertEqual(unpickled.api_key, "TestAPIKey")
+        self.assertEqual(unpickled.company, "TestCompany")
+        self.assertTrue(unpickled.customers.staging)
+        self.assertEqual(unpickled.session.headers["User-Agent"], "007")
+        self.assertEqual(unpickled.rate_limiter.max_rate, 5)
+        self.assertIsInstance(unpickled.codec, type(new_client.codec))
+        self.assertIsNot(unpickled.session, new_client.session)
+
+        adapter = unpickled.session.adapters["https://"]
+
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 32)
+        self.assertIs(adapter.max_retries.observer.__self__, unpickled)
+
+    def test_replaces_session_and_rate_limiter_after_fork(self):
+        new_client = OrdwayClient(**self.default_kwargs, rate_limit=5)
+        session = new_client.session
+        rate_limiter = new_client.rate_limiter
+
+        with patch("ordway.client.getpid", return_value=-1), patch.object(
+            session, "close"
+        ) as close:
+            self.assertIsNot(new_client.session, session)
+            self.assertIs(new_client.customers.session, new_client.session)
+            self.assertIsNot(new_client.rate_limiter, rate_limiter)
+            self.assertEqual(new_client.rate_limiter.max_rate, 5)
+
+        close.assert_not_called()
+
+    def test_resets_limiter_and_cache_after_fork(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        cache = ResponseCache(stale_ttl=60)
+        new_client = OrdwayClient(
+            **self.default_kwargs, concurrency_limiter=limiter, cache=cache
+        )
+        limiter.acquire()
+        cache._refreshing.add("customers/C-1")
+
+        with patch("ordway.client.getpid", return_value=-1):
+            new_client.session  # pylint: disable=pointless-statement
+
+        self.assertEqual(limiter.in_flight, 0)
+        self.assertEqual(cache._refreshing, set())
+        self.assertIsNone(cache._executor)
+
+    @skipUnless(hasattr(os, "fork"), "Requires os.fork.")
+    def test_forked_child_sends_requests_and_refreshes_cache(self):
+        with FakeOrdway() as server:
+            server.add("customers", [{"id": "C-1"}])
+            new_client = server.client(
+                concurrency_limiter=AdaptiveConcurrencyLimiter(initial_limit=1),
+                cache=ResponseCache(ttl=0.01, stale_ttl=60),
+            )
+            new_client.customers.get("C-1")
+            # Another thread's request in flight, and the cache's executor running, at fork time.
+            new_client.concurrency_limiter.acquire()
+            new_client.cache.revalidate("customers", "warm", lambda: None)
+
+            pid = os.fork()
+
+            if pid == 0:  # pragma: no cover
+                signal.alarm(5)
+                ok = False
+
+                try:
+                    sleep(0.05)
+                    refreshes = new_client.cache.stats().refreshes
+                    # Served stale, and refreshed in the background.
+                    new_client.customers.get("C-1")
+                    new_client.cache._executor.shutdown(wait=True)
+                    ok = new_client.cache.stats().refreshes == refreshes + 1
+                finally:
+                    os._exit(0 if ok else 1)  # pylint: disable=protected-access
+
+            _, status = os.waitpid(pid, 0)
+
+        self.assertEqual(status, 0)
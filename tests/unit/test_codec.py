@@ -0,0 +1,98 @@
+from unittest import TestCase, skipUnless
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from ordway.codec import JSONCodec, StdlibCodec, OrjsonCodec, UjsonCodec, default_codec
+from ordway.exceptions import OrdwayClientException
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+PAYLOAD = {
+    "date": date(2020, 1, 2),
+    "datetimes": [
+        datetime(2020, 1, 2, 3, 4, 5),
+        datetime(2020, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    ],
+    "amount": Decimal("10.10"),
+    "name": "Jason/✓",
+}
+
+DECODED = {
+    "date": "2020-01-02",
+    "datetimes": ["2020-01-02T03:04:05", "2020-01-02T03:04:05+00:00"],
+    "amount": "10.10",
+    "name": "Jason/✓",
+}
+
+
+class CodecTestMixin:
+    def make_codec(self):
+        raise NotImplementedError
+
+    def test_round_trip(self):
+        codec = self.make_codec()
+        encoded = codec.dumps(PAYLOAD)
+
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(codec.loads(encoded), DECODED)
+
+    def test_does_not_mutate(self):
+        payload = {"dates": [date(2020, 1, 2)]}
+
+        self.make_codec().dumps(payload)
+
+        self.assertEqual(payload, {"dates": [date(2020, 1, 2)]})
+
+    def test_invalid(self):
+        codec = self.make_codec()
+
+        with self.assertRaises(ValueError):
+            codec.loads(b"<html></html>")
+
+        with self.assertRaises(TypeError):
+            codec.dumps({"value": object()})
+
+
+class StdlibCodecTestCase(CodecTestMixin, TestCase):
+    def make_codec(self):
+        return StdlibCodec()
+
+
+@skipUnless(orjson, "orjson isn't installed.")
+class OrjsonCodecTestCase(CodecTestMixin, TestCase):
+    def make_codec(self):
+        return OrjsonCodec()
+
+    def test_is_default(self):
+        self.assertIsInstance(default_codec(), OrjsonCodec)
+
+
+@skipUnless(ujson, "ujson isn't installed.")
+class UjsonCodecTestCase(CodecTestMixin, TestCase):
+    def make_codec(self):
+        return UjsonCodec()
+
+
+class MissingCodecTestCase(TestCase):
+    @skipUnless(ujson is None, "ujson is installed.")
+    def test_missing_dependency(self):
+        with self.assertRaises(OrdwayClientException):
+            UjsonCodec()
+
+
+class JSONCodecTestCase(TestCase):
+    def test_incomplete_codec_cannot_be_created(self):
+        class EncodeOnlyCodec(JSONCodec):
+            def dumps(self, value):
+                return b"null"
+
+        with self.assertRaises(TypeError):
+            EncodeOnlyCodec()
@@ -0,0 +1,106 @@
+from unittest import TestCase
+from threading import Thread, Event
+from ordway.concurrency import AdaptiveConcurrencyLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class AdaptiveConcurrencyLimiterTestCase(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.adjustments = []
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=4,
+            max_limit=8,
+            on_adjust=self.adjustments.append,
+            clock=self.clock,
+        )
+
+    def complete(self, count, status=200, latency=0.1):
+        permits = [self.limiter.acquire() for _ in range(count)]
+        self.clock.now += latency
+
+        for permit in permits:
+            self.limiter.release(permit, status)
+
+    def test_rejects_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrencyLimiter(decrease=1.5)
+
+    def test_increases_additively_while_healthy(self):
+        self.complete(4)
+        self.complete(4)
+
+        self.assertEqual(self.limiter.limit, 5)
+        self.assertEqual(self.adjustments[-1].reason, "healthy")
+
+        for _ in range(10):
+            self.complete(self.limiter.limit)
+
+        self.assertEqual(self.limiter.limit, 8)
+
+    def test_does_not_increase_when_underused(self):
+        self.complete(1)
+
+        self.assertEqual(self.limiter.limit, 4)
+        self.assertEqual(self.adjustments, [])
+
+    def test_decreases_multiplicatively_once_per_burst_of_errors(self):
+        self.complete(4, status=503)
+
+        self.assertEqual(self.limiter.limit, 2)
+        self.assertEqual(len(self.adjustments), 1)
+        self.assertEqual(self.adjustments[0].reason, "status 503")
+
+        self.clock.now += 1
+        self.complete(2, status=None)
+
+        self.assertEqual(self.limiter.limit, 1)
+        self.assertEqual(self.limiter.stats().failures, 6)
+
+    def test_decreases_on_latency_spike(self):
+        self.complete(1, latency=0.1)
+        self.clock.now += 1
+        self.complete(1, latency=1.0)
+
+        self.assertEqual(self.limiter.limit, 2)
+        self.assertEqual(self.limiter.stats().latency_spikes, 1)
+        self.assertAlmostEqual(self.limiter.stats().baseline_latency, 0.1)
+
+    def test_latency_threshold(self):
+        limiter = AdaptiveConcurrencyLimiter(latency_threshold=0.5, clock=self.clock)
+
+        permit = limiter.acquire()
+        self.clock.now += 0.6
+        limiter.release(permit, 200)
+
+        self.assertEqual(limiter.limit, 2)
+
+    def test_blocks_when_limit_reached(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        permit = limiter.acquire()
+        acquired = Event()
+
+        def acquire():
+            limiter.acquire()
+            acquired.set()
+
+        thread = Thread(target=acquire)
+        thread.start()
+
+        self.assertFalse(acquired.wait(0.05))
+        self.assertEqual(limiter.in_flight, 1)
+
+        limiter.release(permit, 200)
+        thread.join()
+
+        self.assertTrue(acquired.is_set())
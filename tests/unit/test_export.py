@@ -0,0 +1,120 @@
+from unittest import TestCase, skipIf, skipUnless
+from datetime import date
+from tempfile import TemporaryDirectory
+import os
+
+from ordway.exceptions import OrdwayClientException
+from ordway.export import chunked, iter_record_batches, write_parquet
+from ordway.models import Invoice
+from ordway.testing import FakeOrdway
+
+try:
+    import pyarrow
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pyarrow = None  # type: ignore
+
+
+class TestChunked(TestCase):
+    def test_groups_records(self):
+        records = [{"id": index} for index in range(5)]
+
+        self.assertEqual(
+            [len(chunk) for chunk in chunked(records, 2)],
+            [2, 2, 1],
+        )
+
+    def test_is_lazy(self):
+        def records():
+            yield {"id": 1}
+            yield {"id": 2}
+
+            raise AssertionError("Read past the first chunk.")
+
+        self.assertEqual(next(chunked(records(), 2)), [{"id": 1}, {"id": 2}])
+
+    def test_rejects_empty_chunks(self):
+        with self.assertRaises(ValueError):
+            next(chunked([], 0))
+
+
+@skipIf(pyarrow is not None, "pyarrow is installed.")
+class TestWithoutPyarrow(TestCase):
+    def test_raises(self):
+        with self.assertRaises(OrdwayClientException):
+            iter_record_batches([{"id": 1}])
+
+        with self.assertRaises(OrdwayClientException):
+            write_parquet([{"id": 1}], "export.parquet")
+
+
+@skipUnless(pyarrow, "pyarrow isn't installed.")
+class TestExport(TestCase):
+    def test_infers_schema_from_first_batch(self):
+        records = [{"id": "C-1", "balance": 1.5, "notes": None}, {"id": "C-2"}]
+        records.append({"id": "C-3", "balance": 2.0, "notes": "x"})
+
+        batches = list(iter_record_batches(records, chunk_rows=2))
+
+        self.assertEqual([batch.num_rows for batch in batches], [2, 1])
+        self.assertEqual(batches[0].schema, batches[1].schema)
+        self.assertEqual(batches[0].schema.field("notes").type, pyarrow.string())
+
+    def test_fields_missing_from_the_first_batch_raise(self):
+        records = [{"id": "C-1"}, {"id": "C-2", "region": "EMEA"}]
+
+        with self.assertRaisesRegex(OrdwayClientException, "region"):
+            list(iter_record_batches(records, chunk_rows=1))
+
+    def test_fields_missing_from_a_passed_schema_are_left_out(self):
+        records = [{"id": "C-1"}, {"id": "C-2", "region": "EMEA"}]
+        schema = pyarrow.schema([("id", pyarrow.string())])
+
+        batches = list(iter_record_batches(records, chunk_rows=1, schema=schema))
+
+        self.assertEqual([batch.schema for batch in batches], [schema, schema])
+
+    def test_parses_dates_of_a_schema(self):
+        schema = pyarrow.schema(
+            [("id", pyarrow.string()), ("invoice_date", pyarrow.date32())]
+        )
+
+        (batch,) = iter_record_batches(
+            [Invoice.from_dict({"id": "INV-1", "invoice_date": "2021-01-04"})],
+            schema=schema,
+        )
+
+        self.assertEqual(batch.column(1).to_pylist(), [date(2021, 1, 4)])
+
+    def test_mismatched_records_raise(self):
+        records = [{"balance": 1.5}, {"balance": {"nested": True}}]
+
+        with self.assertRaises(OrdwayClientException):
+            list(iter_record_batches(records, chunk_rows=1))
+
+    def test_export_parquet_writes_row_groups(self):
+        with FakeOrdway() as server, TemporaryDirectory() as directory:
+            server.add("customers", [{"name": f"C{index}"} for index in range(7)])
+            client = server.client()
+            path = os.path.join(directory, "customers.parquet")
+
+            rows = client.customers.export_parquet(
+                path, chunk_rows=3, size=2, ascending=True, sort="id"
+            )
+            client.session.close()
+
+            parquet = pq.ParquetFile(path)
+
+            self.assertEqual(rows, 7)
+            self.assertEqual(parquet.metadata.num_row_groups, 3)
+            self.assertEqual(
+                parquet.read().column("name").to_pylist(),
+                [f"C{index}" for index in range(7)],
+            )
+
+    def test_export_parquet_without_records(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "empty.parquet")
+
+            self.assertEqual(write_parquet([], path), 0)
+            self.assertEqual(pq.ParquetFile(path).metadata.num_rows, 0)
@@ -0,0 +1,132 @@
+from unittest import TestCase
+from unittest.mock import patch
+from concurrent.futures import ProcessPoolExecutor
+import os
+from ordway.fanout import PageRange, fan_out
+from ordway.metrics import InMemoryMetrics
+from ordway.models import Customer
+from ordway.testing import FakeOrdway
+
+
+def record_id(record):
+    return record["id"]
+
+
+def worker_and_id(record):
+    return os.getpid(), record.id, isinstance(record, Customer)
+
+
+class TestFanOut(TestCase):
+    def setUp(self):
+        self.server = FakeOrdway().start()
+        self.server.add(
+            "customers",
+            [
+                {
+                    "id": f"C-{index:03d}",
+                    "created_date": f"2021-01-{1 + index // 4:02d}T{index % 4:02d}:00:00Z",
+                }
+                for index in range(40)
+            ],
+        )
+        self.client = self.server.client()
+
+    def tearDown(self):
+        self.client.session.close()
+        self.server.stop()
+
+    def test_processes_page_ranges_in_order(self):
+        ids = list(
+            self.client.customers.fan_out(
+                record_id, size=3, pages_per_shard=2, processes=2, ascending=True
+            )
+        )
+
+        self.assertEqual(ids, [f"C-{index:03d}" for index in range(40)])
+
+    def test_processes_records_in_worker_processes(self):
+        results = list(
+            self.client.customers.fan_out(
+                worker_and_id, size=5, pages_per_shard=1, processes=2, model=True
+            )
+        )
+
+        self.assertEqual(len(results), 40)
+        self.assertNotIn(os.getpid(), {pid for pid, _, _ in results})
+        self.assertTrue(all(typed for _, _, typed in results))
+
+    def test_processes_date_windows_splitting_large_ones(self):
+        ids = list(
+            fan_out(
+                self.client.customers,
+                record_id,
+                partition_by="created_date",
+                windows=2,
+                size=2,
+                page_budget=2,
+                processes=3,
+                ascending=True,
+            )
+        )
+
+        self.assertEqual(ids, [f"C-{index:03d}" for index in range(40)])
+
+    def test_stops_submitting_past_the_last_page(self):
+        submitted = []
+        executor = ProcessPoolExecutor(max_workers=2)
+        submit = executor.submit
+
+        def recording_submit(work, shard):
+            submitted.append(shard)
+
+            return submit(work, shard)
+
+        with patch.object(executor, "submit", recording_submit):
+            ids = list(
+                self.client.customers.fan_out(
+                    record_id, size=10, pages_per_shard=1, executor=executor
+                )
+            )
+
+        executor.shutdown()
+
+        self.assertEqual(len(ids), 40)
+        # The fifth page is empty, and the shards after it were submitted alongside.
+        self.assertLessEqual(len(submitted), 7)
+        self.assertEqual(submitted[0], PageRange(1, 1))
+
+    def test_reads_shards_past_pages_shorter_than_size(self):
+        with FakeOrdway(max_page_size=4) as server:
+            server.add("customers", [{"id": f"C-{index:03d}"} for index in range(40)])
+            client = server.client()
+            ids = list(
+                client.customers.fan_out(
+                    record_id, size=10, pages_per_shard=3, processes=2, ascending=True
+                )
+            )
+            client.session.close()
+
+        self.assertEqual(ids, [f"C-{index:03d}" for index in range(40)])
+
+    def test_records_pages_read_by_workers(self):
+        self.client.metrics = InMemoryMetrics()
+
+        list(
+            self.client.customers.fan_out(
+                record_id, size=10, pages_per_shard=3, processes=2
+            )
+        )
+
+        pages = self.client.metrics.snapshot()["pages_per_scan"][("customers",)]
+
+        self.assertEqual((pages.samples, pages.sum), (1, 4))
+
+    def test_page_ranges_stop_at_max_pages(self):
+        with patch.object(self.client.customers, "MAX_PAGES", 3):
+            ids = list(
+                self.client.customers.fan_out(
+                    record_id, size=5, pages_per_shard=2, processes=2
+                )
+            )
+
+        self.assertEqual(len(ids), 10)
@@ -0,0 +1,104 @@
+from unittest import TestCase
+from unittest.mock import patch
+from ordway.metrics import InMemoryMetrics, Metrics, collection_from_url
+
+
+class TestCollectionFromURL(TestCase):
+    def test_collection_follows_version(self):
+        self.assertEqual(
+            collection_from_url("https://api.ordwaylabs.com/api/v1/customers/C-1"),
+            "customers",
+        )
+        self.assertEqual(
+            collection_from_url("https://api.ordwaylabs.com/api/v1/invoices?page=2"),
+            "invoices",
+        )
+        self.assertEqual(collection_from_url("https://example.com/usages"), "usages")
+        self.assertEqual(collection_from_url(""), "")
+
+
+class TestMetrics(TestCase):
+    def test_noop_records_nothing(self):
+        metrics = Metrics()
+
+        self.assertFalse(metrics.enabled)
+        metrics.observe_request("customers", "GET", 200, 0.1, 0, 10)
+        metrics.observe_retry("customers", "GET", "429", 1.0)
+        metrics.observe_pages("customers", 3)
+
+
+class TestInMemoryMetrics(TestCase):
+    def setUp(self):
+        self.metrics = InMemoryMetrics(latency_buckets=(0.1, 1.0), page_buckets=(1, 5))
+
+    def test_histograms_are_cumulative(self):
+        for seconds in (0.05, 0.1, 0.5, 2.0):
+            self.metrics.observe_request("customers", "GET", 200, seconds, 0, 100)
+
+        histogram = self.metrics.snapshot()["request_duration_seconds"][
+            ("customers", "GET")
+        ]
+
+        self.assertEqual(histogram.counts, (2, 3))
+        self.assertEqual(histogram.samples, 4)
+        self.assertAlmostEqual(histogram.sum, 2.65)
+
+    def test_counters(self):
+        self.metrics.observe_request("customers", "POST", 201, 0.2, 30, 100)
+        self.metrics.observe_request("customers", "POST", None, 0.2, 30, 0)
+        self.metrics.observe_retry("customers", "POST", "503", 0.5)
+        self.metrics.observe_retry("customers", "POST", "503", 1.0)
+
+        snapshot = self.metrics.snapshot()
+
+        self.assertEqual(
+            snapshot["requests_total"],
+            {("customers", "POST", "201"): 1, ("customers", "POST", "error"): 1},
+        )
+        self.assertEqual(snapshot["request_bytes_total"], {("customers", "POST"): 60})
+        self.assertEqual(snapshot["response_bytes_total"], {("customers", "POST"): 100})
+        self.assertEqual(snapshot["retries_total"], {("customers", "POST", "503"): 2})
+        self.assertEqual(
+            snapshot["retry_backoff_seconds_total"], {("customers", "POST"): 1.5}
+        )
+
+    def test_to_prometheus(self):
+        self.metrics.observe_request("customers", "GET", 200, 0.5, 0, 100)
+        self.metrics.observe_pages("customers", 3)
+
+        text = self.metrics.to_prometheus()
+
+        self.assertIn("# TYPE ordway_request_duration_seconds histogram\n", text)
+        self.assertIn(
+            'ordway_request_duration_seconds_bucket{collection="customers",method="GET",le="0.1"} 0\n',
+            text,
+        )
+        self.assertIn(
+            'ordway_request_duration_seconds_bucket{collection="customers",method="GET",le="+Inf"} 1\n',
+            text,
+        )
+        self.assertIn(
+            'ordway_request_duration_seconds_sum{collection="customers",method="GET"} 0.5\n',
+            text,
+        )
+        self.assertIn(
+            'ordway_requests_total{collection="customers",method="GET",status="200"} 1\n',
+            text,
+        )
+        self.assertIn(
+            'ordway_pages_per_scan_bucket{collection="customers",le="5"} 1\n', text
+        )
+
+    def test_to_prometheus_rejects_non_histograms(self):
+        self.metrics.observe_pages("customers", 3)
+        snapshot = self.metrics.snapshot()
+        snapshot["pages_per_scan"] = {("customers",): 3}
+
+        with patch.object(self.metrics, "snapshot", return_value=snapshot):
+            with self.assertRaises(TypeError):
+                self.metrics.to_prometheus()
+
+    def test_to_prometheus_escapes_labels(self):
+        self.metrics.observe_retry("customers", "GET", 'Bad "error"\n', 0.0)
+
+        self.assertIn('reason="Bad \\"error\\"\\n"} 1\n', self.metrics.to_prometheus())
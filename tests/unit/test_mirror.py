@@ -0,0 +1,148 @@
+from unittest import TestCase
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from os.path import join
+from ordway import OrdwayClient
+from ordway.mirror import Mirror
+from ordway.exceptions import OrdwayClientException
+
+
+class MirrorTestCase(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = join(self.directory.name, "mirror.sqlite")
+        self.mirror = Mirror(
+            self.path, columns={"invoices": ("customer_id", "status", "updated_date")}
+        )
+        self.client = OrdwayClient(
+            email="TestEmail",
+            company="TestCompany",
+            user_token="TestUserToken",
+            api_key="TestAPIKey",
+        )
+        self.records = [
+            {
+                "id": "INV-1",
+                "customer_id": "C-1",
+                "status": "Paid",
+                "amount": 10,
+                "updated_date": "2021-01-01T00:00:00Z",
+            },
+            {
+                "id": "INV-2",
+                "customer_id": "C-2",
+                "status": "Posted",
+                "amount": 20,
+                "updated_date": "2021-01-02T00:00:00Z",
+            },
+            {
+                "id": "INV-3",
+                "customer_id": "C-1",
+                "status": "Posted",
+                "amount": 30,
+                "updated_date": "2021-01-03T00:00:00Z",
+            },
+        ]
+
+        self.get_request_patcher = patch(
+            "ordway.api.base.APIBase._get_request", side_effect=self.fake_get_request
+        )
+        self.mocked_get_request = self.get_request_patcher.start()
+
+    def tearDown(self):
+        self.get_request_patcher.stop()
+        self.mirror.close()
+        self.directory.cleanup()
+
+    def fake_get_request(self, endpoint, params):
+        records = sorted(self.records, key=lambda record: record["updated_date"])
+        since = params.get("updated_date>")
+
+        if since is not None:
+            # Good enough for the whole-second UTC timestamps used here.
+            since = since.replace("+00:00", "Z")
+            records = [record for record in records if record["updated_date"] > since]
+
+        size, page = int(params["size"]), int(params["page"])
+
+        return records[(page - 1) * size : page * size]
+
+    def test_query(self):
+        self.assertEqual(self.mirror.refresh(self.client.invoices, size=2), 3)
+
+        self.assertEqual(
+            [
+                record["id"]
+                for record in self.mirror.query(
+                    "invoices", filters={"customer_id": "C-1"}
+                )
+            ],
+            ["INV-1", "INV-3"],
+        )
+        self.assertEqual(
+            self.mirror.query(
+                "invoices",
+                filters={"status": ["Posted", "Paid"], "updated_date>": "2021-01-01"},
+                sort="updated_date",
+                ascending=False,
+                limit=1,
+            ),
+            [self.records[2]],
+        )
+        self.assertEqual(self.mirror.count("invoices", {"status!=": "Paid"}), 2)
+        self.assertEqual(self.mirror.get("invoices", "INV-2"), self.records[1])
+        self.assertIsNone(self.mirror.get("invoices", "INV-4"))
+
+    def test_refresh_is_incremental(self):
+        self.mirror.refresh(self.client.invoices)
+        self.records[0] = {**self.records[0], "status": "Void"}
+        self.records[0]["updated_date"] = "2021-01-04T00:00:00Z"
+
+        self.assertEqual(self.mirror.refresh(self.client.invoices), 1)
+        self.assertEqual(self.mirror.get("invoices", "INV-1")["status"], "Void")
+        self.assertEqual(self.mirror.count("invoices"), 3)
+        self.assertEqual(
+            self.mirror.checkpoint("invoices").high_water_mark,
+            "2021-01-04T00:00:00Z",
+        )
+
+    def test_full_refresh_drops_deleted_records(self):
+        self.mirror.refresh(self.client.invoices)
+        del self.records[1]
+
+        self.assertEqual(self.mirror.refresh(self.client.invoices, full=True), 2)
+        self.assertIsNone(self.mirror.get("invoices", "INV-2"))
+
+    def test_interrupted_refresh_keeps_committed_pages(self):
+        self.records.append({"id": "INV-4", "updated_date": "2021-01-04T00:00:00Z"})
+        self.records.append({"updated_date": "2021-01-05T00:00:00Z"})
+
+        with self.assertRaises(OrdwayClientException):
+            self.mirror.refresh(self.client.invoices, size=3)
+
+        # Pages before the failing one were committed along with their checkpoint,
+        # INV-4 was rolled back with the rest of its page.
+        self.assertEqual(self.mirror.count("invoices"), 3)
+        self.assertEqual(
+            self.mirror.checkpoint("invoices").high_water_mark,
+            "2021-01-03T00:00:00Z",
+        )
+
+    def test_new_columns_are_backfilled(self):
+        self.mirror.refresh(self.client.invoices)
+
+        mirror = Mirror(self.path, columns={"invoices": ("amount",)})
+
+        self.assertEqual(
+            [record["id"] for record in mirror.query("invoices", {"amount>=": 20})],
+            ["INV-2", "INV-3"],
+        )
+
+        mirror.close()
+
+    def test_only_columns_can_be_queried(self):
+        with self.assertRaises(OrdwayClientException):
+            self.mirror.query("invoices", filters={"amount": 10})
+
+        with self.assertRaises(OrdwayClientException):
+            self.mirror.query("invoices", sort="amount")
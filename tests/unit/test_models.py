@@ -0,0 +1,140 @@
+from unittest import TestCase
+import json
+import pickle
+import tracemalloc
+
+from ordway.api.endpoints import Customers, Invoices, Statements
+from ordway.models import Customer, Invoice, Record
+
+
+def invoice(index: int):
+    return {
+        "id": f"INV-{index:06d}",
+        "customer_id": f"C-{index % 50:05d}",
+        "status": "Posted",
+        "currency": "USD",
+        "invoice_date": "2021-01-04",
+        "due_date": "2021-02-03",
+        "subtotal": 100.0 + index,
+        "invoice_amount": 100.0 + index,
+        "balance": 100.0 + index,
+        "payment_terms": "Net 30",
+        "created_by": "api@example.com",
+        "updated_by": "api@example.com",
+        "created_date": "2021-01-04T10:15:30.000Z",
+        "updated_date": "2021-01-05T10:15:30.000Z",
+        "custom_fields": {"region": "EMEA"},
+        "line_items": [
+            {
+                "line_no": line,
+                "product_id": "P-00001",
+                "description": "Platform fee",
+                "quantity": 1,
+                "unit_price": 10.0,
+                "amount": 10.0,
+                "service_start_date": "2021-01-01",
+                "service_end_date": "2021-01-31",
+            }
+            for line in range(5)
+        ],
+    }
+
+
+class TestRecord(TestCase):
+    def test_fields(self):
+        record = Invoice.from_dict(invoice(1))
+
+        self.assertEqual(record.id, "INV-000001")
+        self.assertEqual(record["status"], "Posted")
+        self.assertIsNone(record.notes)
+        self.assertNotIn("notes", record)
+        self.assertIn("status", record)
+
+        with self.assertRaises(KeyError):
+            record["notes"]  # pylint: disable=pointless-statement
+
+        with self.assertRaises(AttributeError):
+            record.unknown  # pylint: disable=pointless-statement,no-member
+
+    def test_has_no_dict(self):
+        self.assertFalse(hasattr(Invoice.from_dict(invoice(1)), "__dict__"))
+
+    def test_unknown_fields_are_extra(self):
+        record = Invoice.from_dict({"id": "INV-1", "region": "EMEA"})
+
+        self.assertEqual(record.extra, {"region": "EMEA"})
+        self.assertEqual(record.region, "EMEA")  # pylint: disable=no-member
+        self.assertEqual(record["region"], "EMEA")
+
+    def test_to_dict_round_trips(self):
+        data = invoice(1)
+        record = Invoice.from_dict(data)
+
+        self.assertEqual(record.to_dict(), data)
+        self.assertEqual(record, data)
+        self.assertEqual(json.loads(json.dumps(record.to_dict())), data)
+
+    def test_nested_fields_are_decoded_lazily(self):
+        data = invoice(1)
+        record = Invoice.from_dict(data)
+
+        # pylint: disable=protected-access
+        self.assertIsInstance(record._line_items, bytes)
+        self.assertEqual(record.line_items, data["line_items"])
+        self.assertIsInstance(record._line_items, list)
+        self.assertIs(record.line_items, record.line_items)
+
+    def test_enum_like_strings_are_interned(self):
+        first = Invoice.from_dict(json.loads(json.dumps(invoice(1))))
+        second = Invoice.from_dict(json.loads(json.dumps(invoice(2))))
+
+        self.assertIs(first.status, second.status)
+        self.assertIs(first.created_by, second.created_by)
+        self.assertIs(first.invoice_date, second.invoice_date)
+
+    def test_is_read_only(self):
+        record = Invoice.from_dict(invoice(1))
+
+        with self.assertRaises(AttributeError):
+            record.status = "Paid"
+
+        with self.assertRaises(AttributeError):
+            record.notes = "Thanks"
+
+        with self.assertRaises(AttributeError):
+            del record.status
+
+        self.assertEqual(record.status, "Posted")
+
+    def test_pickles(self):
+        record = Invoice.from_dict(invoice(1))
+
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+
+    def test_base_record_keeps_every_field(self):
+        record = Record.from_dict({"id": "S-1", "status": "Sent"})
+
+        self.assertEqual(record.to_dict(), {"id": "S-1", "status": "Sent"})
+
+    def test_endpoints_have_models(self):
+        self.assertIs(Customers.model, Customer)
+        self.assertIs(Invoices.model, Invoice)
+        self.assertIs(Statements.model, Record)
+
+    def test_uses_a_third_of_the_memory(self):
+        body = json.dumps([invoice(index) for index in range(2000)])
+
+        tracemalloc.start()
+
+        try:
+            records = json.loads(body)
+            as_dicts = tracemalloc.get_traced_memory()[0]
+            del records
+
+            tracemalloc.clear_traces()
+            records = [Invoice.from_dict(record) for record in json.loads(body)]
+            as_models = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        self.assertGreaterEqual(as_dicts / as_models, 3)
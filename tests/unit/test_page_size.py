@@ -0,0 +1,152 @@
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from itertools import islice
+import os
+
+from ordway.page_size import DEFAULT_PAGE_SIZE, AdaptivePageSizer, PageSizer
+from ordway.pagination import ScanCursor
+from ordway.testing import FakeOrdway
+
+
+class OversizedPageSizer(PageSizer):
+    """ Always picks pages of 100, past the documented limit of 50. """
+
+    enabled = True
+
+    def size(self, collection, max_page_size):
+        return 100
+
+    def max_page_size(self, collection, max_page_size):
+        return 100
+
+
+class TestPageSizer(TestCase):
+    def test_picks_default_size(self):
+        sizer = PageSizer()
+
+        self.assertEqual(sizer.size("customers", 50), DEFAULT_PAGE_SIZE)
+        self.assertEqual(sizer.size("customers", 10), 10)
+        self.assertEqual(sizer.max_page_size("customers", 50), 50)
+
+
+class TestAdaptivePageSizer(TestCase):
+    def observe(self, sizer, size, seconds, times=1, response_bytes=0):
+        for _ in range(times):
+            sizer.observe("customers", size, size, seconds, response_bytes)
+
+    def test_starts_at_documented_limit(self):
+        sizer = AdaptivePageSizer(candidates=(20, 100))
+
+        self.assertEqual(sizer.size("customers", 50), 50)
+
+    def test_explores_neighbours_then_settles_on_fastest(self):
+        sizer = AdaptivePageSizer(candidates=(20, 50, 100, 200), min_samples=2)
+        sizer.size("customers", 50)
+
+        self.observe(sizer, 50, 0.5, times=2)  # 100 records/s
+        self.assertEqual(sizer.size("customers", 50), 100)
+
+        self.observe(sizer, 100, 0.5, times=2)  # 200 records/s
+        self.assertEqual(sizer.size("customers", 50), 200)
+
+        self.observe(sizer, 200, 2.0, times=2)  # 100 records/s
+        self.assertEqual(sizer.size("customers", 50), 100)
+
+    def test_partial_pages_are_ignored(self):
+        sizer = AdaptivePageSizer(candidates=(20, 100), min_samples=1)
+        sizer.observe("customers", 50, 3, 0.1, 0)
+
+        self.assertEqual(sizer.size("customers", 50), 50)
+        self.assertEqual(sizer.to_dict()["customers"]["rates"], {})
+
+    def test_cap_limits_sizes(self):
+        sizer = AdaptivePageSizer(candidates=(20, 50, 100, 200), min_samples=1)
+        sizer.size("customers", 50)
+        self.observe(sizer, 100, 0.1)
+
+        sizer.observe_cap("customers", 75)
+
+        self.assertEqual(sizer.max_page_size("customers", 50), 75)
+        self.assertNotIn("100", sizer.to_dict()["customers"]["rates"])
+        self.assertLessEqual(sizer.size("customers", 50), 75)
+
+    def test_skips_sizes_over_the_response_budget(self):
+        sizer = AdaptivePageSizer(
+            candidates=(20, 50, 100), min_samples=1, max_response_bytes=5000
+        )
+        sizer.size("customers", 50)
+        self.observe(sizer, 50, 0.1, response_bytes=50 * 100)
+
+        self.assertEqual(sizer.size("customers", 50), 20)
+
+    def test_persists(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "page_sizes.json")
+            sizer = AdaptivePageSizer(candidates=(20, 50, 100), path=path)
+            sizer.size("customers", 50)
+            sizer.observe_cap("customers", 50)
+
+            self.assertEqual(
+                AdaptivePageSizer(path=path).max_page_size("customers", 50), 50
+            )
+
+    def test_learns_ordways_limit_while_scanning(self):
+        with FakeOrdway(max_page_size=50) as server:
+            server.add("customers", [{"name": f"C{index}"} for index in range(230)])
+            sizer = AdaptivePageSizer(candidates=(20, 50, 100), min_samples=1)
+            client = server.client(page_sizer=sizer)
+
+            for _ in range(3):
+                ids = [record["id"] for record in client.customers.all(sort="id")]
+
+                self.assertEqual(len(ids), 230)
+                self.assertEqual(len(set(ids)), 230)
+
+            client.session.close()
+
+        self.assertEqual(sizer.max_page_size("customers", 50), 50)
+        self.assertEqual(sizer.size("customers", 50), 50)
+
+    def test_resumes_scans_of_capped_pages(self):
+        with FakeOrdway(max_page_size=50) as server:
+            server.add("customers", [{"name": f"C{index}"} for index in range(230)])
+            client = server.client(page_sizer=OversizedPageSizer())
+
+            for prefetch in (0, 2):
+                with self.subTest(prefetch=prefetch):
+                    scan = client.customers.all(sort="id", prefetch=prefetch)
+                    ids = [record["id"] for record in islice(scan, 120)]
+                    scan.close()
+
+                    self.assertEqual(scan.cursor.size, 100)
+                    self.assertEqual((scan.cursor.page, scan.cursor.offset), (3, 20))
+
+                    ids.extend(
+                        record["id"]
+                        for record in client.customers.all(
+                            resume_from=ScanCursor.from_dict(scan.cursor.to_dict())
+                        )
+                    )
+
+                    self.assertEqual(len(ids), 230)
+                    self.assertEqual(len(set(ids)), 230)
+
+            client.session.close()
+
+    def test_sizes_callers_pass_keep_the_documented_limit(self):
+        with FakeOrdway(max_page_size=500) as server:
+            server.add("customers", [{"name": f"C{index}"} for index in range(230)])
+            client = server.client(page_sizer=AdaptivePageSizer())
+
+            with self.assertLogs("ordway.api.base", "WARNING"):
+                records = list(client.customers.list(page=1, size=200))
+
+            self.assertEqual(len(records), 50)
+
+            with self.assertLogs("ordway.api.base", "WARNING"):
+                scan = client.customers.all(size=200)
+
+            self.assertEqual(scan.cursor.size, 50)
+            self.assertEqual(len(list(scan)), 230)
+
+            client.session.close()
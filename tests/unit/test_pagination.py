@@ -0,0 +1,73 @@
+from unittest import TestCase
+from unittest.mock import Mock
+from datetime import date, datetime, timedelta, timezone
+
+from ordway.pagination import Scan, ScanCursor, split_window, to_timestamp
+
+
+class TestScanCursor(TestCase):
+    def test_round_trips(self):
+        cursor = ScanCursor("invoices", "id", {"status": "Paid"}, True, 20, 3, 45, 5)
+
+        self.assertEqual(ScanCursor.from_dict(cursor.to_dict()), cursor)
+
+    def test_reads_cursors_without_an_offset(self):
+        data = ScanCursor("invoices", "id", {}, True, 20, 3, 45).to_dict()
+        del data["offset"]
+
+        self.assertEqual(ScanCursor.from_dict(data).offset, 5)
+
+
+class TestScan(TestCase):
+    def test_cursor_is_the_paginators(self):
+        paginator = Mock(cursor=ScanCursor("invoices", "", {}, False, 2, 2, 2))
+        scan = Scan(iter(range(5)), paginator)
+
+        self.assertEqual(next(scan), 0)
+        self.assertIs(scan.cursor, paginator.cursor)
+        self.assertIsNone(Scan(iter(range(5)), None).cursor)
+
+    def test_close_closes_records(self):
+        closed = []
+
+        def records():
+            try:
+                yield 1
+                yield 2
+            finally:
+                closed.append(True)
+
+        scan = Scan(records(), ScanCursor("invoices", "", {}, False, 2))
+        next(scan)
+        scan.close()
+
+        self.assertEqual(closed, [True])
+
+
+class TestWindows(TestCase):
+    def test_to_timestamp(self):
+        expected = datetime(2021, 1, 4, tzinfo=timezone.utc)
+
+        self.assertEqual(to_timestamp(date(2021, 1, 4)), expected)
+        self.assertEqual(to_timestamp(datetime(2021, 1, 4)), expected)
+        self.assertEqual(to_timestamp("2021-01-04T00:00:00.000Z"), expected)
+
+    def test_split_window(self):
+        start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+        windows = split_window((start, start + timedelta(days=3)), 3)
+
+        self.assertEqual(
+            windows,
+            [
+                (start + timedelta(days=day), start + timedelta(days=day + 1))
+                for day in range(3)
+            ],
+        )
+
+    def test_split_window_stops_at_a_second(self):
+        start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+        self.assertEqual(
+            split_window((start, start + timedelta(seconds=1)), 2),
+            [(start, start + timedelta(seconds=1))],
+        )
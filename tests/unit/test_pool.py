@@ -0,0 +1,168 @@
+from unittest import TestCase
+from unittest.mock import patch
+from ordway import OrdwayClient, OrdwayClientPool
+from ordway.exceptions import OrdwayClientException
+from ordway.session import ObservedRetry
+from ordway.testing import FakeOrdway
+
+
+def credentials(company):
+    return {
+        "company": company,
+        "email": f"{company}@example.com",
+        "api_key": f"{company}_key",
+        "user_token": f"{company}_token",
+    }
+
+
+class TestOrdwayClientPool(TestCase):
+    def setUp(self):
+        self.server = FakeOrdway().start()
+        self.server.add("customers", [{"name": "Acme"}])
+        self.pool = OrdwayClientPool(
+            max_tenants=2, pool_maxsize=4, base_url=self.server.base_url
+        )
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.stop()
+
+    def test_clients_share_the_pool_session(self):
+        acme = self.pool.client(**credentials("acme"))
+        globex = self.pool.client(**credentials("globex"))
+
+        self.assertIsInstance(acme, OrdwayClient)
+        self.assertIs(acme.session, self.pool.session)
+        self.assertIs(globex.session, self.pool.session)
+
+        list(acme.customers.list(page=1))
+        list(globex.customers.list(page=1))
+
+        self.assertEqual(self.pool.pool_stats().connections_created, 1)
+
+    def test_returns_the_same_client_for_a_company(self):
+        acme = self.pool.client(**credentials("acme"))
+
+        self.assertIs(self.pool.client(**credentials("acme")), acme)
+        self.assertEqual(len(self.pool), 1)
+
+    def test_sends_each_companys_credentials(self):
+        acme = self.pool.client(**credentials("acme"))
+        globex = self.pool.client(**credentials("globex"))
+        session = self.pool.session
+
+        with patch.object(session, "request", wraps=session.request) as request:
+            list(acme.customers.list(page=1))
+            list(globex.customers.list(page=1))
+
+        sent = [call[1]["headers"] for call in request.call_args_list]
+
+        self.assertEqual(
+            [(headers["X-User-Company"], headers["X-API-Key"]) for headers in sent],
+            [("acme", "acme_key"), ("globex", "globex_key")],
+        )
+        self.assertNotIn("X-User-Company", session.headers)
+
+    def test_replaces_client_when_credentials_change(self):
+        acme = self.pool.client(**credentials("acme"), rate_limit=5)
+        rotated = self.pool.client(**{**credentials("acme"), "api_key": "rotated"})
+
+        self.assertIsNot(rotated, acme)
+        self.assertEqual(acme.api_key, "acme_key")
+        self.assertEqual(rotated.api_key, "rotated")
+        self.assertIs(rotated.rate_limiter, acme.rate_limiter)
+        self.assertIs(
+            self.pool.client(**{**credentials("acme"), "api_key": "rotated"}), rotated
+        )
+
+    def test_cookies_are_not_shared_between_companies(self):
+        handle = self.server.handle
+        cookies = []
+
+        def handle_setting_cookie(method, path, headers, body=None):
+            cookies.append(headers.get("Cookie"))
+            status, reply_headers, payload = handle(method, path, headers, body)
+
+            return (
+                status,
+                {**reply_headers, "Set-Cookie": "tenant=acme; Path=/"},
+                payload,
+            )
+
+        with patch.object(self.server, "handle", handle_setting_cookie):
+            list(self.pool.client(**credentials("acme")).customers.list(page=1))
+            list(self.pool.client(**credentials("globex")).customers.list(page=1))
+
+        self.assertEqual(cookies, [None, None])
+        self.assertEqual(len(self.pool.session.cookies), 0)
+
+    def test_evicts_least_recently_used_company(self):
+        self.pool.client(**credentials("acme"))
+        self.pool.client(**credentials("globex"))
+        self.pool.client(**credentials("acme"))
+        self.pool.client(**credentials("initech"))
+
+        self.assertIn("acme", self.pool)
+        self.assertNotIn("globex", self.pool)
+        self.assertEqual(self.pool.evictions, 1)
+
+    def test_evicts_idle_companies(self):
+        pool = OrdwayClientPool(idle_timeout=60)
+
+        with patch("ordway.pool.monotonic", return_value=0):
+            acme = pool.client(**credentials("acme"))
+
+        with patch("ordway.pool.monotonic", return_value=30):
+            pool.client(**credentials("globex"))
+
+        with patch("ordway.pool.monotonic", return_value=61):
+            self.assertIsNot(pool.client(**credentials("acme")), acme)
+
+        self.assertEqual(pool.evictions, 1)
+        self.assertIn("globex", pool)
+
+        pool.close()
+
+    def test_companies_get_their_own_rate_limiters(self):
+        pool = OrdwayClientPool(rate_limit=5)
+
+        acme = pool.client(**credentials("acme"))
+        globex = pool.client(**credentials("globex"), rate_limit=1)
+
+        self.assertIsNot(acme.rate_limiter, globex.rate_limiter)
+        self.assertEqual(acme.rate_limiter.rate, 5)
+        self.assertEqual(globex.rate_limiter.rate, 1)
+
+        pool.close()
+
+    def test_retries_reach_the_retrying_companys_client(self):
+        acme = self.pool.client(**credentials("acme"))
+        globex = self.pool.client(**credentials("globex"))
+        retry = self.pool.session.get_adapter(self.server.base_url).max_retries
+
+        self.assertIsInstance(retry, ObservedRetry)
+
+        with patch.object(acme, "observe_retry") as acme_retries, patch.object(
+            globex, "observe_retry"
+        ) as globex_retries, patch("urllib3.util.retry.Retry.sleep"):
+            self.server.inject(503, retry_after=0)
+            list(globex.customers.list(page=1))
+
+        acme_retries.assert_not_called()
+        globex_retries.assert_called_once()
+
+    def test_closing_a_client_leaves_the_session_open(self):
+        with self.pool.client(**credentials("acme")):
+            pass
+
+        self.assertEqual(
+            len(list(self.pool.client(**credentials("acme")).customers.list(page=1))), 1
+        )
+
+    def test_rejects_per_company_settings(self):
+        with self.assertRaises(OrdwayClientException):
+            OrdwayClientPool(cache=object())
+
+    def test_shared_session_requires_session(self):
+        with self.assertRaises(OrdwayClientException):
+            OrdwayClient(**credentials("acme"), shared_session=True)
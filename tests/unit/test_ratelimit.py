@@ -0,0 +1,107 @@
+from unittest import TestCase
+from unittest.mock import patch
+from threading import Thread
+from email.utils import formatdate
+from time import time
+from ordway.ratelimit import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class ParseRetryAfterTestCase(TestCase):
+    def test_parses_seconds(self):
+        self.assertEqual(parse_retry_after("5"), 5.0)
+        self.assertEqual(parse_retry_after(" 1.5 "), 1.5)
+
+    def test_parses_http_date(self):
+        retry_after = parse_retry_after(formatdate(time() + 30, usegmt=True))
+
+        self.assertGreater(retry_after, 25)
+        self.assertLessEqual(retry_after, 30)
+
+    def test_returns_none_for_garbage(self):
+        self.assertIsNone(parse_retry_after("soon"))
+
+
+class RateLimiterTestCase(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(2, burst=3, clock=self.clock)
+
+    def test_allows_burst_then_spaces_requests(self):
+        self.assertEqual(
+            [self.limiter.reserve() for _ in range(5)], [0, 0, 0, 0.5, 1.0]
+        )
+
+    def test_refills_over_time(self):
+        for _ in range(3):
+            self.limiter.reserve()
+
+        self.clock.now += 1
+
+        self.assertEqual([self.limiter.reserve() for _ in range(3)], [0, 0, 0.5])
+
+    def test_retry_after_blocks_all_callers(self):
+        self.limiter.update(429, {"Retry-After": "7"})
+
+        self.assertEqual(self.limiter.reserve(), 7)
+        self.assertEqual(self.limiter.reserve(), 7)
+
+    def test_rate_limited_without_retry_after_waits_for_a_token(self):
+        self.limiter.update(429, {})
+
+        self.assertEqual(self.limiter.reserve(), 0.5)
+
+    def test_retunes_rate_from_headers(self):
+        self.limiter.update(
+            200, {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": "4"}
+        )
+
+        self.assertEqual(self.limiter.rate, 0.5)
+        self.assertEqual([self.limiter.reserve() for _ in range(3)], [0, 0, 2])
+
+        self.limiter.update(
+            200, {"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "10"}
+        )
+
+        self.assertEqual(self.limiter.rate, 2)
+
+    def test_exhausted_quota_blocks_until_reset(self):
+        self.limiter.update(200, {"RateLimit-Remaining": "0", "RateLimit-Reset": "3"})
+
+        self.assertEqual(self.limiter.reserve(), 3)
+
+    def test_is_thread_safe(self):
+        limiter = RateLimiter(10, burst=10, clock=self.clock)
+        delays = []
+
+        def reserve():
+            for _ in range(10):
+                delays.append(limiter.reserve())
+
+        threads = [Thread(target=reserve) for _ in range(5)]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Every reservation gets its own slot: 10 immediately, then one every 0.1s.
+        self.assertEqual(
+            sorted(round(delay, 6) for delay in delays),
+            [0.0] * 10 + [round(0.1 * i, 6) for i in range(1, 41)],
+        )
+
+    def test_acquire_sleeps_for_reserved_delay(self):
+        self.limiter.update(429, {"Retry-After": "2"})
+
+        with patch("ordway.ratelimit.sleep") as mocked_sleep:
+            self.limiter.acquire()
+
+        mocked_sleep.assert_called_once_with(2)
@@ -1,6 +1,35 @@
 from unittest import TestCase
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+from threading import Thread
+from pickle import dumps, loads
+import socket
 from requests import Session
-from ordway.session import TimeoutAdapter, timeout_retry_adapter, session_factory
+from ordway.session import (
+    TimeoutAdapter,
+    retry_strategy,
+    session_factory,
+    keep_alive_socket_options,
+)
+from ordway.tracing import ACQUIRE, CONNECT, Span, activate
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
 
 
 class SessionFactoryTestCase(TestCase):
@@ -8,13 +37,50 @@ class SessionFactoryTestCase(TestCase):
         existing_session = Session()
         session_factory(existing_session)
 
-        self.assertEqual(existing_session.adapters["http://"], timeout_retry_adapter)
-        self.assertEqual(existing_session.adapters["https://"], timeout_retry_adapter)
+        adapter = existing_session.adapters["https://"]
+
+        self.assertIsInstance(adapter, TimeoutAdapter)
+        self.assertIs(adapter.max_retries, retry_strategy)
+        self.assertIs(existing_session.adapters["http://"], adapter)
 
     def test_attaches_retry_adapter_for_new_session(self):
         new_session = session_factory()
-        self.assertEqual(new_session.adapters["http://"], timeout_retry_adapter)
-        self.assertEqual(new_session.adapters["https://"], timeout_retry_adapter)
+
+        self.assertIsInstance(new_session.adapters["https://"], TimeoutAdapter)
+        self.assertIsInstance(new_session.adapters["http://"], TimeoutAdapter)
+
+    def test_sessions_do_not_share_adapters(self):
+        self.assertIsNot(
+            session_factory().adapters["https://"],
+            session_factory().adapters["https://"],
+        )
+
+    def test_retry_observer_is_notified(self):
+        retries = []
+        session = session_factory(
+            retry_observer=lambda retry, response, error: retries.append(error)
+        )
+        retry = session.adapters["https://"].max_retries
+
+        self.assertIsNot(retry, retry_strategy)
+
+        error = ConnectionError()
+        new_retry = retry.increment(method="GET", url="/", error=error)
+
+        self.assertEqual(retries, [error])
+        self.assertIs(new_retry.observer, retry.observer)
+
+    def test_configures_pool(self):
+        adapter = session_factory(
+            pool_connections=2, pool_maxsize=25, pool_block=True, keep_alive=30
+        ).adapters["https://"]
+
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 25)
+        self.assertTrue(adapter.poolmanager.connection_pool_kw["block"])
+        self.assertIn(
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            adapter.poolmanager.connection_pool_kw["socket_options"],
+        )
 
 
 class TimeoutAdapterTestCase(TestCase):
@@ -30,3 +96,63 @@ class TimeoutAdapterTestCase(TestCase):
 
         self.assertIn("timeout", state)
         self.assertEqual(state["timeout"], 15)
+
+    def test_survives_pickling(self):
+        options = keep_alive_socket_options(30)
+        adapter = loads(dumps(TimeoutAdapter(pool_maxsize=3, socket_options=options)))
+
+        self.assertEqual(adapter.socket_options, options)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 3)
+        self.assertEqual(adapter.pool_stats().connections_created, 0)
+
+    def test_pool_stats_counts_created_and_reused_connections(self):
+        server = _ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            session = session_factory()
+            url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+            for _ in range(3):
+                session.get(url).json()
+
+            stats = session.adapters["http://"].pool_stats()
+
+            session.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(stats.connections_created, 1)
+        self.assertEqual(stats.connections_reused, 2)
+        self.assertEqual(stats.connections_in_use, 0)
+        self.assertEqual(stats.connections_idle, 1)
+        self.assertEqual(stats.connections_discarded, 0)
+
+    def test_active_span_sees_connection_phases(self):
+        server = _ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        thread = Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            session = session_factory()
+            url = f"http://127.0.0.1:{server.server_address[1]}/"
+            first, second = Span("first"), Span("second")
+
+            with activate(first):
+                session.get(url).json()
+
+            with activate(second):
+                session.get(url).json()
+
+            session.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertIn(ACQUIRE, first.phases)
+        self.assertIn(CONNECT, first.phases)
+        # The connection is reused.
+        self.assertIn(ACQUIRE, second.phases)
+        self.assertNotIn(CONNECT, second.phases)
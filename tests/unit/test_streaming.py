@@ -0,0 +1,88 @@
+from unittest import TestCase
+import json
+from ordway.streaming import iter_records, build_projection
+
+
+def chunked(data, size):
+    encoded = json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+    return [encoded[i : i + size] for i in range(0, len(encoded), size)]
+
+
+RECORDS = [
+    {
+        "id": "RS-1",
+        "name": 'Tricky "quoted" [brackets] {braces} \\ and ünïcødé ✓',
+        "amount": -1.5e3,
+        "active": True,
+        "deleted": None,
+        "line_items": [
+            {"amount": 1, "schedule": [{"date": "2021-01-01", "amount": 1}]},
+            {"amount": 2, "schedule": []},
+        ],
+    },
+    {"id": "RS-2", "name": "", "amount": 0, "line_items": []},
+]
+
+
+class IterRecordsTestCase(TestCase):
+    def test_shapes_at_every_chunk_size(self):
+        shapes = {
+            "array": RECORDS,
+            "nested": {"total": 2, "revenue_schedules": RECORDS, "page": 1},
+        }
+
+        for name, data in shapes.items():
+            for size in (1, 2, 7, 64, 1 << 20):
+                with self.subTest(shape=name, size=size):
+                    self.assertEqual(
+                        list(iter_records(chunked(data, size), "revenue_schedules")),
+                        RECORDS,
+                    )
+
+    def test_single_record(self):
+        self.assertEqual(
+            list(iter_records(chunked(RECORDS[0], 3), "revenue_schedules")),
+            [RECORDS[0]],
+        )
+
+    def test_empty(self):
+        self.assertEqual(list(iter_records([b"[", b" ]"], "usages")), [])
+        self.assertEqual(
+            list(iter_records([b'{"usages": [], "total": 0}'], "usages")), []
+        )
+
+    def test_yields_before_reading_everything(self):
+        def chunks():
+            yield b'[{"id": "A"},'
+            raise AssertionError("Read past the first record.")
+
+        self.assertEqual(next(iter_records(chunks(), "usages")), {"id": "A"})
+
+    def test_projection(self):
+        records = list(
+            iter_records(
+                chunked(RECORDS, 5),
+                "revenue_schedules",
+                fields=("id", "line_items.amount", "missing"),
+            )
+        )
+
+        self.assertEqual(
+            records,
+            [
+                {"id": "RS-1", "line_items": [{"amount": 1}, {"amount": 2}]},
+                {"id": "RS-2", "line_items": []},
+            ],
+        )
+
+    def test_build_projection(self):
+        self.assertEqual(
+            build_projection(("id", "customer.name", "customer", "items.a.b")),
+            {"id": None, "customer": None, "items": {"a": {"b": None}}},
+        )
+
+    def test_malformed(self):
+        for body in (b'[{"id": "A"', b'[{"id": "A}]', b"nope"):
+            with self.subTest(body=body), self.assertRaises(ValueError):
+                list(iter_records([body], "usages"))
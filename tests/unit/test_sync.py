@@ -0,0 +1,70 @@
+from unittest import TestCase
+from tempfile import TemporaryDirectory
+from os import listdir
+from os.path import join
+from datetime import datetime, timezone
+from ordway.sync import (
+    CheckpointStore,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    SyncCheckpoint,
+    parse_timestamp,
+)
+
+
+class FileCheckpointStoreTestCase(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = join(self.directory.name, "checkpoints.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        store = FileCheckpointStore(self.path)
+
+        self.assertIsNone(store.load("customers"))
+
+        store.save(SyncCheckpoint("customers", "2021-01-01", frozenset({"C-1"})))
+        store.save(SyncCheckpoint("plans", "2021-01-02", frozenset()))
+
+        # A new process reads what the previous one saved.
+        store = FileCheckpointStore(self.path)
+
+        self.assertEqual(
+            store.load("customers"),
+            SyncCheckpoint("customers", "2021-01-01", frozenset({"C-1"})),
+        )
+        self.assertEqual(store.load("plans").high_water_mark, "2021-01-02")
+        self.assertEqual(listdir(self.directory.name), ["checkpoints.json"])
+
+
+class MemoryCheckpointStoreTestCase(TestCase):
+    def test_round_trip(self):
+        checkpoint = SyncCheckpoint("customers", "2021-01-01", frozenset())
+        store = MemoryCheckpointStore([checkpoint])
+
+        self.assertEqual(store.load("customers"), checkpoint)
+        self.assertIsNone(store.load("plans"))
+
+
+class ParseTimestampTestCase(TestCase):
+    def test_naive_timestamps_are_utc(self):
+        self.assertEqual(
+            parse_timestamp("2021-01-01T10:00:00"),
+            parse_timestamp("2021-01-01T11:00:00.000+01:00"),
+        )
+        self.assertEqual(
+            parse_timestamp("2021-01-01T10:00:00Z"),
+            datetime(2021, 1, 1, 10, tzinfo=timezone.utc),
+        )
+
+
+class CheckpointStoreTestCase(TestCase):
+    def test_incomplete_store_cannot_be_created(self):
+        class LoadOnlyStore(CheckpointStore):
+            def load(self, collection):
+                return None
+
+        with self.assertRaises(TypeError):
+            LoadOnlyStore()
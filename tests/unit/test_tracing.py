@@ -0,0 +1,202 @@
+from unittest import TestCase, skipUnless
+from tempfile import TemporaryDirectory
+from threading import Thread
+import json
+import os
+from ordway.exceptions import OrdwayClientException
+from ordway.tracing import (
+    DECODE,
+    DOWNLOAD,
+    YIELD,
+    ExportingTracer,
+    FileSpanExporter,
+    InMemorySpanExporter,
+    OpenTelemetryTracer,
+    SpanExporter,
+    Span,
+    Tracer,
+    activate,
+    bind,
+    current_span,
+    timed,
+    traced,
+)
+
+try:
+    import opentelemetry  # pylint: disable=unused-import
+except ImportError:
+    HAS_OPENTELEMETRY = False
+else:
+    HAS_OPENTELEMETRY = True
+
+
+class TestSpan(TestCase):
+    def test_children_share_trace(self):
+        parent = Span("parent")
+        child = Span("child", parent=parent)
+
+        self.assertEqual(child.trace_id, parent.trace_id)
+        self.assertNotEqual(child.span_id, parent.span_id)
+        self.assertEqual(child.to_dict()["parent_id"], parent.span_id)
+
+    def test_phases_add_up(self):
+        span = Span("request")
+
+        span.add_phase(DOWNLOAD, 1.0)
+        span.add_phase(DOWNLOAD, 0.5)
+
+        with span.phase(DECODE):
+            pass
+
+        self.assertEqual(span.phases[DOWNLOAD], 1.5)
+        self.assertIn(DECODE, span.phases)
+
+
+class TestTracer(TestCase):
+    def setUp(self):
+        self.exporter = InMemorySpanExporter()
+        self.tracer = ExportingTracer(self.exporter)
+
+    def test_noop_is_disabled(self):
+        self.assertFalse(Tracer.enabled)
+
+    def test_span_is_active_within_block(self):
+        with self.tracer.span("outer") as outer:
+            self.assertIs(current_span(), outer)
+
+            with self.tracer.span("inner") as inner:
+                self.assertIs(inner.parent, outer)
+
+        self.assertIsNone(current_span())
+        self.assertEqual(
+            [span.name for span in self.exporter.spans], ["inner", "outer"]
+        )
+        self.assertIsNotNone(outer.duration)
+
+    def test_span_records_errors(self):
+        with self.assertRaises(ValueError):
+            with self.tracer.span("failing"):
+                raise ValueError("Oops")
+
+        self.assertEqual(self.exporter.spans[0].error, "ValueError: Oops")
+
+    def test_bind_carries_span_to_other_threads(self):
+        seen = []
+
+        with self.tracer.span("outer") as outer:
+            thread = Thread(target=bind(lambda: seen.append(current_span())))
+            thread.start()
+            thread.join()
+
+        self.assertEqual(seen, [outer])
+
+
+class TestTraced(TestCase):
+    def setUp(self):
+        self.exporter = InMemorySpanExporter()
+        self.tracer = ExportingTracer(self.exporter)
+
+    def test_span_is_only_active_while_producing(self):
+        span = self.tracer.start_span("scan")
+        seen = []
+
+        def produce():
+            for item in range(2):
+                seen.append(current_span())
+
+                yield item
+
+        for _ in traced(self.tracer, span, produce()):
+            self.assertIsNone(current_span())
+
+        self.assertEqual(seen, [span, span])
+        self.assertEqual(span.attributes["ordway.records"], 2)
+        self.assertIn(YIELD, span.phases)
+        self.assertEqual(self.exporter.spans, [span])
+
+    def test_ends_when_caller_stops_early(self):
+        span = self.tracer.start_span("scan")
+        records = traced(self.tracer, span, iter(range(10)))
+
+        next(records)
+        records.close()
+
+        self.assertEqual(self.exporter.spans, [span])
+        self.assertIsNone(span.error)
+
+    def test_records_errors(self):
+        def fail():
+            yield 1
+
+            raise ValueError("Oops")
+
+        span = self.tracer.start_span("scan")
+
+        with self.assertRaises(ValueError):
+            list(traced(self.tracer, span, fail()))
+
+        self.assertEqual(span.error, "ValueError: Oops")
+
+    def test_timed_excludes_nested_phase(self):
+        span = Span("request")
+
+        def download():
+            span.add_phase(DOWNLOAD, 10.0)
+
+            yield b"chunk"
+
+        self.assertEqual(
+            list(timed(span, DECODE, timed(span, "other", download()), DOWNLOAD)),
+            [b"chunk"],
+        )
+        self.assertLess(span.phases[DECODE], 1.0)
+
+
+class TestFileSpanExporter(TestCase):
+    def test_writes_json_lines(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "spans.jsonl")
+            exporter = FileSpanExporter(path)
+            tracer = ExportingTracer(exporter)
+
+            with tracer.span("outer", {"ordway.collection": "customers"}):
+                with tracer.span("inner") as inner:
+                    inner.add_phase(DOWNLOAD, 0.25)
+
+            exporter.close()
+
+            with open(path, encoding="utf-8") as spans:
+                lines = [json.loads(line) for line in spans]
+
+        self.assertEqual([line["name"] for line in lines], ["inner", "outer"])
+        self.assertEqual(lines[0]["parent_id"], lines[1]["span_id"])
+        self.assertEqual(lines[0]["phases"], {"download": 0.25})
+        self.assertEqual(lines[1]["attributes"], {"ordway.collection": "customers"})
+
+
+class TestOpenTelemetryTracer(TestCase):
+    @skipUnless(not HAS_OPENTELEMETRY, "opentelemetry is installed")
+    def test_requires_opentelemetry(self):
+        with self.assertRaises(OrdwayClientException):
+            OpenTelemetryTracer()
+
+    @skipUnless(HAS_OPENTELEMETRY, "opentelemetry isn't installed")
+    def test_reports_spans(self):
+        tracer = OpenTelemetryTracer()
+
+        with tracer.span("outer") as outer:
+            with activate(outer):
+                with tracer.span("inner") as inner:
+                    inner.add_phase(DOWNLOAD, 0.25)
+
+        self.assertIsNotNone(inner.handle)
+
+
+class TestSpanExporter(TestCase):
+    def test_exporter_must_export(self):
+        class ClosingExporter(SpanExporter):
+            def close(self):
+                pass
+
+        with self.assertRaises(TypeError):
+            ClosingExporter()
@@ -1,7 +1,7 @@
 from unittest import TestCase
 from requests import Session
 from datetime import datetime, date, timezone
-from ordway.utils import transform_datetimes
+from ordway.utils import transform_datetimes, parse_datetime
 
 
 class TransformDatetimes(TestCase):
@@ -62,3 +62,23 @@ class TransformDatetimes(TestCase):
         transformed_data = transform_datetimes(None)
 
         self.assertIsNone(transformed_data)
+
+
+class ParseDatetime(TestCase):
+    def test_formats(self):
+        self.assertEqual(parse_datetime("2020-01-02"), datetime(2020, 1, 2))
+        self.assertEqual(
+            parse_datetime("2020-01-02T03:04:05"), datetime(2020, 1, 2, 3, 4, 5)
+        )
+        self.assertEqual(
+            parse_datetime("2020-01-02T03:04:05.250Z"),
+            datetime(2020, 1, 2, 3, 4, 5, 250000, tzinfo=timezone.utc),
+        )
+        self.assertEqual(
+            parse_datetime("2020-01-02T03:04:05-05:00").utcoffset().total_seconds(),
+            -5 * 3600,
+        )
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            parse_datetime("yesterday")
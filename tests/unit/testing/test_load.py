@@ -0,0 +1,60 @@
+from unittest import TestCase
+from threading import Lock
+from ordway.testing import FakeOrdway, run_load
+from ordway.testing.load import percentile
+
+
+class TestPercentile(TestCase):
+    def test_nearest_rank(self):
+        values = [float(value) for value in range(1, 101)]
+
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile(values, 100), 100)
+        self.assertEqual(percentile([3.0], 1), 3)
+        self.assertEqual(percentile([], 50), 0)
+
+
+class TestRunLoad(TestCase):
+    def test_runs_operations_concurrently(self):
+        lock = Lock()
+        seen = []
+
+        def operation(index):
+            with lock:
+                seen.append(index)
+
+            if index % 10 == 0:
+                raise ValueError
+
+        report = run_load(operation, concurrency=4, operations=50)
+
+        self.assertEqual(sorted(seen), list(range(50)))
+        self.assertEqual(report.operations, 50)
+        self.assertEqual(report.errors, {"ValueError": 5})
+        self.assertGreater(report.throughput, 0)
+        self.assertLessEqual(report.p50, report.p95)
+        self.assertLessEqual(report.p95, report.p99)
+
+    def test_requires_a_limit(self):
+        with self.assertRaises(ValueError):
+            run_load(lambda index: None)
+
+    def test_stops_after_duration(self):
+        report = run_load(lambda index: None, concurrency=2, duration=0.05)
+
+        self.assertGreater(report.operations, 0)
+
+    def test_drives_client(self):
+        with FakeOrdway() as server:
+            server.add("customers", [{"id": "C-1"}])
+            client = server.client()
+
+            report = run_load(
+                lambda index: client.customers.get("C-1"),
+                concurrency=4,
+                operations=20,
+            )
+
+        self.assertEqual((report.operations, report.errors), (20, {}))
+        self.assertIn("20 operations", report.format())
@@ -0,0 +1,178 @@
+from unittest import TestCase
+from datetime import datetime, timedelta, timezone
+from ordway.api.exceptions import OrdwayAPIRequestException
+from ordway.testing import FakeOrdway, endpoint_collections
+
+HEADERS = {
+    "X-User-Company": "company",
+    "X-API-Key": "key",
+    "X-User-Token": "token",
+    "X-User-Email": "email",
+}
+
+
+class TestEndpointCollections(TestCase):
+    def test_reads_operations_from_interfaces(self):
+        collections = endpoint_collections()
+
+        self.assertEqual(
+            collections["customers"],
+            {"list", "get", "create", "update", "delete"},
+        )
+        self.assertEqual(collections["invoices"], {"list", "get"})
+        self.assertEqual(collections["journal_entries"], {"create"})
+
+
+class TestFakeOrdway(TestCase):
+    def setUp(self):
+        self.now = datetime(2021, 3, 1, tzinfo=timezone.utc)
+        self.server = FakeOrdway(clock=lambda: self.now)
+
+    def test_requires_credentials(self):
+        status, _, _ = self.server.handle("GET", "/api/v1/customers", {})
+
+        self.assertEqual(status, 401)
+
+    def test_assigns_ids_and_timestamps(self):
+        self.server.add("billing_runs", [{"name": "A"}, {"id": "BR-9", "name": "B"}])
+
+        self.assertEqual(
+            self.server.records("billing_runs"),
+            [
+                {
+                    "id": "BR-00001",
+                    "name": "A",
+                    "created_date": "2021-03-01T00:00:00.000Z",
+                    "updated_date": "2021-03-01T00:00:00.000Z",
+                },
+                {
+                    "id": "BR-9",
+                    "name": "B",
+                    "created_date": "2021-03-01T00:00:00.000Z",
+                    "updated_date": "2021-03-01T00:00:00.000Z",
+                },
+            ],
+        )
+
+    def test_lists_sort_and_filter(self):
+        self.server.add(
+            "customers",
+            [
+                {"id": "C-1", "balance": 10, "updated_date": "2021-01-02T00:00:00Z"},
+                {"id": "C-2", "balance": 5, "updated_date": "2021-01-03T00:00:00Z"},
+                {"id": "C-3", "balance": 20, "updated_date": "2021-01-01T00:00:00Z"},
+            ],
+        )
+
+        _, _, body = self.server.handle(
+            "GET", "/api/v1/customers?sort=balance+desc&size=2&page=1", HEADERS
+        )
+        self.assertEqual([record["id"] for record in body], ["C-3", "C-1"])
+
+        _, _, body = self.server.handle(
+            "GET",
+            "/api/v1/customers?updated_date%3E=2021-01-01T00:00:00.000%2B00:00",
+            HEADERS,
+        )
+        self.assertEqual([record["id"] for record in body], ["C-1", "C-2"])
+
+        _, _, body = self.server.handle(
+            "GET", "/api/v1/customers?balance%3C%3D=10", HEADERS
+        )
+        self.assertEqual([record["id"] for record in body], ["C-1", "C-2"])
+
+    def test_nests_lists(self):
+        self.server.add("usages", [{"id": "U-1"}])
+
+        _, _, body = self.server.handle("GET", "/api/v1/usages", HEADERS)
+
+        self.assertEqual(body["total"], 1)
+        self.assertEqual([record["id"] for record in body["usages"]], ["U-1"])
+
+    def test_only_supports_interface_operations(self):
+        self.server.add("invoices", [{"id": "INV-1"}])
+
+        status, _, _ = self.server.handle("DELETE", "/api/v1/invoices/INV-1", HEADERS)
+        self.assertEqual(status, 405)
+
+        status, _, _ = self.server.handle("GET", "/api/v1/unknown", HEADERS)
+        self.assertEqual(status, 404)
+
+    def test_injected_faults(self):
+        self.server.inject(429, count=2, retry_after=3)
+
+        for _ in range(2):
+            status, headers, _ = self.server.handle("GET", "/api/v1/customers", HEADERS)
+
+            self.assertEqual((status, headers), (429, {"Retry-After": "3"}))
+
+        status, _, _ = self.server.handle("GET", "/api/v1/customers", HEADERS)
+
+        self.assertEqual(status, 200)
+        self.assertEqual(self.server.statuses, {429: 2, 200: 1})
+
+    def test_random_faults(self):
+        server = FakeOrdway(error_rate=1, error_statuses=(502,), seed=1)
+
+        self.assertEqual(server.handle("GET", "/api/v1/customers", HEADERS)[0], 502)
+
+
+class TestFakeOrdwayWithClient(TestCase):
+    def setUp(self):
+        self.server = FakeOrdway().start()
+        self.client = self.server.client()
+
+    def tearDown(self):
+        self.client.session.close()
+        self.server.stop()
+
+    def test_crud(self):
+        customers = self.client.customers
+        created = customers.create({"name": "Acme"})
+
+        self.assertEqual(customers.get(created["id"])["name"], "Acme")
+
+        customers.update(created["id"], {"name": "Acme Inc."})
+
+        self.assertEqual(customers.get(created["id"])["name"], "Acme Inc.")
+
+        customers.delete(created["id"])
+
+        with self.assertRaises(OrdwayAPIRequestException):
+            customers.get(created["id"])
+
+    def test_actions(self):
+        self.server.add("orders", [{"id": "O-1", "status": "Active"}])
+
+        self.client.orders.cancel("O-1", {"status": "Cancelled"})
+
+        self.assertEqual(self.server.records("orders")[0]["status"], "Cancelled")
+
+    def test_all_paginates_nested_lists(self):
+        self.server.add("usages", ({"quantity": index} for index in range(45)))
+
+        self.assertEqual(
+            [record["quantity"] for record in self.client.usages.all(size=20)],
+            list(range(45)),
+        )
+
+    def test_sync(self):
+        start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+        self.server.add(
+            "customers",
+            (
+                {"updated_date": (start + timedelta(hours=index)).isoformat()}
+                for index in range(5)
+            ),
+        )
+
+        self.assertEqual(
+            len(list(self.client.customers.sync(since=start + timedelta(hours=2)))), 3
+        )
+
+    def test_retries_injected_errors(self):
+        self.server.inject(503)
+        self.server.inject(429, retry_after=1)
+
+        self.assertEqual(list(self.client.customers.list(page=1)), [])
+        self.assertEqual(self.server.statuses, {503: 1, 429: 1, 200: 1})